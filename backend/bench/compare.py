@@ -0,0 +1,73 @@
+"""Compare two run_bench.py result files.
+
+    python backend/bench/compare.py baseline.json candidate.json --threshold 0.10
+
+Prints the relative change per scenario and size; exits with status 1 when
+--fail-on-regression is set and any metric got worse by more than the
+threshold.
+"""
+
+import argparse
+import json
+import sys
+
+# (label, getter, higher_is_better)
+METRICS = (
+    ("req/s", lambda result: result.get("throughputRps"), True),
+    ("p50", lambda result: result["latencyMs"].get("p50"), False),
+    ("p95", lambda result: result["latencyMs"].get("p95"), False),
+    ("p99", lambda result: result["latencyMs"].get("p99"), False),
+    ("rss", lambda result: result.get("peakRssBytes"), False),
+)
+
+
+def load_results(path):
+    with open(path) as handle:
+        data = json.load(handle)
+    return data.get("meta", {}), {(item["scenario"], item["workloads"]): item for item in data["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change treated as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    baseline_meta, baseline = load_results(args.baseline)
+    candidate_meta, candidate = load_results(args.candidate)
+    print(f"baseline:  {baseline_meta.get('revision')}  {baseline_meta.get('startedAt')}")
+    print(f"candidate: {candidate_meta.get('revision')}  {candidate_meta.get('startedAt')}")
+    print()
+    print(f"{'scenario':>18} {'size':>6}  " + "  ".join(f"{label:>16}" for label, _, _ in METRICS))
+
+    regressions = []
+    for key in sorted(set(baseline) & set(candidate)):
+        cells = []
+        for label, getter, higher_is_better in METRICS:
+            before, after = getter(baseline[key]), getter(candidate[key])
+            if not before or after is None:
+                cells.append(f"{'n/a':>16}")
+                continue
+            change = (after - before) / before
+            worse = -change if higher_is_better else change
+            marker = "!" if worse > args.threshold else " "
+            if worse > args.threshold:
+                regressions.append((key, label, change))
+            cells.append(f"{change * 100:>+14.1f}%{marker}")
+        errors = candidate[key].get("errors", 0) - baseline[key].get("errors", 0)
+        suffix = f"  errors {errors:+d}" if errors else ""
+        print(f"{key[0]:>18} {key[1]:>6}  " + "  ".join(cells) + suffix)
+
+    missing = sorted(set(baseline) ^ set(candidate))
+    if missing:
+        print(f"\nOnly in one file: {', '.join(f'{scenario}/{size}' for scenario, size in missing)}")
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Stand-in Kubernetes/OpenShift API and Spring actuator servers for benchmarks.
+
+Both servers derive the same synthetic cluster from the shared command-line
+options (sizes, seed, ports), so they can run as separate processes without
+exchanging state:
+
+    python fakes.py api --port 18443 --sizes 10,100
+    python fakes.py actuator --base-port 19000 --ports 64 --sizes 10,100
+
+Namespace ``bench-<size>`` holds ``<size>`` deployments named ``svc-00000``...,
+each with a matching service, ready pods and one configmap. Workload ``i``
+probes port ``base_port + i % ports``, and its actuator answers on
+``/<namespace>/<service>/actuator/env`` (see ACTUATOR_URL_TEMPLATE in the
+backend). Latency jitter and failures are derived from a stable hash of the
+workload, so the same workloads are slow or failing on every run.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import time
+import zlib
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+API_VERSION = "1"
+WATCH_BOOKMARK_SECONDS = 30
+
+
+def add_cluster_arguments(parser):
+    parser.add_argument("--sizes", default="10,100,1000,5000", help="Comma-separated workload counts")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--base-port", type=int, default=19000, help="First actuator port")
+    parser.add_argument("--ports", type=int, default=256, help="Distinct actuator ports (host:port pairs)")
+    parser.add_argument("--replicas", type=int, default=2)
+    parser.add_argument("--configmap-kb", type=int, default=4, help="Approximate size of each configmap")
+    parser.add_argument("--payload-kb", type=int, default=16, help="Approximate size of each /actuator/env body")
+    parser.add_argument("--match-ratio", type=float, default=0.05,
+                        help="Fraction of generated values that contain example.com hosts")
+
+
+def parse_sizes(text):
+    return sorted({int(item) for item in text.split(",") if item.strip()})
+
+
+def namespace_for(size):
+    return f"bench-{size}"
+
+
+def workload_name(index):
+    return f"svc-{index:05d}"
+
+
+def stable_fraction(*parts):
+    """Deterministic value in [0, 1) for a workload, independent of process and hash seed."""
+    return zlib.crc32("/".join(str(part) for part in parts).encode("utf-8")) / 2**32
+
+
+def fake_value(rng, match_ratio):
+    roll = rng.random()
+    if roll < match_ratio:
+        return f"jdbc:postgresql://db-{rng.randrange(50)}.bench.example.com:5432/app"
+    if roll < match_ratio * 3:
+        return f"http://api-{rng.randrange(200)}.internal.svc:8080/v{rng.randrange(1, 4)}"
+    if roll < 0.5:
+        return str(rng.randrange(1, 100000))
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz-_") for _ in range(rng.randrange(6, 40)))
+
+
+def build_configmap_data(rng, target_bytes, match_ratio):
+    yaml_lines = ["spring:", "  application:", "    name: bench"]
+    properties_lines = []
+    xml_children = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        value = fake_value(rng, match_ratio)
+        if index % 3 == 0:
+            line = f"  key{index}: \"{value}\""
+            yaml_lines.append(line)
+        elif index % 3 == 1:
+            line = f"app.settings.key{index}={value}"
+            properties_lines.append(line)
+        else:
+            line = f"  <entry key=\"key{index}\" value=\"{value}\"/>"
+            xml_children.append(line)
+        size += len(line) + 1
+        index += 1
+    return {
+        "application.yml": "\n".join(yaml_lines) + "\n",
+        "application.properties": "\n".join(properties_lines) + "\n",
+        "logback.xml": "<?xml version=\"1.0\"?>\n<configuration>\n" + "\n".join(xml_children) + "\n</configuration>\n",
+    }
+
+
+def build_actuator_payload(rng, target_bytes, match_ratio):
+    sources = []
+    size = 0
+    for source_name in ("systemEnvironment", "applicationConfig: [classpath:/application.yml]", "bootstrapProperties"):
+        properties = {}
+        while size < target_bytes * (len(sources) + 1) / 3:
+            key = f"bench.{source_name[:6].lower()}.property{len(properties)}"
+            value = fake_value(rng, match_ratio)
+            properties[key] = {"value": value}
+            size += len(key) + len(value) + 24
+        sources.append({"name": source_name, "properties": properties})
+    return {"activeProfiles": ["bench"], "propertySources": sources}
+
+
+def list_body(kind, items):
+    return json.dumps({
+        "kind": kind,
+        "apiVersion": "v1",
+        "metadata": {"resourceVersion": API_VERSION},
+        "items": items,
+    }, separators=(",", ":")).encode("utf-8")
+
+
+class Cluster:
+    """Pre-serialized API responses for every benchmark namespace."""
+
+    def __init__(self, args):
+        self.sizes = parse_sizes(args.sizes)
+        self.paths = {}
+        self.pods_by_app = {}
+        rng = random.Random(args.seed)
+        # A few configmap bodies reused round-robin keep startup fast at 5k workloads.
+        configmap_variants = [
+            build_configmap_data(rng, args.configmap_kb * 1024, args.match_ratio) for _ in range(16)
+        ]
+        namespaces = []
+        for size in self.sizes:
+            namespace = namespace_for(size)
+            namespaces.append({"metadata": {"name": namespace, "resourceVersion": API_VERSION}})
+            deployments, services, pods, configmaps = [], [], [], []
+            for index in range(size):
+                name = workload_name(index)
+                port = args.base_port + index % args.ports
+                configmap_name = f"{name}-config"
+                deployment = {
+                    "metadata": {"name": name, "namespace": namespace, "resourceVersion": API_VERSION},
+                    "spec": {
+                        "replicas": args.replicas,
+                        "selector": {"matchLabels": {"app": name}},
+                        "template": {
+                            "metadata": {"labels": {"app": name}},
+                            "spec": {
+                                "containers": [{
+                                    "name": "app",
+                                    "image": f"registry.local/bench/app:{index % 7}",
+                                    "ports": [{"containerPort": port}],
+                                    "readinessProbe": {"httpGet": {"path": "/actuator/health", "port": port}},
+                                    "envFrom": [{"configMapRef": {"name": configmap_name}}],
+                                }],
+                                "volumes": [{"name": "config", "configMap": {"name": configmap_name}}],
+                            },
+                        },
+                    },
+                    "status": {"replicas": args.replicas, "readyReplicas": args.replicas},
+                }
+                service = {
+                    "metadata": {"name": name, "namespace": namespace, "resourceVersion": API_VERSION},
+                    "spec": {"selector": {"app": name}, "ports": [{"name": "http", "port": port}]},
+                }
+                configmap = {
+                    "metadata": {"name": configmap_name, "namespace": namespace, "resourceVersion": API_VERSION},
+                    "data": configmap_variants[index % len(configmap_variants)],
+                }
+                workload_pods = [
+                    {
+                        "metadata": {"name": f"{name}-{replica}", "namespace": namespace, "labels": {"app": name}},
+                        "status": {
+                            "phase": "Running",
+                            "conditions": [{"type": "Ready", "status": "True"}],
+                            "containerStatuses": [{"name": "app", "ready": True, "restartCount": index % 3}],
+                        },
+                    }
+                    for replica in range(args.replicas)
+                ]
+                deployments.append(deployment)
+                services.append(service)
+                configmaps.append(configmap)
+                pods.extend(workload_pods)
+                self.pods_by_app[(namespace, name)] = list_body("PodList", workload_pods)
+                self.paths[f"/apis/apps/v1/namespaces/{namespace}/deployments/{name}"] = json.dumps(deployment).encode()
+                self.paths[f"/api/v1/namespaces/{namespace}/services/{name}"] = json.dumps(service).encode()
+                self.paths[f"/api/v1/namespaces/{namespace}/configmaps/{configmap_name}"] = json.dumps(configmap).encode()
+            self.paths[f"/apis/apps/v1/namespaces/{namespace}/deployments"] = list_body("DeploymentList", deployments)
+            self.paths[f"/apis/apps.openshift.io/v1/namespaces/{namespace}/deploymentconfigs"] = list_body(
+                "DeploymentConfigList", []
+            )
+            self.paths[f"/api/v1/namespaces/{namespace}/services"] = list_body("ServiceList", services)
+            self.paths[f"/api/v1/namespaces/{namespace}/pods"] = list_body("PodList", pods)
+            self.paths[f"/api/v1/namespaces/{namespace}/configmaps"] = list_body("ConfigMapList", configmaps)
+        self.paths["/apis/project.openshift.io/v1/projects"] = list_body("ProjectList", namespaces)
+        self.paths["/api/v1/namespaces"] = list_body("NamespaceList", namespaces)
+
+
+def not_found(path):
+    body = {"kind": "Status", "status": "Failure", "reason": "NotFound", "code": 404,
+            "message": f"the server could not find the requested resource {path}"}
+    return Response(json.dumps(body), status_code=404, media_type="application/json")
+
+
+def api_app(cluster, latency_seconds):
+    async def watch_stream(timeout_seconds):
+        bookmark = (json.dumps({"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": API_VERSION}}}) + "\n").encode()
+        # The data never changes, so a watch only sends bookmarks, as often as a
+        # real API server does, until it times out.
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            yield bookmark
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(WATCH_BOOKMARK_SECONDS, remaining))
+
+    async def handle(request):
+        path = request.url.path
+        if request.query_params.get("watch") in ("1", "true"):
+            if path not in cluster.paths:
+                return not_found(path)
+            timeout_seconds = min(int(request.query_params.get("timeoutSeconds", "300")), 300)
+            return StreamingResponse(watch_stream(timeout_seconds), media_type="application/json")
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        selector = request.query_params.get("labelSelector")
+        if selector and path.endswith("/pods"):
+            labels = dict(part.split("=", 1) for part in selector.split(",") if "=" in part)
+            namespace = path.split("/")[4]
+            body = cluster.pods_by_app.get((namespace, labels.get("app")))
+            return Response(body or list_body("PodList", []), media_type="application/json")
+        body = cluster.paths.get(path)
+        if body is None:
+            return not_found(path)
+        return Response(body, media_type="application/json")
+
+    return Starlette(routes=[Route("/{path:path}", handle, methods=["GET"])])
+
+
+def actuator_app(args):
+    rng = random.Random(args.seed + 1)
+    payloads = [
+        json.dumps(build_actuator_payload(rng, args.payload_kb * 1024, args.match_ratio)).encode()
+        for _ in range(16)
+    ]
+    latency = args.latency_ms / 1000.0
+
+    async def handle(request):
+        namespace = request.path_params["namespace"]
+        service = request.path_params["service"]
+        roll = stable_fraction(args.seed, namespace, service, "failure")
+        if roll < args.error_rate:
+            return Response(json.dumps({"error": "Internal Server Error"}), status_code=500,
+                            media_type="application/json")
+        if roll < args.error_rate + args.timeout_rate:
+            await asyncio.sleep(args.hang_seconds)
+        elif latency:
+            jitter = 1 + args.jitter * (2 * stable_fraction(args.seed, namespace, service, "latency") - 1)
+            await asyncio.sleep(latency * jitter)
+        index = zlib.crc32(f"{namespace}/{service}".encode()) % len(payloads)
+        return Response(payloads[index], media_type="application/json")
+
+    return Starlette(routes=[Route("/{namespace}/{service}/actuator/env", handle, methods=["GET"])])
+
+
+def bind_socket(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", port))
+    sock.listen(1024)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(app, sockets):
+    config = uvicorn.Config(app, log_level="warning", lifespan="off", access_log=False)
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    api = commands.add_parser("api", help="Fake Kubernetes/OpenShift API server")
+    add_cluster_arguments(api)
+    api.add_argument("--port", type=int, default=18443)
+    api.add_argument("--latency-ms", type=float, default=5.0, help="Added to every non-watch request")
+    actuator = commands.add_parser("actuator", help="Fake Spring /actuator/env servers")
+    add_cluster_arguments(actuator)
+    actuator.add_argument("--latency-ms", type=float, default=50.0)
+    actuator.add_argument("--jitter", type=float, default=0.5, help="Latency varies by +/- this fraction")
+    actuator.add_argument("--error-rate", type=float, default=0.0, help="Fraction of workloads answering HTTP 500")
+    actuator.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of workloads that hang")
+    actuator.add_argument("--hang-seconds", type=float, default=30.0)
+    args = parser.parse_args()
+
+    if args.command == "api":
+        serve(api_app(Cluster(args), args.latency_ms / 1000.0), [bind_socket(args.port)])
+    else:
+        ports = min(args.ports, max(parse_sizes(args.sizes)))
+        serve(actuator_app(args), [bind_socket(args.base_port + offset) for offset in range(ports)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""Microbenchmarks and fuzzing for the configmap parsers and matchers.
+
+Times the format parsers, walk_config_tree, extract_config_candidates,
+extract_config_hostnames and find_configmap_matches from
+helm/files/backend-app.py over a generated corpus of realistic and
+adversarial configmap values:
+
+    python backend/bench/parsers.py                       # benchmark + threshold check
+    python backend/bench/parsers.py --update-thresholds   # re-baseline after an intended change
+    python backend/bench/parsers.py --fuzz 20000          # mutation fuzzing, no timing
+    python backend/bench/parsers.py --write-corpus /tmp/corpus
+
+Timings are divided by a fixed calibration loop measured in the same run, so
+parser_thresholds.json holds machine-independent cost ratios. A case fails
+the check when its ratio exceeds the recorded limit.
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import random
+import re
+import string
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_APP = os.path.join(os.path.dirname(os.path.dirname(BENCH_DIR)), "helm", "files", "backend-app.py")
+THRESHOLDS_PATH = os.path.join(BENCH_DIR, "parser_thresholds.json")
+PATTERNS = [r"example\.com", r"^jdbc:", r"internal\.svc"]
+
+
+def load_backend():
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("SPRING_INDEX_ENABLED", "false")
+    spec = importlib.util.spec_from_file_location("backend_app", BACKEND_APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_word(rng, low=4, high=16):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(low, high)))
+
+
+def random_value(rng):
+    roll = rng.random()
+    if roll < 0.1:
+        return f"jdbc:postgresql://db-{rng.randrange(40)}.prod.example.com:5432/{random_word(rng)}"
+    if roll < 0.2:
+        return f"https://{random_word(rng)}.internal.svc:8443/{random_word(rng)}?timeout={rng.randrange(100)}"
+    if roll < 0.3:
+        return ", ".join(f"{random_word(rng)}.example.org:{rng.randrange(1, 65535)}" for _ in range(rng.randint(2, 6)))
+    if roll < 0.5:
+        return str(rng.randrange(10**6))
+    return random_word(rng, 6, 48)
+
+
+def yaml_document(rng, target_bytes):
+    lines = []
+    size = 0
+    while size < target_bytes:
+        section = random_word(rng)
+        lines.append(f"{section}:")
+        for _ in range(rng.randint(3, 12)):
+            child = random_word(rng)
+            if rng.random() < 0.3:
+                lines.append(f"  {child}:")
+                for _ in range(rng.randint(2, 6)):
+                    lines.append(f"    - \"{random_value(rng)}\"")
+            else:
+                lines.append(f"  {child}: \"{random_value(rng)}\"")
+        size = sum(len(line) + 1 for line in lines)
+    return "\n".join(lines) + "\n"
+
+
+def nested_json(rng, depth):
+    # Built as text: json.dumps itself recurses and would fail on the deep cases.
+    opening = "".join(f'{{"value{level}": {json.dumps(random_value(rng))}, "child": ' for level in range(depth))
+    return opening + json.dumps(random_value(rng)) + "}" * depth
+
+
+def wide_json(rng, keys):
+    return json.dumps({f"{random_word(rng)}.{index}": random_value(rng) for index in range(keys)})
+
+
+def properties_document(rng, target_bytes, separator="="):
+    lines = []
+    size = 0
+    while size < target_bytes:
+        if rng.random() < 0.05:
+            line = f"# {random_word(rng, 10, 60)}"
+        else:
+            line = f"{random_word(rng)}.{random_word(rng)}.{random_word(rng)}{separator}{random_value(rng)}"
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def ini_document(rng, target_bytes):
+    lines = []
+    size = 0
+    while size < target_bytes:
+        lines.append(f"[{random_word(rng)}]")
+        for _ in range(rng.randint(3, 15)):
+            lines.append(f"{random_word(rng)} = {random_value(rng)}")
+        size = sum(len(line) + 1 for line in lines)
+    return "\n".join(lines) + "\n"
+
+
+def js_document(rng, target_bytes):
+    lines = ["// generated", "window.__CONFIG__ = window.__CONFIG__ || {};"]
+    size = 0
+    while size < target_bytes:
+        line = f"window.__CONFIG__.{random_word(rng)} = \"{random_value(rng)}\";"
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def xml_document(rng, children, depth=1):
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>', "<configuration>"]
+    for index in range(children):
+        value = random_value(rng).replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;")
+        inner = f"<value>{value}</value>"
+        for _ in range(depth - 1):
+            inner = f"<group>{inner}</group>"
+        parts.append(f'  <property name="{random_word(rng)}.{index}" source="{value}">{inner}</property>')
+    parts.append("</configuration>")
+    return "\n".join(parts) + "\n"
+
+
+def build_corpus(seed=7):
+    """(name, key, text) cases; keys carry the extension the backend sniffs formats from."""
+    rng = random.Random(seed)
+    # Values longer than the backend's CONFIG_PARSE_MAX_LEN (200000) are never parsed.
+    almost_max = 190 * 1024
+    cases = [
+        ("yaml-small", "application.yml", yaml_document(rng, 2 * 1024)),
+        ("yaml-large", "application.yml", yaml_document(rng, almost_max)),
+        ("json-nested-50", "settings.json", nested_json(rng, 50)),
+        ("json-nested-900", "settings.json", nested_json(rng, 900)),
+        ("json-wide-3000", "settings.json", wide_json(rng, 3000)),
+        ("properties-small", "application.properties", properties_document(rng, 2 * 1024)),
+        ("properties-200kb", "application.properties", properties_document(rng, almost_max)),
+        ("conf-colon-50kb", "nginx.conf", properties_document(rng, 50 * 1024, separator=": ")),
+        ("ini-50kb", "service.ini", ini_document(rng, 50 * 1024)),
+        ("js-50kb", "config.js", js_document(rng, 50 * 1024)),
+        ("xml-children-1300", "logback.xml", xml_document(rng, 1300)),
+        ("xml-nested-children", "logback.xml", xml_document(rng, 150, depth=20)),
+        ("xml-deep-5000", "logback.xml", "<a>" * 5000 + "db.example.com" + "</a>" * 5000),
+        # Adversarial inputs for the candidate and hostname regexes.
+        ("quotes-unbalanced", "notes.txt", '"' + "a'b\\\"" * 20000),
+        ("quotes-backslashes", "notes.txt", '"' + "\\" * 100001),
+        ("quotes-nested", "notes.txt", "".join(f"\"k{i}='http://h{i}.example.com/\"x\"'\" " for i in range(5000))),
+        ("urls-dense", "notes.txt", " ".join(f"http://host-{i}.example.com:{i}/p?q={i}" for i in range(4500))),
+        ("unterminated-quote", "notes.txt", "'" + "x" * 150000),
+        ("hostnames-list", "hosts.txt", ",".join(f"node-{i}.cluster.example.com:9092" for i in range(5000))),
+        ("no-extension-json", "payload", "[" + ",".join(json.dumps({"u": random_value(rng)}) for _ in range(3000)) + "]"),
+    ]
+    return cases
+
+
+def configmap_for(cases):
+    return {"metadata": {"name": "bench"}, "data": {key: text for _, key, text in cases}}
+
+
+def calibrate():
+    """Seconds for a fixed pure-Python workload; all timings are reported relative to it."""
+    lines = [f"key.name{index} = value-{index}" for index in range(5000)]
+
+    def workload():
+        parsed = {}
+        for line in lines:
+            key, value = line.split("=", 1)
+            parsed[key.strip()] = value.strip()
+        return parsed
+
+    return measure(workload)
+
+
+def measure(function, min_sample_seconds=0.02, samples=7):
+    """Best seconds per call over `samples` timed batches of at least min_sample_seconds.
+
+    As with timeit, the minimum is the least noisy estimate and the garbage
+    collector is paused, so results do not depend on unrelated garbage.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return measure_batches(function, min_sample_seconds, samples)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure_batches(function, min_sample_seconds, samples):
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_seconds or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(int(min_sample_seconds / elapsed) + 1, 1 << 10))
+    timings = [elapsed / loops]
+    for _ in range(samples - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - started) / loops)
+    return min(timings)
+
+
+def benchmark_targets(app, cases):
+    """(benchmark id, callable) pairs covering every target function on the cases it sees in production."""
+    matcher = app.ConfigPatternMatcher(PATTERNS)
+    targets = []
+    for name, key, text in cases:
+        stripped = text.strip()
+        config_format = app.sniff_config_format(key, stripped)
+        if config_format is not None:
+            parser = app.CONFIG_PARSERS[config_format]
+            targets.append((f"parse_config_{config_format}/{name}", lambda parser=parser, stripped=stripped: parser(stripped)))
+            _, parsed = app.parse_config_value(key, stripped)
+            if parsed is not None:
+                targets.append((f"walk_config_tree/{name}", lambda parsed=parsed: app.walk_config_tree(parsed)))
+        targets.append((f"extract_config_candidates/{name}", lambda text=text: app.extract_config_candidates(text)))
+        tokens = app.extract_config_candidates(text)[:2000] or [text[:4096]]
+        # The uncached function: the LRU in front of it would otherwise hide the cost after one loop.
+        targets.append((
+            f"extract_config_hostnames/{name}",
+            lambda tokens=tokens: [app._extract_config_hostnames(token) for token in tokens],
+        ))
+        configmap = configmap_for([(name, key, text)])
+        targets.append((f"find_configmap_matches/{name}", lambda configmap=configmap: app.find_configmap_matches(configmap, matcher)))
+    configmap = configmap_for(cases)
+    targets.append(("find_configmap_matches/all-cases", lambda: app.find_configmap_matches(configmap, matcher)))
+    return targets
+
+
+def run_benchmarks(app, cases, selected):
+    # Parse results are cached by content hash in the backend; measure the uncached path.
+    app._parsed_config_cache = None
+    unit_before = calibrate()
+    seconds_by_id = {}
+    for bench_id, function in benchmark_targets(app, cases):
+        if selected and not selected.search(bench_id):
+            continue
+        seconds_by_id[bench_id] = measure(function)
+        print(f"{bench_id:<60} {seconds_by_id[bench_id] * 1e3:>10.3f} ms", flush=True)
+    # Calibrating on both sides of the run evens out frequency scaling and noisy neighbours.
+    unit = (unit_before + calibrate()) / 2
+    print(f"calibration unit {unit * 1e3:.3f} ms")
+    results = {
+        bench_id: {"seconds": seconds, "ratio": seconds / unit}
+        for bench_id, seconds in seconds_by_id.items()
+    }
+    return unit, results
+
+
+def check_thresholds(results, thresholds):
+    failures = []
+    for bench_id, result in results.items():
+        limit = thresholds.get(bench_id)
+        if limit is None:
+            print(f"no threshold for {bench_id}; run with --update-thresholds", file=sys.stderr)
+            continue
+        if result["ratio"] > limit:
+            failures.append((bench_id, result["ratio"], limit))
+    return failures
+
+
+MUTATION_TOKENS = ['"', "'", "\\", "{", "}", "[", "]", "<", ">", "=", ":", "\n", "://", "\x00", "﻿", "&#", "]]>"]
+
+
+def mutate(rng, text):
+    data = list(text[:20000]) if len(text) > 20000 and rng.random() < 0.8 else list(text)
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        position = rng.randrange(len(data) + 1)
+        if roll < 0.4:
+            data[position:position] = list(rng.choice(MUTATION_TOKENS) * rng.randint(1, 64))
+        elif roll < 0.6 and data:
+            del data[position:position + rng.randint(1, 256)]
+        elif roll < 0.8 and data:
+            chunk = data[position:position + rng.randint(1, 512)]
+            data[position:position] = chunk * rng.randint(1, 8)
+        elif data:
+            data = data[:position]
+    return "".join(data)
+
+
+def fuzz(app, cases, iterations, seed, slow_seconds, crash_dir):
+    """Mutates corpus cases and feeds them through every target; reports exceptions and slow inputs."""
+    rng = random.Random(seed)
+    matcher = app.ConfigPatternMatcher(PATTERNS)
+    app._parsed_config_cache = None
+    problems = 0
+    for iteration in range(iterations):
+        name, key, text = rng.choice(cases)
+        mutated = mutate(rng, text)
+        stripped = mutated.strip()
+        steps = [(f"parse_config_{fmt}", lambda parser=parser: parser(stripped)) for fmt, parser in app.CONFIG_PARSERS.items()]
+        steps.append(("parse_config_value", lambda: app.parse_config_value(key, stripped)))
+        steps.append(("walk_config_tree", lambda: app.walk_config_tree(app.parse_config_value(key, stripped)[1])))
+        steps.append(("extract_config_candidates", lambda: app.extract_config_candidates(mutated)))
+        steps.append(("extract_config_hostnames", lambda: app._extract_config_hostnames(mutated[:4096])))
+        steps.append(("find_configmap_matches", lambda: app.find_configmap_matches(configmap_for([(name, key, mutated)]), matcher)))
+        for step_name, step in steps:
+            started = time.perf_counter()
+            error = None
+            try:
+                step()
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"[:300]
+            elapsed = time.perf_counter() - started
+            if error is None and elapsed <= slow_seconds:
+                continue
+            problems += 1
+            reason = error or f"slow: {elapsed:.2f}s"
+            print(f"[{iteration}] {step_name} on mutated {name}: {reason}", flush=True)
+            if crash_dir:
+                os.makedirs(crash_dir, exist_ok=True)
+                path = os.path.join(crash_dir, f"{iteration:06d}-{step_name}-{key}")
+                with open(path, "w", encoding="utf-8", errors="surrogatepass") as handle:
+                    handle.write(mutated)
+        if iteration and iteration % 1000 == 0:
+            print(f"{iteration} inputs, {problems} problems", flush=True)
+    print(f"{iterations} inputs, {problems} problems")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Configmap parser microbenchmarks and fuzzing")
+    parser.add_argument("--filter", help="Only run benchmark ids matching this regex")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help="Record current ratios times --headroom as the new limits")
+    parser.add_argument("--headroom", type=float, default=2.5,
+                        help="Limit = ratio x headroom; generous because shared CI machines are noisy")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--fuzz", type=int, default=0, metavar="N", help="Run N fuzz inputs instead of benchmarks")
+    parser.add_argument("--slow-seconds", type=float, default=1.0, help="Fuzz: flag single calls slower than this")
+    parser.add_argument("--crash-dir", help="Fuzz: save problem inputs here")
+    parser.add_argument("--write-corpus", metavar="DIR", help="Write the generated corpus to DIR and exit")
+    args = parser.parse_args()
+
+    cases = build_corpus(args.seed)
+    if args.write_corpus:
+        os.makedirs(args.write_corpus, exist_ok=True)
+        for name, key, text in cases:
+            with open(os.path.join(args.write_corpus, f"{name}--{key}"), "w", encoding="utf-8") as handle:
+                handle.write(text)
+        print(f"Wrote {len(cases)} files to {args.write_corpus}")
+        return
+
+    app = load_backend()
+    if args.fuzz:
+        sys.exit(1 if fuzz(app, cases, args.fuzz, args.seed, args.slow_seconds, args.crash_dir) else 0)
+
+    selected = re.compile(args.filter) if args.filter else None
+    unit, results = run_benchmarks(app, cases, selected)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"calibrationSeconds": unit, "results": results}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+    thresholds = {}
+    if os.path.exists(THRESHOLDS_PATH):
+        with open(THRESHOLDS_PATH) as handle:
+            thresholds = json.load(handle)
+    if args.update_thresholds:
+        # The floor keeps near-free cases from failing on timer resolution.
+        thresholds.update({
+            bench_id: max(round(result["ratio"] * args.headroom, 3), 0.01) for bench_id, result in results.items()
+        })
+        with open(THRESHOLDS_PATH, "w") as handle:
+            json.dump(thresholds, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"Updated {THRESHOLDS_PATH}")
+        return
+    for bench_id, result in results.items():
+        limit = thresholds.get(bench_id)
+        print(f"{bench_id:<60} {result['ratio']:>10.2f}x  limit {limit if limit is not None else '-':>8}")
+    failures = check_thresholds(results, thresholds)
+    for bench_id, ratio, limit in failures:
+        print(f"REGRESSION {bench_id}: {ratio:.2f}x > limit {limit:.2f}x", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""Benchmark the dashboard backend against fake API and actuator servers.
+
+Starts fakes.py (API + actuators), runs helm/files/backend-app.py under
+uvicorn, drives the report, configmap report, rollout-status, single
+workload config and CSV endpoints for each namespace size, and writes throughput, latency
+percentiles and the backend's peak RSS as JSON:
+
+    python backend/bench/run_bench.py --sizes 10,100,1000 --output results.json
+    python backend/bench/compare.py baseline.json results.json
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+import fakes
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BENCH_DIR))
+BACKEND_APP = os.path.join(REPO_ROOT, "helm", "files", "backend-app.py")
+SCENARIOS = ("report", "configmaps-report", "rollout-status", "config", "csv")
+# Scenarios that hit one random workload per request rather than a whole namespace.
+PER_WORKLOAD_SCENARIOS = ("rollout-status", "config")
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def process_tree_rss(pid):
+    """Resident set size in bytes of a process and all of its descendants (Linux /proc)."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as handle:
+                for line in handle:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            with open(f"/proc/{current}/task/{current}/children") as handle:
+                pending.extend(int(child) for child in handle.read().split())
+        except (FileNotFoundError, ProcessLookupError, ValueError):
+            continue
+    return total
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid, interval=0.05):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def reset(self):
+        self.peak = process_tree_rss(self.pid)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, process_tree_rss(self.pid))
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def wait_for(url, process, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url}: process exited with {process.returncode}")
+        try:
+            httpx.get(url, timeout=2)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url}: not ready after {timeout}s")
+
+
+def cluster_arguments(args):
+    return [
+        "--sizes", args.sizes,
+        "--seed", str(args.seed),
+        "--base-port", str(args.actuator_base_port),
+        "--ports", str(args.actuator_ports),
+        "--configmap-kb", str(args.configmap_kb),
+        "--payload-kb", str(args.payload_kb),
+    ]
+
+
+def start_processes(args, workdir):
+    fakes_script = os.path.join(BENCH_DIR, "fakes.py")
+    processes = []
+    api = subprocess.Popen([
+        sys.executable, fakes_script, "api", *cluster_arguments(args),
+        "--port", str(args.api_port), "--latency-ms", str(args.api_latency_ms),
+    ])
+    processes.append(api)
+    actuator = subprocess.Popen([
+        sys.executable, fakes_script, "actuator", *cluster_arguments(args),
+        "--latency-ms", str(args.actuator_latency_ms),
+        "--jitter", str(args.actuator_jitter),
+        "--error-rate", str(args.actuator_error_rate),
+        "--timeout-rate", str(args.actuator_timeout_rate),
+        "--hang-seconds", str(args.actuator_read_timeout * 3),
+    ])
+    processes.append(actuator)
+
+    shutil.copy(BACKEND_APP, os.path.join(workdir, "app.py"))
+    env = dict(os.environ)
+    env.update({
+        "KUBERNETES_API_SERVER": f"http://127.0.0.1:{args.api_port}",
+        "KUBERNETES_TOKEN": "bench",
+        "ACTUATOR_URL_TEMPLATE": "http://127.0.0.1:{port}/{namespace}/{service}/actuator/env",
+        "ACTUATOR_READ_TIMEOUT_SECONDS": str(args.actuator_read_timeout),
+        "CACHE_TTL_SECONDS": str(args.cache_ttl),
+        "SPRING_INDEX_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+        "LOCAL_CACHE_PATH": os.path.join(workdir, "cache.db"),
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(workdir, "prometheus"),
+    })
+    for item in args.backend_env:
+        key, _, value = item.partition("=")
+        env[key] = value
+    backend = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app:app",
+            "--app-dir", workdir,
+            "--host", "127.0.0.1",
+            "--port", str(args.backend_port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+            "--no-access-log",
+        ],
+        cwd=workdir,
+        env=env,
+    )
+    processes.append(backend)
+    wait_for(f"http://127.0.0.1:{args.api_port}/apis/project.openshift.io/v1/projects", api)
+    wait_for(f"http://127.0.0.1:{args.actuator_base_port}/bench-0/x/actuator/env", actuator)
+    wait_for(f"http://127.0.0.1:{args.backend_port}/api/health", backend)
+    return processes, backend
+
+
+def stop_processes(processes):
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def scenario_requests(scenario, namespace, size, args, rng):
+    if scenario == "report":
+        params = {"pattern": args.pattern, "source": "live"}
+        return [(f"/api/config/{namespace}/report", params)] * args.iterations
+    if scenario == "configmaps-report":
+        return [(f"/api/config/{namespace}/configmaps/report", {"pattern": args.pattern})] * args.iterations
+    if scenario == "csv":
+        return [(f"/api/config/{namespace}/report.csv", {"pattern": args.pattern})] * args.iterations
+    if scenario == "config":
+        return [
+            (f"/api/config/{namespace}/{fakes.workload_name(rng.randrange(size))}", {})
+            for _ in range(args.config_requests)
+        ]
+    return [
+        (
+            f"/api/config/{namespace}/{fakes.workload_name(rng.randrange(size))}/rollout-status",
+            {"workloadKind": "deployment"},
+        )
+        for _ in range(args.rollout_requests)
+    ]
+
+
+async def drive(client, requests, concurrency):
+    latencies = []
+    errors = 0
+    queue = list(reversed(requests))
+
+    async def worker():
+        nonlocal errors
+        while queue:
+            path, params = queue.pop()
+            started = time.perf_counter()
+            try:
+                async with client.stream("GET", path, params=params) as response:
+                    async for _ in response.aiter_bytes():
+                        pass
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def run_scenarios(args, sampler):
+    results = []
+    rng = random.Random(args.seed)
+    timeout = httpx.Timeout(args.request_timeout, connect=10.0)
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.rollout_concurrency))
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{args.backend_port}", timeout=timeout, limits=limits
+    ) as client:
+        for size in fakes.parse_sizes(args.sizes):
+            namespace = fakes.namespace_for(size)
+            for scenario in args.scenarios.split(","):
+                requests = scenario_requests(scenario, namespace, size, args, rng)
+                concurrency = args.rollout_concurrency if scenario in PER_WORKLOAD_SCENARIOS else args.concurrency
+                # One unmeasured request warms workers, pools and informers.
+                await drive(client, requests[:1], 1)
+                sampler.reset()
+                latencies, errors, elapsed = await drive(client, requests, concurrency)
+                latencies.sort()
+                result = {
+                    "scenario": scenario,
+                    "workloads": size,
+                    "requests": len(requests),
+                    "errors": errors,
+                    "concurrency": concurrency,
+                    "elapsedSeconds": round(elapsed, 4),
+                    "throughputRps": round(len(latencies) / elapsed, 4) if elapsed else None,
+                    "latencyMs": {
+                        name: round(value * 1000, 3) if value is not None else None
+                        for name, value in (
+                            ("p50", percentile(latencies, 0.50)),
+                            ("p95", percentile(latencies, 0.95)),
+                            ("p99", percentile(latencies, 0.99)),
+                            ("max", latencies[-1] if latencies else None),
+                            ("mean", sum(latencies) / len(latencies) if latencies else None),
+                        )
+                    },
+                    "peakRssBytes": sampler.peak,
+                }
+                if scenario not in PER_WORKLOAD_SCENARIOS:
+                    result["workloadsPerSecond"] = round(len(latencies) * size / elapsed, 2) if elapsed else None
+                results.append(result)
+                print(
+                    f"{scenario:>18} {size:>6} workloads  {result['throughputRps']:>9} req/s  "
+                    f"p50={result['latencyMs']['p50']}ms p95={result['latencyMs']['p95']}ms "
+                    f"p99={result['latencyMs']['p99']}ms errors={errors} rss={sampler.peak / 2**20:.0f}MiB",
+                    flush=True,
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend benchmark against fake API and actuator servers")
+    parser.add_argument("--sizes", default="10,100,1000,5000", help="Comma-separated workload counts")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--pattern", default=r"example\.com")
+    parser.add_argument("--iterations", type=int, default=5, help="Requests per report/CSV scenario")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent report/CSV requests")
+    parser.add_argument("--rollout-requests", type=int, default=500)
+    parser.add_argument("--rollout-concurrency", type=int, default=32,
+                        help="Concurrent rollout-status and config requests")
+    parser.add_argument("--config-requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4, help="Backend uvicorn workers")
+    parser.add_argument("--cache-ttl", type=int, default=0,
+                        help="Backend CACHE_TTL_SECONDS; 0 makes every report fetch every actuator")
+    parser.add_argument("--backend-env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra backend environment, e.g. KUBE_INFORMER_ENABLED=true")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--api-port", type=int, default=18443)
+    parser.add_argument("--api-latency-ms", type=float, default=5.0)
+    parser.add_argument("--backend-port", type=int, default=18080)
+    parser.add_argument("--actuator-base-port", type=int, default=19000)
+    parser.add_argument("--actuator-ports", type=int, default=256)
+    parser.add_argument("--actuator-latency-ms", type=float, default=50.0)
+    parser.add_argument("--actuator-jitter", type=float, default=0.5)
+    parser.add_argument("--actuator-error-rate", type=float, default=0.0)
+    parser.add_argument("--actuator-timeout-rate", type=float, default=0.0)
+    parser.add_argument("--actuator-read-timeout", type=float, default=2.0)
+    parser.add_argument("--configmap-kb", type=int, default=4)
+    parser.add_argument("--payload-kb", type=int, default=16)
+    parser.add_argument("--request-timeout", type=float, default=900.0)
+    parser.add_argument("--output", default="bench-results.json")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    workdir = tempfile.mkdtemp(prefix="dashboard-bench-")
+    processes = []
+    try:
+        processes, backend = start_processes(args, workdir)
+        sampler = RssSampler(backend.pid)
+        sampler.start()
+        started_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        results = asyncio.run(run_scenarios(args, sampler))
+        sampler.stopped.set()
+    finally:
+        stop_processes(processes)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = {
+        "meta": {
+            "revision": git_revision(),
+            "startedAt": started_at,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "options": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(output, handle, indent=2)
+        handle.write("\n")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2032,23 +2032,93 @@ async function runSpringConfigReport() {
     setReportPostRunVisible(true);
 }
 
+const REPORT_STREAM_RENDER_INTERVAL_MS = 1000;
+
+async function readReportStream(url, onFrame) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        const errorData = await response.json().catch(() => ({}));
+        throw new Error(errorData.detail || 'Failed to fetch report');
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+        let newline = buffer.indexOf('\n');
+        while (newline !== -1) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line) {
+                onFrame(JSON.parse(line));
+            }
+            newline = buffer.indexOf('\n');
+        }
+    }
+    const rest = buffer.trim();
+    if (rest) {
+        onFrame(JSON.parse(rest));
+    }
+}
+
+function appendReportFrame(data, frame) {
+    if (frame.matched) {
+        data.matched.push(frame.matched);
+    }
+    if (frame.error) {
+        data.errors.push(frame.error);
+    }
+}
+
+function describeReportSource(frame) {
+    if (!frame || frame.dataSource !== 'index') {
+        return '';
+    }
+    return ` (from index, ${frame.indexAgeSeconds || 0}s old)`;
+}
+
+function sortReportData(data) {
+    const byName = (a, b) => (a.workloadName || '').localeCompare(b.workloadName || '');
+    data.matched.sort(byName);
+    data.errors.sort(byName);
+    return data;
+}
+
 async function runSingleNamespaceReport(namespace, query) {
     setReportStatus(`Running report for ${namespace}...`, 'info');
 
+    const data = { namespace, matched: [], errors: [] };
+    let lastRender = 0;
+    let sourceNote = '';
     try {
-        const response = await fetchWithRetry(
-            `${API_BASE_URL}/config/${namespace}/report?${query.toString()}`,
-        );
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({}));
-            throw new Error(errorData.detail || 'Failed to fetch report');
-        }
-        const data = await response.json();
-        if (!data.namespace) {
-            data.namespace = namespace;
-        }
-        const matchedCount = (data.matched || []).length;
-        setReportStatus(`Found ${matchedCount} application(s) with matching entries in ${namespace}.`, 'success');
+        await readReportStream(`${API_BASE_URL}/config/${namespace}/report/stream?${query.toString()}`, frame => {
+            if (frame.type === 'start') {
+                sourceNote = describeReportSource(frame);
+                Object.assign(data, {
+                    pattern: frame.pattern,
+                    caseInsensitive: frame.caseInsensitive,
+                    searchIn: frame.searchIn,
+                    totalWorkloads: frame.totalWorkloads,
+                });
+                return;
+            }
+            if (frame.type !== 'workload') {
+                return;
+            }
+            appendReportFrame(data, frame);
+            setReportStatus(`Processed ${frame.completed}/${frame.total} workloads in ${namespace}...`, 'info');
+            if (frame.matched && Date.now() - lastRender >= REPORT_STREAM_RENDER_INTERVAL_MS) {
+                lastRender = Date.now();
+                renderReportResults(sortReportData(data));
+            }
+        });
+        sortReportData(data);
+        const matchedCount = data.matched.length;
+        setReportStatus(`Found ${matchedCount} application(s) with matching entries in ${namespace}${sourceNote}.`, 'success');
         renderReportResults(data);
         const signature = lastReportHistorySignature
             || buildHistorySignature(buildHistoryEntryFromSelection(getSelectedReportNamespaces()));
@@ -2068,44 +2138,57 @@ async function runMultiNamespaceReport(targetNamespaces, query) {
     }
 
     reportResults.innerHTML = '';
-    setReportStatus(`Running report across ${targetNamespaces.length} namespaces (10 at a time)...`, 'info');
+    setReportStatus(`Running report across ${targetNamespaces.length} namespaces...`, 'info');
 
-    const reports = [];
-    let processed = 0;
-    const concurrency = 10;
-    let index = 0;
+    const multiQuery = new URLSearchParams(query);
+    const allSelected = namespaces.length > 0 && targetNamespaces.length === namespaces.length;
+    multiQuery.set('namespaces', allSelected ? 'all' : targetNamespaces.join(','));
 
-    async function worker() {
-        while (index < targetNamespaces.length) {
-            const namespace = targetNamespaces[index];
-            index += 1;
-            try {
-                const response = await fetchWithRetry(
-                    `${API_BASE_URL}/config/${namespace}/report?${query.toString()}`,
-                );
-                if (!response.ok) {
-                    const errorData = await response.json().catch(() => ({}));
-                    throw new Error(errorData.detail || 'Failed to fetch report');
-                }
-                const data = await response.json();
-                reports.push({ namespace, data });
-            } catch (error) {
-                reports.push({
-                    namespace,
-                    data: { matched: [], errors: [{ workloadName: namespace, workloadKind: 'namespace', message: error.message }] },
+    const reportsByNamespace = new Map();
+    const getNamespaceReport = namespace => {
+        if (!reportsByNamespace.has(namespace)) {
+            reportsByNamespace.set(namespace, { namespace, data: { namespace, matched: [], errors: [] } });
+        }
+        return reportsByNamespace.get(namespace);
+    };
+    const collectReports = () => Array.from(reportsByNamespace.values())
+        .map(report => ({ namespace: report.namespace, data: sortReportData(report.data) }))
+        .sort((a, b) => a.namespace.localeCompare(b.namespace));
+
+    let lastRender = 0;
+    let sourceNote = '';
+    try {
+        await readReportStream(`${API_BASE_URL}/config/report/stream?${multiQuery.toString()}`, frame => {
+            if (frame.type === 'start') {
+                sourceNote = describeReportSource(frame);
+                (frame.namespaces || []).forEach(namespace => {
+                    Object.assign(getNamespaceReport(namespace).data, {
+                        pattern: frame.pattern,
+                        caseInsensitive: frame.caseInsensitive,
+                        searchIn: frame.searchIn,
+                        totalWorkloads: (frame.namespaceTotals || {})[namespace] || 0,
+                    });
                 });
-            } finally {
-                processed += 1;
-                setReportStatus(`Processed ${processed}/${targetNamespaces.length} namespaces...`, 'info');
+                return;
             }
-        }
+            if (frame.type !== 'workload') {
+                return;
+            }
+            appendReportFrame(getNamespaceReport(frame.namespace).data, frame);
+            setReportStatus(`Processed ${frame.completed}/${frame.total} workloads across ${targetNamespaces.length} namespaces...`, 'info');
+            if (frame.matched && Date.now() - lastRender >= REPORT_STREAM_RENDER_INTERVAL_MS) {
+                lastRender = Date.now();
+                renderMultiNamespaceResults(collectReports());
+            }
+        });
+    } catch (error) {
+        console.error('Error running multi-namespace config report:', error);
+        setReportStatus(`Error: ${error.message}`, 'error');
+        return;
     }
 
-    const workers = Array.from({ length: Math.min(concurrency, targetNamespaces.length) }, () => worker());
-    await Promise.all(workers);
-
-    reports.sort((a, b) => a.namespace.localeCompare(b.namespace));
-    setReportStatus(`Finished report for ${targetNamespaces.length} namespaces.`, 'success');
+    const reports = collectReports();
+    setReportStatus(`Finished report for ${targetNamespaces.length} namespaces${sourceNote}.`, 'success');
     renderMultiNamespaceResults(reports);
     const signature = lastReportHistorySignature
         || buildHistorySignature(buildHistoryEntryFromSelection(getSelectedReportNamespaces()));
@@ -3487,6 +3570,45 @@ async function viewSpringConfig(namespace, workloadName, kindLabel, workloadKind
     }
 }
 
+const AGENT_JOB_POLL_INTERVAL_MS = 2000;
+
+async function readAgentErrorMessage(response, fallback) {
+    const errorData = await response.json().catch(() => ({}));
+    return errorData.detail?.message || errorData.detail || fallback;
+}
+
+// POSTs apply-spring-config-agent; a 202 means the job outlived the backend's wait, so poll it to the end.
+async function requestSpringConfigAgent(namespace, workloadName, workloadKind, failureMessage) {
+    const response = await fetch(`${API_BASE_URL}/config/${namespace}/${workloadName}/apply-spring-config-agent`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ workloadKind }),
+    });
+    if (!response.ok) {
+        throw new Error(await readAgentErrorMessage(response, failureMessage));
+    }
+    if (response.status !== 202) {
+        return response.json();
+    }
+
+    let job = await response.json();
+    while (job.status === 'queued' || job.status === 'running') {
+        await new Promise(resolve => setTimeout(resolve, AGENT_JOB_POLL_INTERVAL_MS));
+        const statusResponse = await fetch(`${API_BASE_URL}/agent-jobs/${job.jobId}`);
+        if (!statusResponse.ok) {
+            throw new Error(await readAgentErrorMessage(statusResponse, failureMessage));
+        }
+        job = await statusResponse.json();
+    }
+    const resultResponse = await fetch(`${API_BASE_URL}/agent-jobs/${job.jobId}/result`);
+    if (!resultResponse.ok) {
+        throw new Error(await readAgentErrorMessage(resultResponse, failureMessage));
+    }
+    return resultResponse.json();
+}
+
 async function runSpringConfigAgent() {
     if (!configState || !configState.namespace || !configState.workloadName) {
         setConfigStatus('Open a workload before running the config agent.', 'error');
@@ -3506,21 +3628,12 @@ async function runSpringConfigAgent() {
     configProfiles.innerHTML = '';
 
     try {
-        const response = await fetch(`${API_BASE_URL}/config/${namespace}/${workloadName}/apply-spring-config-agent`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ workloadKind }),
-        });
-
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({}));
-            const message = errorData.detail?.message || errorData.detail || 'Failed to run Spring Config Agent';
-            throw new Error(message);
-        }
-
-        const data = await response.json();
+        const data = await requestSpringConfigAgent(
+            namespace,
+            workloadName,
+            workloadKind,
+            'Failed to run Spring Config Agent',
+        );
         const payload = data.payload || data;
         const { propertySources, activeProfiles, warnings } = buildAgentConfigSources(payload, workloadName);
 
@@ -3716,21 +3829,12 @@ async function applySpringConfigAgent(namespace, workloadName, workloadKind, but
     setInlineStatus(statusEl, 'Applying Spring Config Agent...', 'info');
 
     try {
-        const response = await fetch(`${API_BASE_URL}/config/${namespace}/${workloadName}/apply-spring-config-agent`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ workloadKind }),
-        });
-
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({}));
-            const message = errorData.detail?.message || errorData.detail || 'Failed to apply Spring Config Agent';
-            throw new Error(message);
-        }
-
-        const result = await response.json();
+        const result = await requestSpringConfigAgent(
+            namespace,
+            workloadName,
+            workloadKind,
+            'Failed to apply Spring Config Agent',
+        );
         const message = result.message || 'Spring Config Agent applied.';
         setReportStatus(message, 'success');
         setInlineStatus(statusEl, message, 'success');
@@ -1,22 +1,54 @@
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 import json
 import csv
 import io
 import subprocess
 import os
-import urllib.request
-import urllib.error
 import urllib.parse
 import re
+import shlex
+import zlib
 import asyncio
+import importlib.util
+import itertools
+import multiprocessing
+import random
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import hashlib
+import functools
+import sqlite3
+import threading
 from dotenv import load_dotenv
 import logging
 import time
+import httpx
+
+# Configmap match-pool children (see get_config_match_pool) import this module
+# only to reach the matcher. prometheus_client picks its value class from the
+# environment at import, so drop the multiprocess dir first: otherwise every
+# child leaves per-pid files there that no one marks dead and /metrics reads.
+CONFIG_MATCH_PROCESS_NAME = "config-match"
+if multiprocessing.current_process().name.startswith(CONFIG_MATCH_PROCESS_NAME):
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    os.environ.pop("prometheus_multiproc_dir", None)
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client import generate_latest, multiprocess
 import redis
 import yaml
+try:
+    import re._parser as _regex_parser
+except ImportError:  # Python < 3.11
+    import sre_parse as _regex_parser
+import xml.etree.ElementTree as ET
 
 load_dotenv()
 
@@ -43,6 +75,60 @@ SPRING_CONFIG_AGENT_OUTPUT_DIR = os.getenv(
     "SPRING_CONFIG_AGENT_OUTPUT_DIR",
     "/tmp/spring-config-agent",
 )
+DEBUG_POD_POOL_ENABLED = os.getenv("DEBUG_POD_POOL_ENABLED", "false").lower() in ("1", "true", "yes")
+try:
+    DEBUG_POD_POOL_MAX_PODS = int(os.getenv("DEBUG_POD_POOL_MAX_PODS", "2"))
+except ValueError:
+    DEBUG_POD_POOL_MAX_PODS = 2
+if DEBUG_POD_POOL_MAX_PODS < 1:
+    DEBUG_POD_POOL_MAX_PODS = 1
+try:
+    DEBUG_POD_POOL_IDLE_SECONDS = int(os.getenv("DEBUG_POD_POOL_IDLE_SECONDS", "600"))
+except ValueError:
+    DEBUG_POD_POOL_IDLE_SECONDS = 600
+try:
+    DEBUG_POD_POOL_MAX_AGE_SECONDS = int(os.getenv("DEBUG_POD_POOL_MAX_AGE_SECONDS", "3600"))
+except ValueError:
+    DEBUG_POD_POOL_MAX_AGE_SECONDS = 3600
+if DEBUG_POD_POOL_MAX_AGE_SECONDS < 600:
+    DEBUG_POD_POOL_MAX_AGE_SECONDS = 600
+try:
+    AGENT_JOB_CONCURRENCY = int(os.getenv("AGENT_JOB_CONCURRENCY", "4"))
+except ValueError:
+    AGENT_JOB_CONCURRENCY = 4
+if AGENT_JOB_CONCURRENCY < 1:
+    AGENT_JOB_CONCURRENCY = 1
+try:
+    AGENT_JOB_NAMESPACE_CONCURRENCY = int(os.getenv("AGENT_JOB_NAMESPACE_CONCURRENCY", "2"))
+except ValueError:
+    AGENT_JOB_NAMESPACE_CONCURRENCY = 2
+AGENT_JOB_NAMESPACE_CONCURRENCY = max(1, min(AGENT_JOB_NAMESPACE_CONCURRENCY, AGENT_JOB_CONCURRENCY))
+try:
+    AGENT_JOB_MAX_QUEUED = int(os.getenv("AGENT_JOB_MAX_QUEUED", "100"))
+except ValueError:
+    AGENT_JOB_MAX_QUEUED = 100
+if AGENT_JOB_MAX_QUEUED < 1:
+    AGENT_JOB_MAX_QUEUED = 1
+try:
+    AGENT_JOB_TTL_SECONDS = int(os.getenv("AGENT_JOB_TTL_SECONDS", "3600"))
+except ValueError:
+    AGENT_JOB_TTL_SECONDS = 3600
+try:
+    AGENT_JOB_WAIT_SECONDS = int(os.getenv("AGENT_JOB_WAIT_SECONDS", "120"))
+except ValueError:
+    AGENT_JOB_WAIT_SECONDS = 120
+if AGENT_JOB_WAIT_SECONDS < 1:
+    AGENT_JOB_WAIT_SECONDS = 1
+try:
+    AGENT_SWEEP_POD_PARALLELISM = int(os.getenv("AGENT_SWEEP_POD_PARALLELISM", "2"))
+except ValueError:
+    AGENT_SWEEP_POD_PARALLELISM = 2
+if AGENT_SWEEP_POD_PARALLELISM < 1:
+    AGENT_SWEEP_POD_PARALLELISM = 1
+AGENT_JOB_DB_PATH = os.getenv(
+    "AGENT_JOB_DB_PATH",
+    "/dev/shm/openshift-dashboard-agent-jobs.db" if os.path.isdir("/dev/shm") else "/tmp/openshift-dashboard-agent-jobs.db",
+)
 REDIS_HOST = os.getenv("REDIS_HOST")
 try:
     REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
@@ -60,12 +146,198 @@ except ValueError:
     CACHE_TTL_SECONDS = 20
 if CACHE_TTL_SECONDS < 0:
     CACHE_TTL_SECONDS = 0
+try:
+    SINGLE_FLIGHT_LOCK_MS = int(os.getenv("SINGLE_FLIGHT_LOCK_MS", "12000"))
+except ValueError:
+    SINGLE_FLIGHT_LOCK_MS = 12000
 try:
     CONFIG_REPORT_CONCURRENCY = int(os.getenv("CONFIG_REPORT_CONCURRENCY", "6"))
 except ValueError:
     CONFIG_REPORT_CONCURRENCY = 6
 if CONFIG_REPORT_CONCURRENCY < 1:
     CONFIG_REPORT_CONCURRENCY = 1
+try:
+    CONFIG_REPORT_GLOBAL_CONCURRENCY = int(
+        os.getenv("CONFIG_REPORT_GLOBAL_CONCURRENCY", str(CONFIG_REPORT_CONCURRENCY * 4))
+    )
+except ValueError:
+    CONFIG_REPORT_GLOBAL_CONCURRENCY = CONFIG_REPORT_CONCURRENCY * 4
+if CONFIG_REPORT_GLOBAL_CONCURRENCY < CONFIG_REPORT_CONCURRENCY:
+    CONFIG_REPORT_GLOBAL_CONCURRENCY = CONFIG_REPORT_CONCURRENCY
+CONFIG_REPORT_ADAPTIVE = os.getenv("CONFIG_REPORT_ADAPTIVE", "true").lower() in ("1", "true", "yes")
+try:
+    CONFIG_REPORT_CONCURRENCY_MIN = int(os.getenv("CONFIG_REPORT_CONCURRENCY_MIN", "2"))
+except ValueError:
+    CONFIG_REPORT_CONCURRENCY_MIN = 2
+try:
+    CONFIG_REPORT_CONCURRENCY_MAX = int(os.getenv("CONFIG_REPORT_CONCURRENCY_MAX", "64"))
+except ValueError:
+    CONFIG_REPORT_CONCURRENCY_MAX = 64
+try:
+    CONFIG_REPORT_LATENCY_FLOOR_SECONDS = float(os.getenv("CONFIG_REPORT_LATENCY_FLOOR_SECONDS", "0.5"))
+except ValueError:
+    CONFIG_REPORT_LATENCY_FLOOR_SECONDS = 0.5
+LOCAL_CACHE_ENABLED = os.getenv("LOCAL_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LOCAL_CACHE_PATH = os.getenv(
+    "LOCAL_CACHE_PATH",
+    "/dev/shm/openshift-dashboard-cache.db" if os.path.isdir("/dev/shm") else "/tmp/openshift-dashboard-cache.db",
+)
+try:
+    LOCAL_CACHE_MAX_BYTES = int(os.getenv("LOCAL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+except ValueError:
+    LOCAL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+try:
+    LOCAL_CACHE_SWEEP_SECONDS = int(os.getenv("LOCAL_CACHE_SWEEP_SECONDS", "30"))
+except ValueError:
+    LOCAL_CACHE_SWEEP_SECONDS = 30
+try:
+    LOCAL_CACHE_TOUCH_SECONDS = int(os.getenv("LOCAL_CACHE_TOUCH_SECONDS", "10"))
+except ValueError:
+    LOCAL_CACHE_TOUCH_SECONDS = 10
+try:
+    CONFIGMAP_FETCH_CONCURRENCY = int(os.getenv("CONFIGMAP_FETCH_CONCURRENCY", "8"))
+except ValueError:
+    CONFIGMAP_FETCH_CONCURRENCY = 8
+if CONFIGMAP_FETCH_CONCURRENCY < 1:
+    CONFIGMAP_FETCH_CONCURRENCY = 1
+try:
+    CONFIGMAP_LIST_THRESHOLD = int(os.getenv("CONFIGMAP_LIST_THRESHOLD", "3"))
+except ValueError:
+    CONFIGMAP_LIST_THRESHOLD = 3
+SPRING_INDEX_ENABLED = os.getenv("SPRING_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+SPRING_INDEX_PATH = os.getenv("SPRING_INDEX_PATH", "/tmp/openshift-dashboard-spring-index.db")
+SPRING_INDEX_NAMESPACES = [item.strip() for item in os.getenv("SPRING_INDEX_NAMESPACES", "").split(",") if item.strip()]
+try:
+    SPRING_INDEX_INTERVAL_SECONDS = int(os.getenv("SPRING_INDEX_INTERVAL_SECONDS", "300"))
+except ValueError:
+    SPRING_INDEX_INTERVAL_SECONDS = 300
+try:
+    SPRING_INDEX_MAX_AGE_SECONDS = int(os.getenv("SPRING_INDEX_MAX_AGE_SECONDS", "600"))
+except ValueError:
+    SPRING_INDEX_MAX_AGE_SECONDS = 600
+try:
+    SPRING_INDEX_STALE_SECONDS = int(os.getenv("SPRING_INDEX_STALE_SECONDS", "900"))
+except ValueError:
+    SPRING_INDEX_STALE_SECONDS = 900
+# Freshness is judged by the oldest indexed workload, so unchanged workloads must be
+# re-fetched (on the next interval tick after MAX_AGE) before `auto` reports go stale.
+if SPRING_INDEX_MAX_AGE_SECONDS > SPRING_INDEX_STALE_SECONDS - SPRING_INDEX_INTERVAL_SECONDS:
+    SPRING_INDEX_MAX_AGE_SECONDS = max(SPRING_INDEX_STALE_SECONDS - SPRING_INDEX_INTERVAL_SECONDS, 0)
+try:
+    SPRING_INDEX_IDLE_SECONDS = int(os.getenv("SPRING_INDEX_IDLE_SECONDS", "86400"))
+except ValueError:
+    SPRING_INDEX_IDLE_SECONDS = 86400
+try:
+    SPRING_INDEX_POLL_SECONDS = int(os.getenv("SPRING_INDEX_POLL_SECONDS", "15"))
+except ValueError:
+    SPRING_INDEX_POLL_SECONDS = 15
+CONFIGMAP_INDEX_ENABLED = os.getenv("CONFIGMAP_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+try:
+    CONFIGMAP_INDEX_MAX_NAMESPACES = int(os.getenv("CONFIGMAP_INDEX_MAX_NAMESPACES", "16"))
+except ValueError:
+    CONFIGMAP_INDEX_MAX_NAMESPACES = 16
+try:
+    CONFIG_PARSE_CACHE_MAX_BYTES = int(os.getenv("CONFIG_PARSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+except ValueError:
+    CONFIG_PARSE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+try:
+    CONFIG_MATCH_PROCESSES = int(os.getenv("CONFIG_MATCH_PROCESSES", "1"))
+except ValueError:
+    CONFIG_MATCH_PROCESSES = 1
+if CONFIG_MATCH_PROCESSES < 0:
+    CONFIG_MATCH_PROCESSES = 0
+try:
+    CONFIG_MATCH_POOL_MIN_BYTES = int(os.getenv("CONFIG_MATCH_POOL_MIN_BYTES", "65536"))
+except ValueError:
+    CONFIG_MATCH_POOL_MIN_BYTES = 65536
+try:
+    CONFIG_MATCH_CHUNK_BYTES = int(os.getenv("CONFIG_MATCH_CHUNK_BYTES", "262144"))
+except ValueError:
+    CONFIG_MATCH_CHUNK_BYTES = 262144
+if CONFIG_MATCH_CHUNK_BYTES < 1:
+    CONFIG_MATCH_CHUNK_BYTES = 1
+try:
+    CONFIG_MATCH_POOL_IDLE_SECONDS = int(os.getenv("CONFIG_MATCH_POOL_IDLE_SECONDS", "120"))
+except ValueError:
+    CONFIG_MATCH_POOL_IDLE_SECONDS = 120
+ACTUATOR_URL_TEMPLATE = os.getenv(
+    "ACTUATOR_URL_TEMPLATE",
+    "http://{service}.{namespace}.svc.cluster.local:{port}/actuator/env",
+)
+ACTUATOR_HTTP2 = os.getenv("ACTUATOR_HTTP2", "false").lower() in ("1", "true", "yes")
+try:
+    ACTUATOR_MAX_CONNECTIONS = int(os.getenv("ACTUATOR_MAX_CONNECTIONS", "200"))
+except ValueError:
+    ACTUATOR_MAX_CONNECTIONS = 200
+try:
+    ACTUATOR_MAX_CONNECTIONS_PER_HOST = int(os.getenv("ACTUATOR_MAX_CONNECTIONS_PER_HOST", "4"))
+except ValueError:
+    ACTUATOR_MAX_CONNECTIONS_PER_HOST = 4
+if ACTUATOR_MAX_CONNECTIONS_PER_HOST < 1:
+    ACTUATOR_MAX_CONNECTIONS_PER_HOST = 1
+try:
+    ACTUATOR_CONNECT_TIMEOUT_SECONDS = float(os.getenv("ACTUATOR_CONNECT_TIMEOUT_SECONDS", "3"))
+except ValueError:
+    ACTUATOR_CONNECT_TIMEOUT_SECONDS = 3.0
+try:
+    ACTUATOR_READ_TIMEOUT_SECONDS = float(os.getenv("ACTUATOR_READ_TIMEOUT_SECONDS", "10"))
+except ValueError:
+    ACTUATOR_READ_TIMEOUT_SECONDS = 10.0
+KUBE_CLIENT = os.getenv("KUBE_CLIENT", "api").lower()
+if KUBE_CLIENT not in ("api", "oc"):
+    KUBE_CLIENT = "api"
+KUBE_API_HTTP2 = os.getenv("KUBE_API_HTTP2", "true").lower() in ("1", "true", "yes")
+try:
+    KUBE_API_MAX_CONNECTIONS = int(os.getenv("KUBE_API_MAX_CONNECTIONS", "20"))
+except ValueError:
+    KUBE_API_MAX_CONNECTIONS = 20
+if KUBE_API_MAX_CONNECTIONS < 1:
+    KUBE_API_MAX_CONNECTIONS = 1
+try:
+    KUBE_API_TIMEOUT_SECONDS = float(os.getenv("KUBE_API_TIMEOUT_SECONDS", "30"))
+except ValueError:
+    KUBE_API_TIMEOUT_SECONDS = 30.0
+# Informers are per uvicorn worker: each worker that touches a namespace keeps its own copy of
+# that namespace's deployments, services, pods and configmaps (full configmap data included),
+# so memory for watched namespaces scales with the worker count.
+KUBE_INFORMER_ENABLED = os.getenv("KUBE_INFORMER_ENABLED", "false").lower() in ("1", "true", "yes")
+try:
+    KUBE_INFORMER_RESYNC_SECONDS = int(os.getenv("KUBE_INFORMER_RESYNC_SECONDS", "300"))
+except ValueError:
+    KUBE_INFORMER_RESYNC_SECONDS = 300
+if KUBE_INFORMER_RESYNC_SECONDS < 30:
+    KUBE_INFORMER_RESYNC_SECONDS = 30
+try:
+    KUBE_INFORMER_STALE_SECONDS = int(os.getenv("KUBE_INFORMER_STALE_SECONDS", "30"))
+except ValueError:
+    KUBE_INFORMER_STALE_SECONDS = 30
+try:
+    KUBE_INFORMER_IDLE_SECONDS = int(os.getenv("KUBE_INFORMER_IDLE_SECONDS", "900"))
+except ValueError:
+    KUBE_INFORMER_IDLE_SECONDS = 900
+# The API server sends a bookmark about once a minute on an idle watch; a connected watch
+# that has been silent for longer is treated as down (half-open connections included).
+KUBE_INFORMER_SILENCE_SECONDS = 90
+TRACE_EXPORT = os.getenv("TRACE_EXPORT", "").lower()
+if TRACE_EXPORT not in ("", "otlp", "file"):
+    TRACE_EXPORT = ""
+TRACE_OTLP_ENDPOINT = os.getenv("TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACE_FILE_PATH = os.getenv("TRACE_FILE_PATH", "/tmp/openshift-dashboard-traces.jsonl")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "openshift-dashboard-backend")
+try:
+    TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+except ValueError:
+    TRACE_SAMPLE_RATE = 1.0
+try:
+    TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "1000"))
+except ValueError:
+    TRACE_MAX_SPANS = 1000
+try:
+    LOOP_LAG_MONITOR_MS = int(os.getenv("LOOP_LAG_MONITOR_MS", "0"))
+except ValueError:
+    LOOP_LAG_MONITOR_MS = 0
+if LOOP_LAG_MONITOR_MS < 0:
+    LOOP_LAG_MONITOR_MS = 0
 logging.basicConfig(
     level=LOG_LEVEL,
     format="%(asctime)s %(levelname)s %(name)s [thread=%(threadName)s:%(thread)d]: %(message)s",
@@ -83,9 +355,354 @@ logger.info("Token source: %s", token_source)
 logger.info("Cache TTL: %ss", CACHE_TTL_SECONDS)
 logger.info("Redis enabled: %s", "yes" if REDIS_HOST else "no")
 logger.info("Spring config agent enabled: %s", "yes" if SPRING_CONFIG_AGENT_ENABLED else "no")
+if SPRING_CONFIG_AGENT_ENABLED:
+    logger.info(
+        "Debug pod pool: %s",
+        f"up to {DEBUG_POD_POOL_MAX_PODS} idle per image, idle={DEBUG_POD_POOL_IDLE_SECONDS}s "
+        f"maxAge={DEBUG_POD_POOL_MAX_AGE_SECONDS}s"
+        if DEBUG_POD_POOL_ENABLED
+        else "off",
+    )
+    logger.info(
+        "Agent jobs: concurrency=%s perNamespace=%s maxQueued=%s ttl=%ss wait=%ss store=%s sweepPodParallelism=%s",
+        AGENT_JOB_CONCURRENCY,
+        AGENT_JOB_NAMESPACE_CONCURRENCY,
+        AGENT_JOB_MAX_QUEUED,
+        AGENT_JOB_TTL_SECONDS,
+        AGENT_JOB_WAIT_SECONDS,
+        "redis" if REDIS_HOST else AGENT_JOB_DB_PATH,
+        AGENT_SWEEP_POD_PARALLELISM,
+    )
+logger.info("Kubernetes client: %s", KUBE_CLIENT if KUBERNETES_TOKEN else "oc")
+logger.info(
+    "Informer cache enabled: %s (resync=%ss stale=%ss)",
+    "yes" if KUBE_INFORMER_ENABLED else "no",
+    KUBE_INFORMER_RESYNC_SECONDS,
+    KUBE_INFORMER_STALE_SECONDS,
+)
+logger.info(
+    "Spring property index enabled: %s (path=%s interval=%ss maxAge=%ss stale=%ss)",
+    "yes" if SPRING_INDEX_ENABLED else "no",
+    SPRING_INDEX_PATH,
+    SPRING_INDEX_INTERVAL_SECONDS,
+    SPRING_INDEX_MAX_AGE_SECONDS,
+    SPRING_INDEX_STALE_SECONDS,
+)
+logger.info(
+    "Trace export: %s",
+    {"otlp": TRACE_OTLP_ENDPOINT, "file": TRACE_FILE_PATH}.get(TRACE_EXPORT, "off"),
+)
+logger.info(
+    "Configmap match pool: %s",
+    f"{CONFIG_MATCH_PROCESSES} processes for scans of {CONFIG_MATCH_POOL_MIN_BYTES}+ bytes"
+    if CONFIG_MATCH_PROCESSES
+    else "off",
+)
+logger.info(
+    "Event loop lag monitor: %s",
+    f"blocks over {LOOP_LAG_MONITOR_MS}ms" if LOOP_LAG_MONITOR_MS else "off",
+)
+logger.info(
+    "Config report concurrency: %s per namespace, %s global, adaptive=%s [%s..%s]",
+    CONFIG_REPORT_CONCURRENCY,
+    CONFIG_REPORT_GLOBAL_CONCURRENCY,
+    "yes" if CONFIG_REPORT_ADAPTIVE else "no",
+    CONFIG_REPORT_CONCURRENCY_MIN,
+    CONFIG_REPORT_CONCURRENCY_MAX,
+)
+
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR", "")
+if PROMETHEUS_MULTIPROC_DIR:
+    # Every uvicorn worker writes its samples to mmap files here; /metrics merges them.
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+OC_COMMAND_SECONDS = Histogram(
+    "dashboard_oc_command_seconds",
+    "Duration of oc subprocess calls",
+    ["verb", "resource", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+)
+KUBE_API_REQUEST_SECONDS = Histogram(
+    "dashboard_kube_api_request_seconds",
+    "Duration of in-process Kubernetes API requests",
+    ["method", "resource", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+ACTUATOR_FETCH_SECONDS = Histogram(
+    "dashboard_actuator_fetch_seconds",
+    "Latency of /actuator/env fetches that reached the network",
+    ["outcome"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+CACHE_REQUESTS_TOTAL = Counter(
+    "dashboard_cache_requests_total",
+    "Cache lookups by cache, tier and result",
+    ["cache", "tier", "result"],
+)
+REPORT_DURATION_SECONDS = Histogram(
+    "dashboard_report_duration_seconds",
+    "Wall time of config reports",
+    ["kind", "source"],
+    buckets=(0.05, 0.25, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+REPORT_WORKLOADS = Histogram(
+    "dashboard_report_workloads",
+    "Workloads scanned per config report",
+    ["kind", "source"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+REPORT_INFLIGHT = Gauge(
+    "dashboard_report_inflight_workloads",
+    "Report workloads currently holding a concurrency slot",
+    multiprocess_mode="livesum",
+)
+REPORT_WAITING = Gauge(
+    "dashboard_report_waiting_workloads",
+    "Report workloads queued for a concurrency slot",
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "dashboard_event_loop_lag_seconds",
+    "Lateness of the loop lag monitor's wakeups (only sampled when LOOP_LAG_MONITOR_MS is set)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DEBUG_POD_LEASES_TOTAL = Counter(
+    "dashboard_debug_pod_leases_total",
+    "Debug pods handed to agent runs, by whether a warm pod was reused",
+    ["source"],
+)
+AGENT_JOBS_TOTAL = Counter(
+    "dashboard_agent_jobs_total",
+    "Spring config agent jobs by outcome (deduplicated counts submits joined to an active job)",
+    ["outcome"],
+)
+AGENT_JOB_QUEUE_SECONDS = Histogram(
+    "dashboard_agent_job_queue_seconds",
+    "Time spring config agent jobs waited for a runner slot",
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+REPORT_CONCURRENCY_LIMIT = Histogram(
+    "dashboard_report_concurrency_limit",
+    "Adaptive concurrency limit reached at the end of each report",
+    buckets=(1, 2, 4, 6, 8, 12, 16, 24, 32, 48, 64, 128),
+)
+OC_METRIC_RESOURCES = {
+    "configmap", "configmaps", "deployment", "deployments", "deploymentconfig", "deploymentconfigs", "dc",
+    "pod", "pods", "service", "services", "svc", "project", "projects", "namespace", "namespaces",
+    "replicaset", "replicasets", "replicationcontroller", "replicationcontrollers", "secret", "secrets",
+}
+
+
+def oc_metric_labels(args):
+    verb = args[0] if args else ""
+    if verb in ("exec", "logs", "cp", "rsh", "port-forward", "attach"):
+        return verb, "pod"
+    if "--raw" in args:
+        return verb, "raw"
+    target = args[1].split("/", 1)[0].lower() if len(args) > 1 else ""
+    if target in OC_METRIC_RESOURCES:
+        return verb, target
+    if verb == "rollout" and len(args) > 2:
+        kind = args[2].split("/", 1)[0].lower()
+        return f"rollout-{target}", kind if kind in OC_METRIC_RESOURCES else "other"
+    return verb, "other"
+
+
+def observe_report(kind: str, source: str, started: float, workloads: int, limiter=None):
+    REPORT_DURATION_SECONDS.labels(kind, source).observe(time.monotonic() - started)
+    REPORT_WORKLOADS.labels(kind, source).observe(workloads)
+    if limiter is not None:
+        REPORT_CONCURRENCY_LIMIT.observe(limiter.current_limit())
+
+
+def record_cache_lookup(cache: str, tier: str, hit: bool):
+    CACHE_REQUESTS_TOTAL.labels(cache, tier, "hit" if hit else "miss").inc()
+
+
+class RequestTrace:
+    """Spans recorded while serving one request.
+
+    Per-name totals are always kept so Server-Timing stays complete; individual
+    spans are capped at TRACE_MAX_SPANS to bound memory on large reports.
+    """
+
+    def __init__(self, name: str):
+        self.trace_id = os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.started = time.perf_counter()
+        self.spans = []
+        self.totals = {}
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, span: dict):
+        with self._lock:
+            total = self.totals.get(span["name"])
+            if total is None:
+                total = self.totals[span["name"]] = [0, 0.0]
+            total[0] += 1
+            total[1] += span["durationMs"]
+            if len(self.spans) < TRACE_MAX_SPANS:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self):
+        with self._lock:
+            totals = sorted(self.totals.items(), key=lambda item: item[1][1], reverse=True)
+        parts = [
+            f'{name};dur={duration:.1f};desc="{count}x"'
+            for name, (count, duration) in totals
+        ]
+        parts.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(parts)
+
+    def breakdown(self):
+        with self._lock:
+            totals = sorted(self.totals.items(), key=lambda item: item[1][1], reverse=True)
+            spans = sorted(self.spans, key=lambda span: span["durationMs"], reverse=True)
+        return {
+            "traceId": self.trace_id,
+            "totalMs": round(self.elapsed_ms(), 3),
+            "stages": [
+                {"name": name, "count": count, "durationMs": round(duration, 3)}
+                for name, (count, duration) in totals
+            ],
+            "slowestSpans": [
+                {
+                    "name": span["name"],
+                    "durationMs": round(span["durationMs"], 3),
+                    "offsetMs": round((span["startNs"] - self.start_ns) / 1e6, 3),
+                    "attributes": span["attributes"],
+                    **({"error": span["error"]} if "error" in span else {}),
+                }
+                for span in spans[:50]
+            ],
+            "droppedSpans": self.dropped,
+        }
+
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_current_span_id = contextvars.ContextVar("current_span_id", default=None)
+
+
+@contextlib.contextmanager
+def trace_span(name: str, **attributes):
+    """Times the enclosed block as a child of the current span; a no-op outside a request.
+
+    Context variables follow asyncio tasks and asyncio.to_thread, so spans
+    opened in worker threads still attach to the request that started them.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    span = {
+        "spanId": os.urandom(8).hex(),
+        "parentSpanId": _current_span_id.get() or trace.span_id,
+        "name": name,
+        "attributes": attributes,
+        "startNs": time.time_ns(),
+    }
+    started = time.perf_counter()
+    token = _current_span_id.set(span["spanId"])
+    try:
+        yield span
+    except BaseException as exc:
+        span["error"] = f"HTTP {exc.status_code}" if isinstance(exc, HTTPException) else type(exc).__name__
+        raise
+    finally:
+        _current_span_id.reset(token)
+        span["durationMs"] = (time.perf_counter() - started) * 1000
+        trace.record(span)
+
+
+def exec_oc(args, **kwargs):
+    """subprocess.run for oc with the shared connection flags, timed per verb/resource."""
+    verb, resource = oc_metric_labels(args)
+    started = time.monotonic()
+    outcome = "error"
+    with trace_span("oc", verb=verb, resource=resource) as span:
+        try:
+            result = subprocess.run(oc_base_args() + args, capture_output=True, text=True, **kwargs)
+            outcome = "ok" if result.returncode == 0 else "error"
+            return result
+        except subprocess.TimeoutExpired:
+            outcome = "timeout"
+            raise
+        finally:
+            OC_COMMAND_SECONDS.labels(verb, resource, outcome).observe(time.monotonic() - started)
+            if span is not None:
+                span["attributes"]["outcome"] = outcome
+
+
+async def exec_oc_async(args, input_data=None, timeout=30):
+    """exec_oc on asyncio subprocesses, for callers running on the event loop.
+
+    Returns the same CompletedProcess (text output) and, like subprocess.run,
+    kills oc and raises subprocess.TimeoutExpired once `timeout` elapses. A
+    cancelled request kills its oc process too.
+    """
+    verb, resource = oc_metric_labels(args)
+    command = oc_base_args() + args
+    started = time.monotonic()
+    outcome = "error"
+    with trace_span("oc", verb=verb, resource=resource) as span:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_data.encode("utf-8") if input_data is not None else None),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(command, timeout) from None
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+            result = subprocess.CompletedProcess(
+                command,
+                process.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+            )
+            outcome = "ok" if result.returncode == 0 else "error"
+            return result
+        except subprocess.TimeoutExpired:
+            outcome = "timeout"
+            raise
+        finally:
+            OC_COMMAND_SECONDS.labels(verb, resource, outcome).observe(time.monotonic() - started)
+            if span is not None:
+                span["attributes"]["outcome"] = outcome
+
 
-_actuator_cache = {}
 _redis_client = None
+_local_cache = None
+_local_cache_lock = threading.Lock()
+_spring_index = None
+_spring_index_lock = threading.Lock()
+_spring_index_task = None
+_kube_client = None
+_kube_client_lock = threading.Lock()
+_actuator_client = None
+_config_match_pool = None
+_config_match_pool_lock = threading.Lock()
+_config_match_pool_scans = 0
+_config_match_pool_timer = None
+_informers = {}
+_informers_lock = threading.Lock()
 
 
 def get_redis_client():
@@ -105,6 +722,298 @@ def get_redis_client():
     return _redis_client
 
 
+class LocalSharedCache:
+    """TTL cache shared by every uvicorn worker on the pod.
+
+    Backed by an SQLite file (on /dev/shm when available, so it stays in memory)
+    in WAL mode, which gives cross-process locking for free. Entries are bounded
+    by LOCAL_CACHE_MAX_BYTES with least-recently-used eviction, and expired rows
+    are swept every LOCAL_CACHE_SWEEP_SECONDS. Reads only write when an entry's
+    access time is more than LOCAL_CACHE_TOUCH_SECONDS old, so hits do not queue
+    on SQLite's single writer lock. Triggers keep the total entry size in the
+    stats table, so a write never scans the table to enforce the bound.
+    Hit/miss counts are per worker; dashboard_cache_requests_total has them
+    across workers.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max(1, max_bytes)
+        self.local = threading.local()
+        self.swept_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        conn = self.connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN "
+                "UPDATE stats SET value = value + NEW.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN "
+                "UPDATE stats SET value = value + NEW.size - OLD.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN "
+                "UPDATE stats SET value = value - OLD.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO stats (name, value) SELECT 'bytes', COALESCE(SUM(size), 0) FROM entries"
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=2, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=2000")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA mmap_size=67108864")
+            self.local.conn = conn
+        return conn
+
+    def count(self, conn, name: str, amount: int = 1):
+        conn.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def total_bytes(self, conn) -> int:
+        row = conn.execute("SELECT value FROM stats WHERE name = 'bytes'").fetchone()
+        return row[0] if row else 0
+
+    def get(self, key: str):
+        conn = self.connection()
+        now = time.time()
+        row = conn.execute("SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] <= now:
+            # Expired rows are left for the periodic sweep.
+            self.misses += 1
+            return None
+        if now - row[2] >= LOCAL_CACHE_TOUCH_SECONDS:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return row[0].decode("utf-8")
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        data = value.encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        conn = self.connection()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+            "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+            (key, data, len(data), now + ttl_seconds, now),
+        )
+        if now - self.swept_at >= LOCAL_CACHE_SWEEP_SECONDS:
+            self.swept_at = now
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total = self.total_bytes(conn)
+        while total > self.max_bytes:
+            evicted = conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT 16)"
+            ).rowcount
+            if not evicted:
+                break
+            self.count(conn, "evictions", evicted)
+            total = self.total_bytes(conn)
+
+    def stats(self):
+        conn = self.connection()
+        counters = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": counters.get("bytes", 0),
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "counterScope": "worker",
+            "evictions": counters.get("evictions", 0),
+        }
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key within this worker.
+
+    The first caller runs the function; callers arriving while it is in flight
+    block until it finishes and receive the same result or exception.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key: str, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"event": threading.Event(), "result": None, "error": None}
+                self.calls[key] = call
+        if not leader:
+            logger.debug("Single-flight join %s", key)
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except Exception as exc:
+            call["error"] = exc
+            raise
+        finally:
+            with self.lock:
+                self.calls.pop(key, None)
+            call["event"].set()
+
+
+_single_flight = SingleFlight()
+
+
+class AsyncSingleFlight:
+    """Event-loop counterpart of SingleFlight for coroutine callers.
+
+    A leader that is cancelled (its client went away) does not fail the call
+    for its joiners: they retry, and the first one to get there leads.
+    """
+
+    def __init__(self):
+        self.calls = {}
+
+    async def do(self, key: str, fn):
+        while True:
+            future = self.calls.get(key)
+            if future is None:
+                break
+            logger.debug("Single-flight join %s", key)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                logger.debug("Single-flight leader cancelled; retrying %s", key)
+        future = asyncio.get_running_loop().create_future()
+        self.calls[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an error nobody else awaited is not logged as unhandled.
+            future.exception()
+            raise
+        finally:
+            if self.calls.get(key) is future:
+                del self.calls[key]
+
+
+_async_single_flight = AsyncSingleFlight()
+
+# Deletes a lock only while it still holds our token, in one step: a GET then DELETE
+# could remove a lock that expired in between and was taken by another worker.
+REDIS_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+async def redis_single_flight(redis_client, key: str, fn, read_result):
+    """Coalesces a fetch across workers with a short Redis lock.
+
+    The lock holder awaits `fn`, which is expected to publish its result where
+    `read_result` can see it (the Redis cache). Other workers poll for that
+    result, or for the error the holder recorded, until the lock is released
+    or expires; if neither shows up they run `fn` themselves. Redis calls are
+    blocking, so each one is pushed to a thread.
+    """
+    lock_key = f"singleflight:{key}"
+    error_key = f"singleflight-error:{key}"
+    token = f"{os.getpid()}:{id(asyncio.current_task())}:{time.time()}"
+    try:
+        acquired = await asyncio.to_thread(redis_client.set, lock_key, token, nx=True, px=SINGLE_FLIGHT_LOCK_MS)
+    except redis.RedisError as exc:
+        logger.warning("Single-flight lock failed (continuing): %s", str(exc))
+        return await fn()
+    if acquired:
+        try:
+            await asyncio.to_thread(redis_client.delete, error_key)
+            return await fn()
+        except HTTPException as exc:
+            try:
+                await asyncio.to_thread(
+                    redis_client.set,
+                    error_key,
+                    json.dumps({"status": exc.status_code, "detail": exc.detail}),
+                    px=SINGLE_FLIGHT_LOCK_MS,
+                )
+            except (redis.RedisError, TypeError) as write_exc:
+                logger.warning("Single-flight error publish failed: %s", str(write_exc))
+            raise
+        finally:
+            try:
+                await asyncio.to_thread(
+                    redis_client.register_script(REDIS_RELEASE_LOCK_SCRIPT), keys=[lock_key], args=[token]
+                )
+            except redis.RedisError:
+                pass
+
+    logger.debug("Single-flight wait (redis) %s", key)
+    deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_MS / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+        result = await read_result()
+        if result is not None:
+            return result
+        try:
+            error_payload = await asyncio.to_thread(redis_client.get, error_key)
+            if error_payload:
+                error = json.loads(error_payload.decode("utf-8"))
+                raise HTTPException(status_code=error.get("status", 502), detail=error.get("detail"))
+            if not await asyncio.to_thread(redis_client.exists, lock_key):
+                break
+        except (redis.RedisError, json.JSONDecodeError) as exc:
+            logger.warning("Single-flight poll failed: %s", str(exc))
+            break
+    return await fn()
+
+
+def get_local_cache():
+    global _local_cache
+    if not LOCAL_CACHE_ENABLED:
+        return None
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                try:
+                    _local_cache = LocalSharedCache(LOCAL_CACHE_PATH, LOCAL_CACHE_MAX_BYTES)
+                except sqlite3.Error as exc:
+                    logger.warning("Local shared cache unavailable at %s: %s", LOCAL_CACHE_PATH, str(exc))
+                    return None
+    return _local_cache
 
 
 def oc_base_args():
@@ -118,14 +1027,8 @@ def oc_base_args():
     ]
 
 
-def run_oc(args, expect_json=False):
-    logger.debug("oc %s", " ".join(args))
-    result = subprocess.run(
-        oc_base_args() + args,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+def check_oc_result(args, result, expect_json=False):
+    """Maps a finished oc call to its output, or to the HTTPException every runner raises."""
     if result.returncode != 0:
         detail = (result.stderr or result.stdout).strip()
         logger.error("oc error (%s): %s", " ".join(args), detail)
@@ -140,79 +1043,56 @@ def run_oc(args, expect_json=False):
     return result.stdout
 
 
+def run_oc(args, expect_json=False):
+    logger.debug("oc %s", " ".join(args))
+    return check_oc_result(args, exec_oc(args, timeout=30), expect_json)
+
+
 def run_oc_input(args, input_data, expect_json=False):
     logger.debug("oc %s", " ".join(args))
-    result = subprocess.run(
-        oc_base_args() + args,
-        input=input_data,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    if result.returncode != 0:
-        detail = (result.stderr or result.stdout).strip()
-        logger.error("oc error (%s): %s", " ".join(args), detail)
-        status = 403 if "forbidden" in detail.lower() else 500
-        raise HTTPException(status_code=status, detail=f"oc error: {detail}")
-    if expect_json:
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError as exc:
-            logger.error("oc json parse error (%s): %s", " ".join(args), str(exc))
-            raise HTTPException(status_code=500, detail=f"oc output parse error: {str(exc)}")
-    return result.stdout
+    return check_oc_result(args, exec_oc(args, input=input_data, timeout=30), expect_json)
 
 
 def run_oc_with_timeout(args, timeout_seconds=30, expect_json=False):
     logger.debug("oc %s", " ".join(args))
-    result = subprocess.run(
-        oc_base_args() + args,
-        capture_output=True,
-        text=True,
-        timeout=timeout_seconds,
-    )
-    if result.returncode != 0:
-        detail = (result.stderr or result.stdout).strip()
-        logger.error("oc error (%s): %s", " ".join(args), detail)
-        status = 403 if "forbidden" in detail.lower() else 500
-        raise HTTPException(status_code=status, detail=f"oc error: {detail}")
-    if expect_json:
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError as exc:
-            logger.error("oc json parse error (%s): %s", " ".join(args), str(exc))
-            raise HTTPException(status_code=500, detail=f"oc output parse error: {str(exc)}")
-    return result.stdout
+    return check_oc_result(args, exec_oc(args, timeout=timeout_seconds), expect_json)
 
 
 def run_oc_capture(args, timeout_seconds=30):
     logger.debug("oc %s", " ".join(args))
-    return subprocess.run(
-        oc_base_args() + args,
-        capture_output=True,
-        text=True,
-        timeout=timeout_seconds,
-    )
+    return exec_oc(args, timeout=timeout_seconds)
 
 
 def run_oc_allow_timeout(args, timeout_seconds=15):
     logger.debug("oc %s", " ".join(args))
     try:
-        result = subprocess.run(
-            oc_base_args() + args,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-        )
+        result = exec_oc(args, timeout=timeout_seconds)
     except subprocess.TimeoutExpired:
         logger.warning("oc command timed out (continuing): %s", " ".join(args))
         return None
-    if result.returncode != 0:
-        detail = (result.stderr or result.stdout).strip()
-        logger.error("oc error (%s): %s", " ".join(args), detail)
-        status = 403 if "forbidden" in detail.lower() else 500
-        raise HTTPException(status_code=status, detail=f"oc error: {detail}")
-    return result.stdout
+    return check_oc_result(args, result)
+
+
+async def run_oc_async(args, expect_json=False, input_data=None, timeout_seconds=30):
+    """run_oc / run_oc_input / run_oc_with_timeout for async handlers."""
+    logger.debug("oc %s", " ".join(args))
+    result = await exec_oc_async(args, input_data=input_data, timeout=timeout_seconds)
+    return check_oc_result(args, result, expect_json)
+
+
+async def run_oc_capture_async(args, input_data=None, timeout_seconds=30):
+    logger.debug("oc %s", " ".join(args))
+    return await exec_oc_async(args, input_data=input_data, timeout=timeout_seconds)
+
+
+async def run_oc_allow_timeout_async(args, timeout_seconds=15):
+    logger.debug("oc %s", " ".join(args))
+    try:
+        result = await exec_oc_async(args, timeout=timeout_seconds)
+    except subprocess.TimeoutExpired:
+        logger.warning("oc command timed out (continuing): %s", " ".join(args))
+        return None
+    return check_oc_result(args, result)
 
 
 def truncate_log(text: str, limit: int = 8000) -> str:
@@ -225,30 +1105,519 @@ def truncate_log(text: str, limit: int = 8000) -> str:
 
 def run_oc_raw(path: str, expect_json=False):
     logger.debug("oc get --raw %s", path)
-    result = subprocess.run(
-        oc_base_args() + ["get", "--raw", path],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    if result.returncode != 0:
-        detail = (result.stderr or result.stdout).strip()
-        logger.error("oc raw error (%s): %s", path, detail)
-        status = 403 if "forbidden" in detail.lower() else 500
-        raise HTTPException(status_code=status, detail=f"oc error: {detail}")
-    if expect_json:
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError as exc:
-            logger.error("oc raw json parse error (%s): %s", path, str(exc))
-            raise HTTPException(status_code=500, detail=f"oc output parse error: {str(exc)}")
-    return result.stdout
-
+    args = ["get", "--raw", path]
+    return check_oc_result(args, exec_oc(args, timeout=30), expect_json)
+
+
+KUBE_RESOURCES = {
+    "deployments": ("/apis/apps/v1", True),
+    "deploymentconfigs": ("/apis/apps.openshift.io/v1", True),
+    "services": ("/api/v1", True),
+    "pods": ("/api/v1", True),
+    "configmaps": ("/api/v1", True),
+    "projects": ("/apis/project.openshift.io/v1", False),
+}
+
+KUBE_WORKLOAD_RESOURCES = {
+    "deployment": "deployments",
+    "deploymentconfig": "deploymentconfigs",
+}
+
+
+class KubeApiClient:
+    """In-process REST client for the Kubernetes/OpenShift API.
+
+    Holds one pooled keep-alive connection set (HTTP/2 when `h2` is installed)
+    so reads skip the per-call `oc` process startup and TLS handshake. Errors
+    are mapped to the same HTTPException shapes `run_oc` produces.
+    """
+
+    def __init__(self, server: str, token: str):
+        self.server = server.rstrip("/")
+        http2 = KUBE_API_HTTP2 and importlib.util.find_spec("h2") is not None
+        self.http2 = http2
+        self.watch_client = None
+        self.client = httpx.Client(
+            base_url=self.server,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+            },
+            verify=False,
+            http2=http2,
+            timeout=httpx.Timeout(KUBE_API_TIMEOUT_SECONDS, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=KUBE_API_MAX_CONNECTIONS,
+                max_keepalive_connections=KUBE_API_MAX_CONNECTIONS,
+            ),
+        )
+        logger.info("Kubernetes API client ready (http2=%s)", "yes" if http2 else "no")
+
+    def resource_path(self, resource: str, namespace: Optional[str] = None, name: Optional[str] = None):
+        prefix, namespaced = KUBE_RESOURCES[resource]
+        path = prefix
+        if namespaced and namespace:
+            path += f"/namespaces/{urllib.parse.quote(namespace, safe='')}"
+        path += f"/{resource}"
+        if name:
+            path += f"/{urllib.parse.quote(name, safe='')}"
+        return path
 
-def is_missing_resource_error(detail: str, resource: str) -> bool:
-    if not detail:
-        return False
-    detail_lower = detail.lower()
+    def request(self, method: str, path: str, resource: str = "", name: str = "", missing_ok=False, **kwargs):
+        logger.debug("api %s %s", method, path)
+        started = time.monotonic()
+        try:
+            with trace_span("kube-api", method=method, resource=resource or "raw"):
+                response = self.client.request(method, path, **kwargs)
+        except httpx.TimeoutException as exc:
+            KUBE_API_REQUEST_SECONDS.labels(method, resource or "raw", "timeout").observe(time.monotonic() - started)
+            logger.error("api timeout (%s %s): %s", method, path, str(exc))
+            raise HTTPException(status_code=504, detail=f"API error: request timed out: {path}")
+        except httpx.HTTPError as exc:
+            KUBE_API_REQUEST_SECONDS.labels(method, resource or "raw", "error").observe(time.monotonic() - started)
+            logger.error("api transport error (%s %s): %s", method, path, str(exc))
+            raise HTTPException(status_code=500, detail=f"API error: {str(exc)}")
+        KUBE_API_REQUEST_SECONDS.labels(
+            method,
+            resource or "raw",
+            str(response.status_code // 100) + "xx",
+        ).observe(time.monotonic() - started)
+        if response.status_code == 404 and missing_ok:
+            return None
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message") or response.text
+            except ValueError:
+                message = response.text
+            message = (message or f"HTTP {response.status_code}").strip()
+            if response.status_code == 404 and resource and not name:
+                message = f'the server doesn\'t have a resource type "{resource}"'
+            logger.error("api error (%s %s): %s", method, path, message)
+            status = 403 if response.status_code == 403 or "forbidden" in message.lower() else 500
+            raise HTTPException(status_code=status, detail=f"API error: {message}")
+        return response
+
+    def request_json(self, method: str, path: str, **kwargs):
+        response = self.request(method, path, **kwargs)
+        if response is None:
+            return None
+        try:
+            return response.json()
+        except ValueError as exc:
+            logger.error("api json parse error (%s): %s", path, str(exc))
+            raise HTTPException(status_code=500, detail=f"API output parse error: {str(exc)}")
+
+    def watch(self, resource: str, namespace: Optional[str], resource_version: str, timeout_seconds: int, on_connected=None):
+        # Watches hold a connection open for minutes, so they get their own
+        # unbounded pool and never starve regular reads.
+        if self.watch_client is None:
+            self.watch_client = httpx.Client(
+                base_url=self.server,
+                headers=self.client.headers,
+                verify=False,
+                http2=self.http2,
+                timeout=httpx.Timeout(timeout_seconds + 30, connect=5.0, read=KUBE_INFORMER_SILENCE_SECONDS),
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+            )
+        params = {
+            "watch": "1",
+            "allowWatchBookmarks": "true",
+            "resourceVersion": resource_version,
+            "timeoutSeconds": str(timeout_seconds),
+        }
+        path = self.resource_path(resource, namespace)
+        logger.debug("api WATCH %s rv=%s", path, resource_version)
+        with self.watch_client.stream("GET", path, params=params) as response:
+            if response.status_code >= 400:
+                response.read()
+                raise HTTPException(status_code=500, detail=f"API error: watch {path} HTTP {response.status_code}")
+            if on_connected is not None:
+                on_connected()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def list(self, resource: str, namespace: Optional[str] = None, label_selector: Optional[str] = None):
+        params = {"labelSelector": label_selector} if label_selector else None
+        return self.request_json("GET", self.resource_path(resource, namespace), resource=resource, params=params)
+
+    def get(self, resource: str, name: str, namespace: Optional[str] = None, missing_ok=False):
+        return self.request_json(
+            "GET",
+            self.resource_path(resource, namespace, name),
+            resource=resource,
+            name=name,
+            missing_ok=missing_ok,
+        )
+
+    def create(self, resource: str, namespace: str, body: dict):
+        return self.request_json("POST", self.resource_path(resource, namespace), resource=resource, json=body)
+
+    def patch(self, resource: str, name: str, namespace: str, body: dict, subresource: str = ""):
+        path = self.resource_path(resource, namespace, name)
+        if subresource:
+            path += f"/{subresource}"
+        return self.request_json(
+            "PATCH",
+            path,
+            resource=resource,
+            name=name,
+            content=json.dumps(body),
+            headers={"Content-Type": "application/strategic-merge-patch+json"},
+        )
+
+    def delete(self, resource: str, name: str, namespace: str):
+        self.request(
+            "DELETE",
+            self.resource_path(resource, namespace, name),
+            resource=resource,
+            name=name,
+            missing_ok=True,
+        )
+
+    def raw(self, path: str):
+        return self.request("GET", path).text
+
+
+def get_kube_client():
+    global _kube_client
+    if KUBE_CLIENT != "api" or not KUBERNETES_TOKEN:
+        return None
+    if _kube_client is None:
+        with _kube_client_lock:
+            if _kube_client is None:
+                _kube_client = KubeApiClient(KUBERNETES_API_SERVER, KUBERNETES_TOKEN)
+    return _kube_client
+
+
+def strip_managed_fields(item: dict):
+    metadata = item.get("metadata")
+    if isinstance(metadata, dict):
+        metadata.pop("managedFields", None)
+    return item
+
+
+class ResourceInformer:
+    """Keeps one namespace's collection of a resource current in memory.
+
+    The first read does a LIST inline (so API errors surface to the caller
+    exactly as before); a daemon thread then follows a WATCH with bookmarks,
+    relists every KUBE_INFORMER_RESYNC_SECONDS or on 410 Gone, and exits once
+    nobody has read the store for KUBE_INFORMER_IDLE_SECONDS. Reads fall back to
+    an inline relist whenever the watch is down and the store is older than
+    KUBE_INFORMER_STALE_SECONDS. The watch only counts as up once the API server
+    has answered it, and only while it has delivered an event or bookmark within
+    KUBE_INFORMER_SILENCE_SECONDS.
+    """
+
+    def __init__(self, client: KubeApiClient, resource: str, namespace: str):
+        self.client = client
+        self.resource = resource
+        self.namespace = namespace
+        self.store = {}
+        self.resource_version = ""
+        self.synced = False
+        self.connected = False
+        self.healthy_at = 0.0
+        self.listed_at = 0.0
+        self.accessed_at = time.monotonic()
+        self.missing_error = None
+        self.missing_at = 0.0
+        self.stopped = False
+        self.thread = None
+        self.lock = threading.Lock()
+        self.list_lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        if not self.synced:
+            return False
+        age = time.monotonic() - self.healthy_at
+        return age <= KUBE_INFORMER_STALE_SECONDS or (self.connected and age <= KUBE_INFORMER_SILENCE_SECONDS)
+
+    def mark_connected(self):
+        with self.lock:
+            self.connected = True
+            self.healthy_at = time.monotonic()
+
+    def relist(self):
+        data = self.client.list(self.resource, self.namespace)
+        store = {}
+        for item in data.get("items", []) or []:
+            name = item.get("metadata", {}).get("name")
+            if name:
+                store[name] = strip_managed_fields(item)
+        now = time.monotonic()
+        with self.lock:
+            self.store = store
+            self.resource_version = (data.get("metadata", {}) or {}).get("resourceVersion", "")
+            self.synced = True
+            self.healthy_at = now
+            self.listed_at = now
+        logger.debug("Informer %s/%s listed items=%s", self.namespace, self.resource, len(store))
+
+    def ensure_synced(self):
+        self.accessed_at = time.monotonic()
+        if self.missing_error is not None:
+            # Resource types absent from the cluster (deploymentconfigs on plain
+            # Kubernetes) are re-probed once per resync instead of on every read.
+            if time.monotonic() - self.missing_at < KUBE_INFORMER_RESYNC_SECONDS:
+                raise self.missing_error
+            self.missing_error = None
+        if not self.is_fresh():
+            with self.list_lock:
+                if not self.is_fresh():
+                    try:
+                        self.relist()
+                    except HTTPException as exc:
+                        detail = getattr(exc, "detail", "")
+                        if isinstance(detail, str) and is_missing_resource_error(detail, self.resource):
+                            self.missing_error = exc
+                            self.missing_at = time.monotonic()
+                        raise
+        if self.thread is None:
+            with self.list_lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(
+                        target=self.run,
+                        name=f"informer-{self.namespace}-{self.resource}",
+                        daemon=True,
+                    )
+                    self.thread.start()
+
+    def items(self):
+        self.ensure_synced()
+        with self.lock:
+            return list(self.store.values())
+
+    def get(self, name: str):
+        self.ensure_synced()
+        with self.lock:
+            return self.store.get(name)
+
+    def apply_event(self, event: dict):
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        if event_type == "ERROR":
+            # 410 Gone means our resourceVersion fell out of the watch window.
+            logger.info("Informer %s/%s watch error: %s", self.namespace, self.resource, obj.get("message"))
+            with self.lock:
+                self.synced = False
+            return False
+        metadata = obj.get("metadata", {}) or {}
+        with self.lock:
+            if metadata.get("resourceVersion"):
+                self.resource_version = metadata["resourceVersion"]
+            self.healthy_at = time.monotonic()
+            name = metadata.get("name")
+            if not name or event_type == "BOOKMARK":
+                return True
+            if event_type == "DELETED":
+                self.store.pop(name, None)
+            else:
+                self.store[name] = strip_managed_fields(obj)
+        return True
+
+    def run(self):
+        backoff = 1
+        while not self.stopped:
+            if time.monotonic() - self.accessed_at > KUBE_INFORMER_IDLE_SECONDS:
+                logger.info("Informer %s/%s idle, stopping", self.namespace, self.resource)
+                break
+            try:
+                if not self.synced or time.monotonic() - self.listed_at >= KUBE_INFORMER_RESYNC_SECONDS:
+                    with self.list_lock:
+                        self.relist()
+                remaining = KUBE_INFORMER_RESYNC_SECONDS - (time.monotonic() - self.listed_at)
+                timeout_seconds = int(max(1, min(remaining, 300)))
+                events = self.client.watch(
+                    self.resource,
+                    self.namespace,
+                    self.resource_version,
+                    timeout_seconds,
+                    on_connected=self.mark_connected,
+                )
+                for event in events:
+                    if not self.apply_event(event) or self.stopped:
+                        break
+                backoff = 1
+            except Exception as exc:
+                logger.warning("Informer %s/%s watch failed: %s", self.namespace, self.resource, str(exc))
+                self.connected = False
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                self.connected = False
+        with _informers_lock:
+            if _informers.get((self.resource, self.namespace)) is self:
+                _informers.pop((self.resource, self.namespace), None)
+        self.stopped = True
+
+
+INFORMER_RESOURCES = ("deployments", "deploymentconfigs", "services", "pods", "configmaps")
+
+
+def get_informer(resource: str, namespace: Optional[str]):
+    if not KUBE_INFORMER_ENABLED or not namespace or resource not in INFORMER_RESOURCES:
+        return None
+    client = get_kube_client()
+    if client is None:
+        return None
+    key = (resource, namespace)
+    with _informers_lock:
+        informer = _informers.get(key)
+        if informer is None or informer.stopped:
+            informer = ResourceInformer(client, resource, namespace)
+            _informers[key] = informer
+    return informer
+
+
+def parse_label_selector(label_selector: str):
+    requirements = []
+    for part in re.split(r",(?![^()]*\))", label_selector or ""):
+        part = part.strip()
+        if not part:
+            continue
+        set_match = re.match(r"^([^\s!=]+)\s+(in|notin)\s+\((.*)\)$", part)
+        if set_match:
+            values = {value.strip() for value in set_match.group(3).split(",") if value.strip()}
+            requirements.append((set_match.group(1), set_match.group(2), values))
+        elif "!=" in part:
+            key, value = part.split("!=", 1)
+            requirements.append((key.strip(), "notin", {value.strip()}))
+        elif "=" in part:
+            key, value = part.replace("==", "=", 1).split("=", 1)
+            requirements.append((key.strip(), "in", {value.strip()}))
+        elif part.startswith("!"):
+            requirements.append((part[1:].strip(), "!", None))
+        else:
+            requirements.append((part, "exists", None))
+    return requirements
+
+
+def matches_label_selector(labels: dict, requirements) -> bool:
+    labels = labels or {}
+    for key, operator, values in requirements:
+        if operator == "in" and labels.get(key) not in values:
+            return False
+        if operator == "notin" and key in labels and labels.get(key) in values:
+            return False
+        if operator == "exists" and key not in labels:
+            return False
+        if operator == "!" and key in labels:
+            return False
+    return True
+
+
+def kube_list(resource: str, namespace: Optional[str] = None, label_selector: Optional[str] = None):
+    informer = get_informer(resource, namespace)
+    if informer is not None:
+        items = informer.items()
+        if label_selector:
+            requirements = parse_label_selector(label_selector)
+            items = [
+                item for item in items
+                if matches_label_selector(item.get("metadata", {}).get("labels"), requirements)
+            ]
+        return {"items": items}
+    client = get_kube_client()
+    if client is not None:
+        return client.list(resource, namespace, label_selector)
+    return run_oc(oc_list_args(resource, namespace, label_selector), expect_json=True)
+
+
+def oc_list_args(resource: str, namespace: Optional[str], label_selector: Optional[str]):
+    args = ["get", resource]
+    if namespace:
+        args += ["-n", namespace]
+    if label_selector:
+        args += ["-l", label_selector]
+    return args + ["-o", "json"]
+
+
+async def kube_list_async(resource: str, namespace: Optional[str] = None, label_selector: Optional[str] = None):
+    """kube_list for async handlers: informer and API reads go to a thread, oc runs as an asyncio subprocess."""
+    if get_informer(resource, namespace) is not None or get_kube_client() is not None:
+        return await asyncio.to_thread(kube_list, resource, namespace, label_selector)
+    return await run_oc_async(oc_list_args(resource, namespace, label_selector), expect_json=True)
+
+
+def kube_get(resource: str, name: str, namespace: str):
+    client = get_kube_client()
+    if client is not None:
+        return client.get(resource, name, namespace)
+    return run_oc(["get", resource, name, "-n", namespace, "-o", "json"], expect_json=True)
+
+
+def kube_get_raw(path: str, expect_json=False):
+    client = get_kube_client()
+    if client is None:
+        return run_oc_raw(path, expect_json=expect_json)
+    if expect_json:
+        return client.request_json("GET", path)
+    return client.raw(path)
+
+
+async def kube_scale(workload_kind: str, name: str, namespace: str, replicas: int):
+    client = get_kube_client()
+    if client is None:
+        await run_oc_async(["scale", f"{workload_kind}/{name}", "-n", namespace, f"--replicas={replicas}"])
+        return
+    resource = KUBE_WORKLOAD_RESOURCES[workload_kind]
+    await asyncio.to_thread(
+        client.patch, resource, name, namespace, {"spec": {"replicas": replicas}}, subresource="scale"
+    )
+
+
+async def kube_set_env(workload_kind: str, name: str, namespace: str, env_vars):
+    client = get_kube_client()
+    if client is None:
+        await run_oc_async(["set", "env", f"{workload_kind}/{name}", "-n", namespace] + env_vars)
+        return
+    await asyncio.to_thread(patch_workload_env, client, workload_kind, name, namespace, env_vars)
+
+
+def patch_workload_env(client: KubeApiClient, workload_kind: str, name: str, namespace: str, env_vars):
+    resource = KUBE_WORKLOAD_RESOURCES[workload_kind]
+    workload = client.get(resource, name, namespace)
+    env = []
+    for item in env_vars:
+        key, value = item.split("=", 1)
+        env.append({"name": key, "value": value})
+    containers = workload.get("spec", {}).get("template", {}).get("spec", {}).get("containers", []) or []
+    patch = {
+        "spec": {
+            "template": {
+                "spec": {
+                    "containers": [{"name": container.get("name"), "env": env} for container in containers],
+                },
+            },
+        },
+    }
+    client.patch(resource, name, namespace, patch)
+
+
+async def kube_rollout_latest(name: str, namespace: str):
+    client = get_kube_client()
+    if client is None:
+        await run_oc_async(["rollout", "latest", f"deploymentconfig/{name}", "-n", namespace])
+        return
+    path = client.resource_path("deploymentconfigs", namespace, name) + "/instantiate"
+    body = {
+        "kind": "DeploymentRequest",
+        "apiVersion": "apps.openshift.io/v1",
+        "name": name,
+        "latest": True,
+        "force": True,
+    }
+    await asyncio.to_thread(
+        client.request_json, "POST", path, resource="deploymentconfigs", name=name, json=body
+    )
+
+
+def is_missing_resource_error(detail: str, resource: str) -> bool:
+    if not detail:
+        return False
+    detail_lower = detail.lower()
     resource_lower = resource.lower()
     return f'resource type "{resource_lower}"' in detail_lower or (
         "resource type" in detail_lower and resource_lower in detail_lower
@@ -314,37 +1683,45 @@ def build_resource_map(items):
     return resource_map
 
 
-def get_deployment_maps(namespace: str):
-    deployments = {}
-    deploymentconfigs = {}
-
-    try:
-        data = run_oc(["get", "deployments", "-n", namespace, "-o", "json"], expect_json=True)
-        deployments = build_resource_map(data.get("items", []))
-    except HTTPException as exc:
-        detail = getattr(exc, "detail", "")
-        if not (isinstance(detail, str) and (
-            is_missing_resource_error(detail, "deployments") or is_missing_resource_error(detail, "deployment")
-        )):
-            raise
-
-    try:
-        data = run_oc(["get", "deploymentconfigs", "-n", namespace, "-o", "json"], expect_json=True)
-        deploymentconfigs = build_resource_map(data.get("items", []))
-    except HTTPException as exc:
-        detail = getattr(exc, "detail", "")
-        if not (isinstance(detail, str) and (
-            is_missing_resource_error(detail, "deploymentconfigs")
-            or is_missing_resource_error(detail, "deploymentconfig")
-        )):
+async def get_deployment_maps(namespace: str):
+    async def load_map(kind: str, resource: str):
+        try:
+            data = await kube_list_async(resource, namespace)
+        except HTTPException as exc:
+            detail = getattr(exc, "detail", "")
+            if isinstance(detail, str) and (
+                is_missing_resource_error(detail, resource) or is_missing_resource_error(detail, kind)
+            ):
+                return {}
             raise
+        return build_resource_map(data.get("items", []))
 
+    deployments, deploymentconfigs = await asyncio.gather(
+        load_map("deployment", "deployments"),
+        load_map("deploymentconfig", "deploymentconfigs"),
+    )
     return deployments, deploymentconfigs
 
 
-def get_workload(namespace: str, name: str):
+def get_informer_workload(namespace: str, name: str):
+    for kind, resource in KUBE_WORKLOAD_RESOURCES.items():
+        try:
+            item = get_informer(resource, namespace).get(name)
+        except HTTPException as exc:
+            detail = getattr(exc, "detail", "")
+            if isinstance(detail, str) and is_missing_resource_error(detail, resource):
+                continue
+            raise
+        if item:
+            return kind, item
+    return None, None
+
+
+async def get_workload(namespace: str, name: str):
     logger.info("Resolving workload %s in namespace %s", name, namespace)
-    deployments, deploymentconfigs = get_deployment_maps(namespace)
+    if get_informer("deployments", namespace) is not None:
+        return await asyncio.to_thread(get_informer_workload, namespace, name)
+    deployments, deploymentconfigs = await get_deployment_maps(namespace)
     if name in deployments:
         return "deployment", deployments[name]
     if name in deploymentconfigs:
@@ -367,7 +1744,7 @@ def get_running_pod(namespace: str, label_selector: str):
         return None
     logger.info("Finding running pod in %s with selector %s", namespace, label_selector)
     try:
-        data = run_oc(["get", "pods", "-n", namespace, "-l", label_selector, "-o", "json"], expect_json=True)
+        data = kube_list("pods", namespace, label_selector)
     except HTTPException as exc:
         detail = getattr(exc, "detail", "")
         if isinstance(detail, str) and is_missing_resource_error(detail, "pods"):
@@ -379,7 +1756,7 @@ def get_running_pod(namespace: str, label_selector: str):
                 if isinstance(inner_detail, str) and is_missing_resource_error(inner_detail, "pod"):
                     logger.warning("pod resource missing, falling back to raw API")
                     query = urllib.parse.urlencode({"labelSelector": label_selector})
-                    data = run_oc_raw(f"/api/v1/namespaces/{namespace}/pods?{query}", expect_json=True)
+                    data = kube_get_raw(f"/api/v1/namespaces/{namespace}/pods?{query}", expect_json=True)
                 else:
                     raise
         else:
@@ -406,7 +1783,7 @@ def is_pod_ready(pod: dict) -> bool:
 def count_ready_pods(namespace: str, label_selector: str) -> int:
     if not label_selector:
         return 0
-    data = run_oc(["get", "pods", "-n", namespace, "-l", label_selector, "-o", "json"], expect_json=True)
+    data = kube_list("pods", namespace, label_selector)
     ready = 0
     for pod in data.get("items", []) or []:
         if is_pod_ready(pod):
@@ -417,7 +1794,7 @@ def count_ready_pods(namespace: str, label_selector: str) -> int:
 def count_pod_restarts(namespace: str, label_selector: str) -> int:
     if not label_selector:
         return 0
-    data = run_oc(["get", "pods", "-n", namespace, "-l", label_selector, "-o", "json"], expect_json=True)
+    data = kube_list("pods", namespace, label_selector)
     total = 0
     for pod in data.get("items", []) or []:
         statuses = pod.get("status", {}).get("containerStatuses", []) or []
@@ -445,32 +1822,47 @@ def select_target_pod(pods):
     return candidates[0]
 
 
-def wait_for_pod_running(namespace: str, pod_name: str, timeout_seconds=60):
-    timeout_arg = f"{max(1, int(timeout_seconds))}s"
+async def wait_for_pod_running(namespace: str, pod_name: str, timeout_seconds=60):
+    timeout_seconds = max(1, int(timeout_seconds))
+    client = get_kube_client()
+    if client is not None:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            pod = await asyncio.to_thread(client.get, "pods", pod_name, namespace, missing_ok=True)
+            if pod and is_pod_ready(pod):
+                return pod
+            if time.monotonic() >= deadline:
+                raise HTTPException(status_code=504, detail="Timed out waiting for debug pod readiness")
+            await asyncio.sleep(1)
     try:
-        run_oc([
-            "wait",
-            "--for=condition=Ready",
-            f"pod/{pod_name}",
-            "-n",
-            namespace,
-            f"--timeout={timeout_arg}",
-        ])
+        # oc enforces --timeout itself; the subprocess limit only guards against a hung client.
+        await run_oc_async(
+            [
+                "wait",
+                "--for=condition=Ready",
+                f"pod/{pod_name}",
+                "-n",
+                namespace,
+                f"--timeout={timeout_seconds}s",
+            ],
+            timeout_seconds=timeout_seconds + 15,
+        )
     except HTTPException as exc:
         detail = getattr(exc, "detail", "")
         message = detail if isinstance(detail, str) else "Timed out waiting for debug pod readiness"
         raise HTTPException(status_code=504, detail=message)
-    return run_oc(["get", "pod", pod_name, "-n", namespace, "-o", "json"], expect_json=True)
+    return await run_oc_async(["get", "pod", pod_name, "-n", namespace, "-o", "json"], expect_json=True)
 
 
-def build_debug_pod_manifest(
+async def build_debug_pod_manifest(
     namespace: str,
     workload_kind: str,
     workload_name: str,
     debug_pod_name: str,
     image: str,
+    sleep_seconds: int = 3600,
 ) -> dict:
-    debug_spec = run_oc(
+    debug_spec = await run_oc_async(
         [
             "debug",
             f"{workload_kind}/{workload_name}",
@@ -483,7 +1875,7 @@ def build_debug_pod_manifest(
             "--",
             "/bin/sh",
             "-c",
-            "sleep 3600",
+            f"sleep {int(sleep_seconds)}",
         ],
         expect_json=True,
     )
@@ -503,14 +1895,302 @@ def build_debug_pod_manifest(
     return debug_spec
 
 
-def apply_debug_pod(manifest: dict):
+async def apply_debug_pod(manifest: dict):
+    client = get_kube_client()
+    if client is not None:
+        namespace = manifest.get("metadata", {}).get("namespace")
+        return await asyncio.to_thread(client.create, "pods", namespace, manifest)
     payload = json.dumps(manifest)
-    return run_oc_input(["apply", "-f", "-"], payload)
+    return await run_oc_async(["apply", "-f", "-"], input_data=payload)
+
+
+async def delete_debug_pod(namespace: str, pod_name: str):
+    client = get_kube_client()
+    if client is None:
+        await run_oc_allow_timeout_async(
+            ["delete", "pod", pod_name, "-n", namespace, "--ignore-not-found=true"],
+            timeout_seconds=10,
+        )
+        return
+    try:
+        await asyncio.to_thread(client.delete, "pods", pod_name, namespace)
+    except HTTPException as exc:
+        logger.warning("Debug pod delete failed (continuing) %s: %s", pod_name, exc.detail)
+
+
+async def annotate_pod(namespace: str, pod_name: str, annotations: dict, resource_version: str = ""):
+    """Sets pod annotations; with resource_version, only if the pod has not changed since it was read."""
+    client = get_kube_client()
+    if client is None:
+        args = ["annotate", "pod", pod_name, "-n", namespace, "--overwrite"]
+        args += [f"{key}={value}" for key, value in annotations.items()]
+        if resource_version:
+            args.append(f"--resource-version={resource_version}")
+        await run_oc_async(args)
+        return
+    metadata = {"annotations": annotations}
+    if resource_version:
+        metadata["resourceVersion"] = resource_version
+    await asyncio.to_thread(client.patch, "pods", pod_name, namespace, {"metadata": metadata})
+
+
+DEBUG_POOL_LABEL = "openshift-dashboard/debug-pool"
+DEBUG_POOL_CREATED_ANNOTATION = "openshift-dashboard/created-at"
+DEBUG_POOL_LEASE_ANNOTATION = "openshift-dashboard/leased-until"
+DEBUG_POOL_IDLE_ANNOTATION = "openshift-dashboard/idle-since"
+DEBUG_POOL_JAR_ANNOTATION = "openshift-dashboard/agent-jar-sha256"
+# Longest an agent run may hold a pod: readiness wait, two copies and the exec.
+DEBUG_POD_LEASE_SECONDS = 300
+DEBUG_POD_POOL_REAP_SECONDS = 60
+
+
+class DebugPodLease:
+    def __init__(self, namespace: str, pod_name: str, pool_key: str, reused: bool, jar_sha256: str):
+        self.namespace = namespace
+        self.pod_name = pod_name
+        self.pool_key = pool_key
+        self.reused = reused
+        self.jar_sha256 = jar_sha256
+
+
+class DebugPodPool:
+    """Warm, idle debug pods for agent runs, shared by all workers and replicas through the cluster.
+
+    Pods are pooled per namespace, image and workload pod template: a debug pod
+    carries its workload's env and volumes, which is what the agent reads, so
+    only workloads with identical templates may share one. The pool's state
+    lives on the pods themselves (a label with the pool key, annotations with
+    the lease expiry, idle time and agent jar hash). A lease is an annotation
+    update conditioned on the pod's resourceVersion, so two runs never get the
+    same pod. Pods sleep for DEBUG_POD_POOL_MAX_AGE_SECONDS and then exit,
+    which bounds the cost of any pod the reaper misses.
+    """
+
+    def __init__(self):
+        self.namespaces = set()
+        self.jar_digest = None
+        self.reaper_task = None
+
+    @staticmethod
+    def pool_key(namespace: str, image: str, workload: dict) -> str:
+        template_hash = workload_template_hash(get_workload_resource(workload) or workload)
+        return hashlib.blake2b(f"{namespace}\0{image}\0{template_hash}".encode("utf-8"), digest_size=8).hexdigest()
+
+    def agent_jar_sha256(self) -> str:
+        stat = os.stat(SPRING_CONFIG_AGENT_JAR_PATH)
+        if self.jar_digest is not None and self.jar_digest[:2] == (stat.st_mtime_ns, stat.st_size):
+            return self.jar_digest[2]
+        hasher = hashlib.sha256()
+        with open(SPRING_CONFIG_AGENT_JAR_PATH, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(block)
+        self.jar_digest = (stat.st_mtime_ns, stat.st_size, hasher.hexdigest())
+        return self.jar_digest[2]
+
+    @staticmethod
+    def annotation_time(pod: dict, name: str) -> float:
+        value = (pod.get("metadata", {}).get("annotations") or {}).get(name)
+        try:
+            return float(value) if value else 0.0
+        except ValueError:
+            return 0.0
+
+    def is_leasable(self, pod: dict, now: float) -> bool:
+        if pod.get("metadata", {}).get("deletionTimestamp"):
+            return False
+        if pod.get("status", {}).get("phase") != "Running" or not is_pod_ready(pod):
+            return False
+        if self.annotation_time(pod, DEBUG_POOL_LEASE_ANNOTATION) > now:
+            return False
+        # A pod that would exit mid-run is left for the reaper.
+        created = self.annotation_time(pod, DEBUG_POOL_CREATED_ANNOTATION)
+        return created + DEBUG_POD_POOL_MAX_AGE_SECONDS - DEBUG_POD_LEASE_SECONDS > now
+
+    def is_expired(self, pod: dict, now: float) -> bool:
+        if pod.get("metadata", {}).get("deletionTimestamp"):
+            return False
+        if pod.get("status", {}).get("phase") not in ("Pending", "Running"):
+            return True
+        created = self.annotation_time(pod, DEBUG_POOL_CREATED_ANNOTATION)
+        if created + DEBUG_POD_POOL_MAX_AGE_SECONDS < now:
+            return True
+        leased_until = self.annotation_time(pod, DEBUG_POOL_LEASE_ANNOTATION)
+        if leased_until > now:
+            return False
+        last_used = max(created, leased_until, self.annotation_time(pod, DEBUG_POOL_IDLE_ANNOTATION))
+        return last_used + DEBUG_POD_POOL_IDLE_SECONDS < now
+
+    async def list_pods(self, namespace: str, pool_key: str = ""):
+        # Read past the informer: a lease decided on a watch cache that has not yet
+        # seen the last release would start a new pod instead of reusing that one.
+        selector = f"{DEBUG_POOL_LABEL}={pool_key}" if pool_key else DEBUG_POOL_LABEL
+        client = get_kube_client()
+        if client is not None:
+            data = await asyncio.to_thread(client.list, "pods", namespace, selector)
+        else:
+            data = await run_oc_async(oc_list_args("pods", namespace, selector), expect_json=True)
+        return data.get("items", []) or []
+
+    async def lease(self, namespace: str, workload_kind: str, workload_name: str, workload: dict, image: str):
+        """A ready debug pod for this workload: an idle pooled one if any, else a new one."""
+        self.namespaces.add(namespace)
+        self.start_reaper()
+        pool_key = self.pool_key(namespace, image, workload)
+        now = time.time()
+        for pod in await self.list_pods(namespace, pool_key):
+            if not self.is_leasable(pod, now):
+                continue
+            metadata = pod.get("metadata", {})
+            pod_name = metadata.get("name")
+            try:
+                await annotate_pod(
+                    namespace,
+                    pod_name,
+                    {DEBUG_POOL_LEASE_ANNOTATION: str(int(now + DEBUG_POD_LEASE_SECONDS))},
+                    metadata.get("resourceVersion", ""),
+                )
+            except HTTPException as exc:
+                logger.debug("Debug pod %s taken by another run: %s", pod_name, exc.detail)
+                continue
+            DEBUG_POD_LEASES_TOTAL.labels("warm").inc()
+            logger.info("Reusing warm debug pod %s for %s/%s", pod_name, workload_kind, workload_name)
+            jar_sha256 = (metadata.get("annotations") or {}).get(DEBUG_POOL_JAR_ANNOTATION, "")
+            return DebugPodLease(namespace, pod_name, pool_key, True, jar_sha256)
+
+        base_name = f"{workload_name}-spring-config-debug"
+        if len(base_name) > 44:
+            base_name = base_name[:44].rstrip("-")
+        pod_name = f"{base_name}-{int(now)}-{os.urandom(2).hex()}"
+        logger.info(
+            "Creating pooled debug pod %s from %s/%s using image %s",
+            pod_name,
+            workload_kind,
+            workload_name,
+            image,
+        )
+        manifest = await build_debug_pod_manifest(
+            namespace,
+            workload_kind,
+            workload_name,
+            pod_name,
+            image,
+            sleep_seconds=DEBUG_POD_POOL_MAX_AGE_SECONDS,
+        )
+        metadata = manifest["metadata"]
+        metadata["labels"] = {**(metadata.get("labels") or {}), DEBUG_POOL_LABEL: pool_key}
+        metadata["annotations"] = {
+            **(metadata.get("annotations") or {}),
+            DEBUG_POOL_CREATED_ANNOTATION: str(int(now)),
+            DEBUG_POOL_LEASE_ANNOTATION: str(int(now + DEBUG_POD_LEASE_SECONDS)),
+        }
+        await apply_debug_pod(manifest)
+        try:
+            await wait_for_pod_running(namespace, pod_name, timeout_seconds=90)
+        except BaseException:
+            await delete_debug_pod(namespace, pod_name)
+            raise
+        DEBUG_POD_LEASES_TOTAL.labels("cold").inc()
+        return DebugPodLease(namespace, pod_name, pool_key, False, "")
+
+    async def renew(self, lease: DebugPodLease):
+        """Extends a held lease, for callers that run the agent several times on one pod."""
+        await annotate_pod(
+            lease.namespace,
+            lease.pod_name,
+            {DEBUG_POOL_LEASE_ANNOTATION: str(int(time.time() + DEBUG_POD_LEASE_SECONDS))},
+        )
+
+    async def release(self, lease: DebugPodLease, reusable: bool, jar_sha256: str = ""):
+        """Returns a pod to the pool, or deletes it after a failed run or when the pool is full."""
+        if reusable:
+            try:
+                now = time.time()
+                idle = [
+                    pod for pod in await self.list_pods(lease.namespace, lease.pool_key)
+                    if pod.get("metadata", {}).get("name") != lease.pod_name and self.is_leasable(pod, now)
+                ]
+                if len(idle) < DEBUG_POD_POOL_MAX_PODS:
+                    await annotate_pod(lease.namespace, lease.pod_name, {
+                        DEBUG_POOL_LEASE_ANNOTATION: "",
+                        DEBUG_POOL_IDLE_ANNOTATION: str(int(now)),
+                        DEBUG_POOL_JAR_ANNOTATION: jar_sha256,
+                    })
+                    return
+            except HTTPException as exc:
+                logger.warning("Debug pod %s could not be returned to the pool: %s", lease.pod_name, exc.detail)
+        await delete_debug_pod(lease.namespace, lease.pod_name)
+
+    async def reap(self, namespace: str):
+        pods = await self.list_pods(namespace)
+        if not pods:
+            self.namespaces.discard(namespace)
+            return
+        now = time.time()
+        for pod in pods:
+            if not self.is_expired(pod, now):
+                continue
+            metadata = pod.get("metadata", {})
+            pod_name = metadata.get("name")
+            if pod.get("status", {}).get("phase") in ("Pending", "Running"):
+                # Claim the pod first so a run cannot lease it while it is being deleted.
+                try:
+                    await annotate_pod(
+                        namespace,
+                        pod_name,
+                        {DEBUG_POOL_LEASE_ANNOTATION: str(int(now + DEBUG_POD_LEASE_SECONDS))},
+                        metadata.get("resourceVersion", ""),
+                    )
+                except HTTPException:
+                    continue
+            logger.info("Reaping debug pod %s in %s", pod_name, namespace)
+            await delete_debug_pod(namespace, pod_name)
+
+    async def run_reaper(self):
+        while self.namespaces:
+            await asyncio.sleep(DEBUG_POD_POOL_REAP_SECONDS)
+            for namespace in list(self.namespaces):
+                try:
+                    await self.reap(namespace)
+                except Exception:
+                    logger.exception("Debug pod reaping failed for %s", namespace)
+
+    def start_reaper(self):
+        if self.reaper_task is None or self.reaper_task.done():
+            self.reaper_task = asyncio.create_task(self.run_reaper())
+
+    def stop_reaper(self):
+        if self.reaper_task is not None:
+            self.reaper_task.cancel()
+            self.reaper_task = None
+
+
+_debug_pod_pool = None
+
+
+def get_debug_pod_pool():
+    global _debug_pod_pool
+    if not DEBUG_POD_POOL_ENABLED:
+        return None
+    if _debug_pod_pool is None:
+        _debug_pod_pool = DebugPodPool()
+    return _debug_pod_pool
+
+
+@app.on_event("shutdown")
+async def stop_debug_pod_reaper():
+    # Idle pods are left for other workers and replicas; they expire on their own.
+    if _debug_pod_pool is not None:
+        _debug_pod_pool.stop_reaper()
 
 
 def get_services_map(namespace: str):
+    with trace_span("services-map", namespace=namespace):
+        return _single_flight.do(f"services:{namespace}", lambda: load_services_map(namespace))
+
+
+def load_services_map(namespace: str):
     try:
-        data = run_oc(["get", "services", "-n", namespace, "-o", "json"], expect_json=True)
+        data = kube_list("services", namespace)
         return build_resource_map(data.get("items", []))
     except HTTPException as exc:
         detail = getattr(exc, "detail", "")
@@ -669,6 +2349,12 @@ def extract_configmap_names_from_workload(workload_resource: dict):
 
 
 def fetch_configmap(namespace: str, name: str):
+    informer = get_informer("configmaps", namespace)
+    if informer is not None:
+        return informer.get(name)
+    client = get_kube_client()
+    if client is not None:
+        return client.get("configmaps", name, namespace, missing_ok=True)
     result = run_oc_capture(["get", "configmap", name, "-n", namespace, "-o", "json"], timeout_seconds=20)
     if result.returncode != 0:
         detail = (result.stderr or result.stdout).strip()
@@ -683,428 +2369,632 @@ def fetch_configmap(namespace: str, name: str):
         raise HTTPException(status_code=500, detail=f"oc output parse error: {str(exc)}")
 
 
-def find_configmap_matches(configmap: dict, regex):
-    matches = []
-    unknown_files = []
-    if not isinstance(configmap, dict):
-        return matches, unknown_files
-    name = configmap.get("metadata", {}).get("name") or ""
-    data = configmap.get("data", {}) or {}
-    if not isinstance(data, dict):
-        return matches, unknown_files
-    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+async def fetch_configmaps(namespace: str, names, prefer_list: bool = False):
+    """Fetches several configmaps of one namespace at once; returns {name: configmap or None}.
+
+    With the informer, every name is served from the namespace-wide watch
+    cache. With the API client, GETs run concurrently (CONFIGMAP_FETCH_CONCURRENCY)
+    over the pooled connections. With oc, where each call is a subprocess, a
+    single namespace LIST (shared by concurrent requests) answers all names
+    once there are CONFIGMAP_LIST_THRESHOLD or more of them. `prefer_list`
+    forces the single LIST for namespace-wide callers.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    informer = get_informer("configmaps", namespace)
+    if informer is not None:
+        return await asyncio.to_thread(lambda: {name: informer.get(name) for name in names})
+    if prefer_list or (get_kube_client() is None and len(names) >= CONFIGMAP_LIST_THRESHOLD):
+        listed = await asyncio.to_thread(
+            _single_flight.do,
+            f"configmaps-list:{namespace}",
+            lambda: kube_list("configmaps", namespace),
+        )
+        by_name = {item.get("metadata", {}).get("name"): item for item in listed.get("items", [])}
+        return {name: by_name.get(name) for name in names}
 
-    def walk_json(node, path="$"):
-        found = []
-        if isinstance(node, dict):
-            for key, value in node.items():
-                key_path = f"{path}.{key}"
-                found.append(("key", key, key_path))
-                found.extend(walk_json(value, key_path))
-        elif isinstance(node, list):
-            for idx, item in enumerate(node):
-                found.extend(walk_json(item, f"{path}[{idx}]"))
-        else:
-            found.append(("value", stringify_property_value(node), path))
-        return found
+    sem = asyncio.Semaphore(CONFIGMAP_FETCH_CONCURRENCY)
 
-    def try_parse_json(text: str):
-        if not isinstance(text, str):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if stripped[0] not in ("{", "["):
-            return None
-        if len(stripped) > 200000:
-            return None
-        try:
-            return json.loads(stripped)
-        except Exception:
-            return None
+    async def fetch_one(name: str):
+        async with sem:
+            return name, await asyncio.to_thread(fetch_configmap, namespace, name)
 
-    def try_parse_yaml(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith((".yml", ".yaml")):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        try:
-            return yaml.safe_load(stripped)
-        except Exception:
-            return None
+    return dict(await asyncio.gather(*(fetch_one(name) for name in names)))
 
-    def try_parse_properties(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith(".properties"):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        parsed = {}
-        for line in stripped.splitlines():
-            raw = line.strip()
-            if not raw or raw.startswith(("#", ";", "!")):
-                continue
-            if "=" in raw:
-                key, value = raw.split("=", 1)
-            elif ":" in raw:
-                key, value = raw.split(":", 1)
-            else:
-                continue
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            if key:
-                parsed[key] = value
-        return parsed if parsed else None
-
-    def try_parse_ini(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith(".ini"):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        parsed = {}
-        section = None
-        for line in stripped.splitlines():
-            raw = line.strip()
-            if not raw or raw.startswith(("#", ";")):
-                continue
-            if raw.startswith("[") and raw.endswith("]") and len(raw) > 2:
-                section = raw[1:-1].strip()
-                if section and section not in parsed:
-                    parsed[section] = {}
-                continue
-            if "=" in raw:
-                key, value = raw.split("=", 1)
-            elif ":" in raw:
-                key, value = raw.split(":", 1)
-            else:
-                continue
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            if not key:
-                continue
-            if section:
-                if section not in parsed:
-                    parsed[section] = {}
-                parsed[section][key] = value
-            else:
-                parsed[key] = value
-        return parsed if parsed else None
 
-    def try_parse_conf(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith(".conf"):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        parsed = {}
-        for line in stripped.splitlines():
-            raw = line.strip()
-            if not raw or raw.startswith(("#", ";")):
-                continue
-            if "=" in raw:
-                key, value = raw.split("=", 1)
-            elif ":" in raw:
-                key, value = raw.split(":", 1)
-            else:
-                continue
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            if key:
-                parsed[key] = value
-        return parsed if parsed else None
-
-    def try_parse_js(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith(".js"):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        parsed = {}
-        for line in stripped.splitlines():
-            raw = line.strip()
-            if not raw or raw.startswith(("//", "/*", "*", "#")):
-                continue
-            if "=" in raw and raw.count("=") >= 1:
-                key, value = raw.split("=", 1)
-            elif ":" in raw:
-                key, value = raw.split(":", 1)
-            else:
-                continue
-            key = key.strip().strip(";")
-            value = value.strip().strip(";").strip('"').strip("'")
-            if key and value:
-                parsed[key] = value
-        return parsed if parsed else None
-
-    def try_parse_xml(text: str, key_name: str):
-        if not isinstance(text, str):
-            return None
-        if key_name and not key_name.lower().endswith(".xml"):
-            return None
-        stripped = text.strip()
-        if not stripped:
-            return None
-        if len(stripped) > 200000:
-            return None
-        try:
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(stripped)
-        except Exception:
-            return None
+# Closing quotes are optional so that an unclosed quote still matches, up to
+# the point where its string can no longer continue, instead of failing.
+CONFIG_CANDIDATE_RE = re.compile(
+    r'"([^"\\]*(?:\\.[^"\\]*)*)("?)'
+    r"|'([^'\\]*(?:\\.[^'\\]*)*)('?)"
+    r"|(https?://[^\s\"'>)]+)"
+)
+CONFIG_CANDIDATE_START_RE = re.compile(r"[\"']|https?://")
+CONFIG_HOST_SPLIT_RE = re.compile(r"[,\s]+")
+REGEX_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+CONFIG_HOSTNAME_CACHE_MAX_LEN = 1024
+CONFIGMAP_REPORT_MAX_PATTERNS = 20
+
+
+def add_config_candidate(candidates: dict, token: str, quoted: bool):
+    if not token:
+        return
+    candidates[token] = None
+    if quoted and ('"' in token or "'" in token or "://" in token):
+        # Quotes of the other kind, and URLs, nested inside a quoted string.
+        for nested in extract_config_candidates(token):
+            candidates[nested] = None
+
+
+def extract_config_candidates(text: str):
+    """Quoted strings and URLs inside a raw value, found in one scan of the text."""
+    if not text or not isinstance(text, str):
+        return []
+    candidates = {}
+    for match in CONFIG_CANDIDATE_RE.finditer(text):
+        double_quoted, double_closed, single_quoted, single_closed, url = match.groups()
+        if url is not None:
+            candidates[url] = None
+            continue
+        if not (double_closed or single_closed):
+            collect_unbalanced_candidates(text, match.start(), candidates)
+            break
+        token = double_quoted if double_closed else single_quoted
+        if token:
+            candidates[token] = None
+            if '"' in token or "'" in token or "://" in token:
+                # Quotes of the other kind, and URLs, nested inside a quoted string.
+                for nested in extract_config_candidates(token):
+                    candidates[nested] = None
+    return list(candidates)
+
+
+def collect_unbalanced_candidates(text: str, position: int, candidates: dict):
+    """Continues extract_config_candidates from an unclosed quote at `position`.
+
+    The unclosed quote is skipped and scanning resumes right after it. So is
+    every later quote of the same kind before the point where its string
+    stopped: scanning from any of them would continue in the same state and
+    stop at the same place. Retrying them made values with many unbalanced
+    quotes quadratic.
+    """
+    unclosed_until = {'"': -1, "'": -1}
+    while True:
+        start = CONFIG_CANDIDATE_START_RE.search(text, position)
+        if start is None:
+            return
+        begin = start.start()
+        quote = text[begin]
+        if quote in unclosed_until and begin < unclosed_until[quote]:
+            position = begin + 1
+            continue
+        match = CONFIG_CANDIDATE_RE.match(text, begin)
+        if match is None:
+            position = begin + 1
+        elif match.lastindex == 5:
+            add_config_candidate(candidates, match.group(5), False)
+            position = match.end()
+        elif match.group(match.lastindex):
+            add_config_candidate(candidates, match.group(match.lastindex - 1), True)
+            position = match.end()
+        else:
+            unclosed_until[quote] = match.end()
+            position = begin + 1
 
-        def element_to_dict(element):
-            node = {
-                "tag": element.tag,
-                "attributes": element.attrib or {},
-            }
-            text_value = (element.text or "").strip()
-            if text_value:
-                node["text"] = text_value
-            children = [element_to_dict(child) for child in list(element)]
-            if children:
-                node["children"] = children
-            return node
-
-        return element_to_dict(root)
-
-    def extract_candidates(text: str):
-        candidates = set()
-        if not text:
-            return []
-        for match in re.finditer(r'"([^"\\]*(?:\\.[^"\\]*)*)"', text):
-            token = match.group(1)
-            if token:
-                candidates.add(token)
-        for match in re.finditer(r"'([^'\\]*(?:\\.[^'\\]*)*)'", text):
-            token = match.group(1)
-            if token:
-                candidates.add(token)
-        for match in re.finditer(r"https?://[^\s\"'>)]+", text):
-            token = match.group(0)
-            if token:
-                candidates.add(token)
-        return list(candidates)
-
-    def extract_hostnames(value: str):
-        if not isinstance(value, str) or not value:
-            return []
-        value = value.strip().strip('"').strip("'")
-        if not value:
-            return []
-        hostnames = []
+
+def _extract_config_hostnames(value: str):
+    value = value.strip().strip('"').strip("'")
+    if not value:
+        return ()
+    hostnames = []
+    if "//" in value:
         try:
             parsed = urllib.parse.urlparse(value)
         except Exception:
             parsed = None
         if parsed and parsed.hostname:
             hostnames.append(parsed.hostname.strip())
-        for chunk in re.split(r"[,\s]+", value):
-            if not chunk:
-                continue
-            chunk = chunk.strip().strip('"').strip("'")
-            if not chunk:
-                continue
-            if "://" in chunk:
-                try:
-                    parsed_chunk = urllib.parse.urlparse(chunk)
-                    if parsed_chunk.hostname:
-                        hostnames.append(parsed_chunk.hostname.strip())
-                        continue
-                except Exception:
-                    pass
-            chunk = chunk.split("/", 1)[0]
-            if ":" in chunk:
-                host_part = chunk.split(":", 1)[0]
-            else:
-                host_part = chunk
-            if "." in host_part:
-                hostnames.append(host_part.strip())
-        seen = set()
-        ordered = []
-        for host in hostnames:
-            if host and host not in seen:
-                seen.add(host)
-                ordered.append(host)
-        return ordered
-
-    def process_entries(entries, kind_label, key_name):
-        matched_any = False
-        if debug_enabled:
-            logger.debug("Configmap %s key=%s %s_entries=%s", name, key_name, kind_label, len(entries))
-        for kind, token, path in entries:
-            if not token:
-                continue
-            matched_token = token
-            if regex.search(token) is None:
-                hostnames = extract_hostnames(token)
-                matched_host = ""
-                for host in hostnames:
-                    if regex.search(host) is not None:
-                        matched_host = host
-                        break
-                if not matched_host:
-                    if debug_enabled:
-                        logger.debug(
-                            "Configmap %s key=%s %s_no_match path=%s token=%s hostname=%s",
-                            name,
-                            key_name,
-                            kind_label,
-                            path,
-                            token,
-                            "",
-                        )
+    for chunk in CONFIG_HOST_SPLIT_RE.split(value):
+        chunk = chunk.strip('"').strip("'")
+        if not chunk:
+            continue
+        if "://" in chunk:
+            try:
+                parsed_chunk = urllib.parse.urlparse(chunk)
+                if parsed_chunk.hostname:
+                    hostnames.append(parsed_chunk.hostname.strip())
                     continue
-                matched_token = matched_host
-            if debug_enabled:
-                logger.debug(
-                    "Configmap %s key=%s %s_match path=%s token=%s matched=%s",
-                    name,
-                    key_name,
-                    kind_label,
-                    path,
-                    token,
-                    matched_token,
-                )
-            matches.append({
-                "configMap": name,
-                "key": key_name,
-                "value": matched_token,
-                "matchOn": f"{kind_label}-{kind}",
-                "path": path,
-            })
-            matched_any = True
-        return matched_any
+            except Exception:
+                pass
+        host_part = chunk.split("/", 1)[0].split(":", 1)[0]
+        if "." in host_part:
+            hostnames.append(host_part.strip())
+    return tuple(dict.fromkeys(host for host in hostnames if host))
+
+
+_cached_config_hostnames = functools.lru_cache(maxsize=4096)(_extract_config_hostnames)
+
+
+def extract_config_hostnames(value: str):
+    if not isinstance(value, str) or not value:
+        return ()
+    if len(value) > CONFIG_HOSTNAME_CACHE_MAX_LEN:
+        return _extract_config_hostnames(value)
+    return _cached_config_hostnames(value)
+
+
+class ConfigPatternMatcher:
+    """A batch of search patterns evaluated together against configmap tokens.
+
+    Each pattern is compiled once. With several patterns, an alternation of all
+    of them rejects non-matching tokens in a single regex pass before the
+    individual patterns are consulted; it is skipped when a pattern uses
+    backreferences, whose numbering the alternation would shift. A token
+    matches a pattern directly or through one of the hostnames it contains.
+    """
+
+    def __init__(self, patterns, flags: int = 0):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self.regexes = [re.compile(pattern, flags=flags) for pattern in self.patterns]
+        self.indexes = tuple(range(len(self.regexes)))
+        self.combined = None
+        if len(self.regexes) > 1 and not any(
+            regex.groupindex or REGEX_BACKREFERENCE_RE.search(regex.pattern) for regex in self.regexes
+        ):
+            try:
+                self.combined = re.compile("|".join(f"(?:{pattern})" for pattern in self.patterns), flags=flags)
+            except re.error:
+                self.combined = None
 
-    for key, value in data.items():
-        value_text = stringify_property_value(value)
-        if debug_enabled:
-            logger.debug(
-                "Configmap %s key=%s value_len=%s",
-                name,
-                key,
-                len(value_text) if isinstance(value_text, str) else 0,
-            )
+    def search(self, text: str, indexes):
+        """Indexes (from `indexes`) of the patterns that match somewhere in `text`."""
+        if self.combined is not None and self.combined.search(text) is None:
+            return []
+        return [index for index in indexes if self.regexes[index].search(text) is not None]
 
-        matched_any = False
-        parsed_yaml = try_parse_yaml(value_text, key)
-        parsed_json = None
-        if parsed_yaml is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=yaml", name, key)
-            matched_any = process_entries(walk_json(parsed_yaml), "yaml", key)
-            if matched_any:
+    def match_token(self, token: str, indexes):
+        """(index, matched value) per pattern matching the token or a hostname in it."""
+        if not indexes:
+            return []
+        hits = [(index, token) for index in self.search(token, indexes)]
+        if len(hits) == len(indexes):
+            return hits
+        matched = {index for index, _ in hits}
+        remaining = [index for index in indexes if index not in matched]
+        for host in extract_config_hostnames(token):
+            for index in self.search(host, remaining):
+                hits.append((index, host))
+                matched.add(index)
+            remaining = [index for index in remaining if index not in matched]
+            if not remaining:
+                break
+        return hits
+
+
+CONFIG_PARSE_MAX_LEN = 200000
+CONFIG_WALK_MAX_DEPTH = 128
+CONFIG_FORMAT_BY_EXTENSION = {
+    "yml": "yaml",
+    "yaml": "yaml",
+    "xml": "xml",
+    "properties": "properties",
+    "ini": "ini",
+    "conf": "conf",
+    "js": "js",
+    "json": "json",
+}
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def walk_config_tree(node, path="$"):
+    """(kind, token, path) for every key and leaf value, in document order.
+
+    Iterative, and stops descending CONFIG_WALK_MAX_DEPTH levels down: every
+    entry carries its full path, so a pathologically deep document would cost
+    time and memory quadratic in its depth. Anything below the cut is still
+    seen by the raw-text scan in find_configmap_matches.
+    """
+    found = []
+    stack = [(node, path, 0, False)]
+    while stack:
+        node, path, depth, is_key = stack.pop()
+        if is_key:
+            found.append(("key", node, path))
+        elif isinstance(node, (dict, list)):
+            if depth >= CONFIG_WALK_MAX_DEPTH:
                 continue
+            if isinstance(node, dict):
+                for key, value in reversed(node.items()):
+                    key_path = f"{path}.{key}"
+                    stack.append((value, key_path, depth + 1, False))
+                    stack.append((key, key_path, depth + 1, True))
+            else:
+                for idx in range(len(node) - 1, -1, -1):
+                    stack.append((node[idx], f"{path}[{idx}]", depth + 1, False))
+        else:
+            found.append(("value", stringify_property_value(node), path))
+    return found
 
-        parsed_xml = try_parse_xml(value_text, key)
-        if parsed_xml is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=xml", name, key)
-            matched_any = process_entries(walk_json(parsed_xml), "xml", key)
-            if matched_any:
-                continue
 
-        parsed_properties = try_parse_properties(value_text, key)
-        if parsed_properties is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=properties", name, key)
-            matched_any = process_entries(walk_json(parsed_properties), "properties", key)
-            if matched_any:
-                continue
+def parse_config_json(text: str):
+    try:
+        return json.loads(text)
+    except Exception:
+        return None
 
-        parsed_ini = try_parse_ini(value_text, key)
-        if parsed_ini is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=ini", name, key)
-            matched_any = process_entries(walk_json(parsed_ini), "ini", key)
-            if matched_any:
-                continue
 
-        parsed_conf = try_parse_conf(value_text, key)
-        if parsed_conf is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=conf", name, key)
-            matched_any = process_entries(walk_json(parsed_conf), "conf", key)
-            if matched_any:
-                continue
+def parse_config_yaml(text: str):
+    try:
+        return yaml.load(text, Loader=YAML_SAFE_LOADER)
+    except Exception:
+        return None
 
-        parsed_js = try_parse_js(value_text, key)
-        if parsed_js is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=js", name, key)
-            matched_any = process_entries(walk_json(parsed_js), "js", key)
-            if matched_any:
-                continue
 
-        parsed_json = try_parse_json(value_text)
-        if parsed_json is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s parsed_as=json", name, key)
-            matched_any = process_entries(walk_json(parsed_json), "json", key)
-            if matched_any:
-                continue
+def parse_config_key_values(text: str, comment_prefixes):
+    parsed = {}
+    for line in text.splitlines():
+        raw = line.strip()
+        if not raw or raw.startswith(comment_prefixes):
+            continue
+        if "=" in raw:
+            key, value = raw.split("=", 1)
+        elif ":" in raw:
+            key, value = raw.split(":", 1)
+        else:
+            continue
+        key = key.strip()
+        value = value.strip().strip('"').strip("'")
+        if key:
+            parsed[key] = value
+    return parsed if parsed else None
 
-        if isinstance(key, str) and "." in key:
-            ext = key.rsplit(".", 1)[-1].lower()
-            if ext and ext not in ("json", "yaml", "yml", "xml", "conf", "js", "properties", "ini"):
-                unknown_files.append({
-                    "configMap": name,
-                    "key": key,
-                    "extension": ext,
-                })
 
-        if regex.search(value_text) is not None:
-            if debug_enabled:
-                logger.debug("Configmap %s key=%s value_match=full", name, key)
-            matches.append({
+def parse_config_properties(text: str):
+    return parse_config_key_values(text, ("#", ";", "!"))
+
+
+def parse_config_conf(text: str):
+    return parse_config_key_values(text, ("#", ";"))
+
+
+def parse_config_ini(text: str):
+    parsed = {}
+    section = None
+    for line in text.splitlines():
+        raw = line.strip()
+        if not raw or raw.startswith(("#", ";")):
+            continue
+        if raw.startswith("[") and raw.endswith("]") and len(raw) > 2:
+            section = raw[1:-1].strip()
+            if section and section not in parsed:
+                parsed[section] = {}
+            continue
+        if "=" in raw:
+            key, value = raw.split("=", 1)
+        elif ":" in raw:
+            key, value = raw.split(":", 1)
+        else:
+            continue
+        key = key.strip()
+        value = value.strip().strip('"').strip("'")
+        if not key:
+            continue
+        if section:
+            if section not in parsed:
+                parsed[section] = {}
+            parsed[section][key] = value
+        else:
+            parsed[key] = value
+    return parsed if parsed else None
+
+
+def parse_config_js(text: str):
+    parsed = {}
+    for line in text.splitlines():
+        raw = line.strip()
+        if not raw or raw.startswith(("//", "/*", "*", "#")):
+            continue
+        if "=" in raw:
+            key, value = raw.split("=", 1)
+        elif ":" in raw:
+            key, value = raw.split(":", 1)
+        else:
+            continue
+        key = key.strip().strip(";")
+        value = value.strip().strip(";").strip('"').strip("'")
+        if key and value:
+            parsed[key] = value
+    return parsed if parsed else None
+
+
+def parse_config_xml(text: str):
+    try:
+        root = ET.fromstring(text)
+    except Exception:
+        return None
+
+    def element_to_dict(element):
+        node = {
+            "tag": element.tag,
+            "attributes": element.attrib or {},
+        }
+        text_value = (element.text or "").strip()
+        if text_value:
+            node["text"] = text_value
+        return node
+
+    # Children are filled in from an explicit stack; deep documents would overflow recursion.
+    root_node = element_to_dict(root)
+    stack = [(root, root_node)]
+    while stack:
+        element, node = stack.pop()
+        children = list(element)
+        if children:
+            node["children"] = [element_to_dict(child) for child in children]
+            stack.extend(zip(children, node["children"]))
+    return root_node
+
+
+CONFIG_PARSERS = {
+    "yaml": parse_config_yaml,
+    "xml": parse_config_xml,
+    "properties": parse_config_properties,
+    "ini": parse_config_ini,
+    "conf": parse_config_conf,
+    "js": parse_config_js,
+    "json": parse_config_json,
+}
+
+
+def sniff_config_format(key_name, text: str):
+    """Picks the parser for a configmap value from its key extension, else its leading bytes."""
+    if isinstance(key_name, str) and "." in key_name:
+        config_format = CONFIG_FORMAT_BY_EXTENSION.get(key_name.rsplit(".", 1)[-1].lower())
+        if config_format:
+            return config_format
+    if text.startswith(("{", "[")):
+        return "json"
+    if text.startswith("<?xml"):
+        return "xml"
+    return None
+
+
+def parse_config_value(key_name, text: str):
+    """Returns (format, parsed) for a stripped configmap value, parsing it at most twice.
+
+    The sniffed format is parsed once; only a value that fails under its
+    extension's parser but looks like JSON gets a second, JSON, attempt.
+    """
+    if not text or len(text) > CONFIG_PARSE_MAX_LEN:
+        return None, None
+    config_format = sniff_config_format(key_name, text)
+    if config_format is None:
+        return None, None
+    parsed = CONFIG_PARSERS[config_format](text)
+    if parsed is None and config_format != "json" and text.startswith(("{", "[")):
+        config_format = "json"
+        parsed = parse_config_json(text)
+    if parsed is None:
+        return None, None
+    return config_format, parsed
+
+
+class ParsedConfigCache:
+    """Per-worker LRU of flattened configmap values, keyed by a hash of key name and content.
+
+    Identical bundles mounted from several configmaps or namespaces share one
+    entry, and any change to a value changes its key, so entries never go
+    stale. Size is bounded by an estimate of the bytes held by the cached
+    (kind, token, path) tuples.
+    """
+
+    ENTRY_OVERHEAD_BYTES = 64
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest(key_name, text: str) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str(key_name).encode("utf-8", "surrogatepass"))
+        hasher.update(b"\0")
+        hasher.update(text.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    @classmethod
+    def estimate_size(cls, entries) -> int:
+        size = cls.ENTRY_OVERHEAD_BYTES
+        for kind, token, path in entries:
+            size += cls.ENTRY_OVERHEAD_BYTES + len(kind) + len(str(token)) + len(path)
+        return size
+
+    def get(self, digest: str):
+        with self.lock:
+            cached = self.entries.get(digest)
+            record_cache_lookup("config-parse", "memory", cached is not None)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(digest)
+            self.hits += 1
+            return cached[0], cached[1]
+
+    def set(self, digest: str, kind_label, entries):
+        size = self.estimate_size(entries)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(digest, None)
+            if previous is not None:
+                self.size -= previous[2]
+            self.entries[digest] = (kind_label, entries, size)
+            self.size += size
+            while self.size > self.max_bytes and self.entries:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted[2]
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_parsed_config_cache = ParsedConfigCache(CONFIG_PARSE_CACHE_MAX_BYTES) if CONFIG_PARSE_CACHE_MAX_BYTES > 0 else None
+
+
+def flatten_config_value(key_name, text: str):
+    """(format, entries) for a stripped configmap value, served from the parse cache when possible."""
+    if not text or len(text) > CONFIG_PARSE_MAX_LEN:
+        return None, ()
+    digest = None
+    if _parsed_config_cache is not None:
+        digest = ParsedConfigCache.digest(key_name, text)
+        cached = _parsed_config_cache.get(digest)
+        if cached is not None:
+            return cached
+    with trace_span("config-parse", key=str(key_name), bytes=len(text)) as span:
+        kind_label, parsed = parse_config_value(key_name, text)
+        if span is not None:
+            span["attributes"]["format"] = kind_label or "unknown"
+    with trace_span("config-walk", format=kind_label or "unknown"):
+        entries = tuple(walk_config_tree(parsed)) if kind_label is not None else ()
+    if digest is not None:
+        _parsed_config_cache.set(digest, kind_label, entries)
+    return kind_label, entries
+
+
+def find_configmap_matches(configmap: dict, matcher: ConfigPatternMatcher):
+    matches = []
+    unknown_files = []
+    if not isinstance(configmap, dict):
+        return matches, unknown_files
+    name = configmap.get("metadata", {}).get("name") or ""
+    data = configmap.get("data", {}) or {}
+    if not isinstance(data, dict):
+        return matches, unknown_files
+    with trace_span("configmap-match", configMap=name, keys=len(data)):
+        for key, value in data.items():
+            key_matches, key_unknown = find_configmap_key_matches(name, key, value, matcher)
+            matches.extend(key_matches)
+            unknown_files.extend(key_unknown)
+    return matches, unknown_files
+
+
+def find_configmap_key_matches(name: str, key, value, matcher: ConfigPatternMatcher):
+    """Matches and unknown files for one key of a configmap; the unit of work of the match pool."""
+    matches = []
+    unknown_files = []
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    def process_entries(entries, kind_label, pending):
+        matched = set()
+        if debug_enabled:
+            logger.debug("Configmap %s key=%s %s_entries=%s", name, key, kind_label, len(entries))
+        for kind, token, path in entries:
+            if not token:
+                continue
+            hits = matcher.match_token(token, pending)
+            if not hits:
+                if debug_enabled:
+                    logger.debug(
+                        "Configmap %s key=%s %s_no_match path=%s token=%s",
+                        name,
+                        key,
+                        kind_label,
+                        path,
+                        token,
+                    )
+                continue
+            for index, matched_token in hits:
+                if debug_enabled:
+                    logger.debug(
+                        "Configmap %s key=%s %s_match path=%s token=%s matched=%s",
+                        name,
+                        key,
+                        kind_label,
+                        path,
+                        token,
+                        matched_token,
+                    )
+                matches.append({
+                    "configMap": name,
+                    "key": key,
+                    "value": matched_token,
+                    "matchOn": f"{kind_label}-{kind}",
+                    "path": path,
+                    "pattern": matcher.patterns[index],
+                })
+                matched.add(index)
+        return matched
+
+    value_text = stringify_property_value(value)
+    if debug_enabled:
+        logger.debug(
+            "Configmap %s key=%s value_len=%s",
+            name,
+            key,
+            len(value_text) if isinstance(value_text, str) else 0,
+        )
+
+    # Patterns that matched the structured parse of this key are done with it;
+    # the rest fall through to the raw-text scan.
+    pending = matcher.indexes
+    stripped = value_text.strip() if isinstance(value_text, str) else ""
+    kind_label, entries = flatten_config_value(key, stripped)
+    if kind_label is not None:
+        if debug_enabled:
+            logger.debug("Configmap %s key=%s parsed_as=%s", name, key, kind_label)
+        matched = process_entries(entries, kind_label, pending)
+        if matched:
+            pending = tuple(index for index in pending if index not in matched)
+            if not pending:
+                return matches, unknown_files
+
+    if isinstance(key, str) and "." in key:
+        ext = key.rsplit(".", 1)[-1].lower()
+        if ext and ext not in CONFIG_FORMAT_BY_EXTENSION:
+            unknown_files.append({
                 "configMap": name,
                 "key": key,
-                "value": value_text,
-                "matchOn": "value",
+                "extension": ext,
             })
-            continue
 
-        for candidate in extract_candidates(value_text):
-            matched_candidate = candidate
-            if regex.search(candidate) is None:
-                hostnames = extract_hostnames(candidate)
-                matched_host = ""
-                for host in hostnames:
-                    if regex.search(host) is not None:
-                        matched_host = host
-                        break
-                if not matched_host:
-                    if debug_enabled:
-                        logger.debug(
-                            "Configmap %s key=%s fragment_no_match candidate=%s hostname=%s",
-                            name,
-                            key,
-                            candidate,
-                            "",
-                        )
-                    continue
-                matched_candidate = matched_host
+    full_matches = matcher.search(value_text, pending) if isinstance(value_text, str) else []
+    for index in full_matches:
+        if debug_enabled:
+            logger.debug("Configmap %s key=%s value_match=full", name, key)
+        matches.append({
+            "configMap": name,
+            "key": key,
+            "value": value_text,
+            "matchOn": "value",
+            "pattern": matcher.patterns[index],
+        })
+    if full_matches:
+        pending = tuple(index for index in pending if index not in full_matches)
+        if not pending:
+            return matches, unknown_files
+
+    for candidate in extract_config_candidates(value_text):
+        hits = matcher.match_token(candidate, pending)
+        if not hits and debug_enabled:
+            logger.debug("Configmap %s key=%s fragment_no_match candidate=%s", name, key, candidate)
+        for index, matched_candidate in hits:
             if debug_enabled:
                 logger.debug(
                     "Configmap %s key=%s fragment_match candidate=%s matched=%s",
@@ -1118,59 +3008,468 @@ def find_configmap_matches(configmap: dict, regex):
                 "key": key,
                 "value": matched_candidate,
                 "matchOn": "value-fragment",
+                "pattern": matcher.patterns[index],
             })
+
     return matches, unknown_files
 
 
-def fetch_actuator_env(url: str):
-    logger.info("Fetching actuator env %s", url)
-    if CACHE_TTL_SECONDS > 0:
-        cache_key = f"actuator-env:{url}"
-        redis_client = get_redis_client()
-        if redis_client is not None:
-            try:
-                cached_payload = redis_client.get(cache_key)
-                if cached_payload:
-                    logger.info("Actuator cache hit (redis) %s", url)
-                    return json.loads(cached_payload.decode("utf-8"))
-            except redis.RedisError as exc:
-                logger.warning("Redis cache read failed: %s", str(exc))
-            except json.JSONDecodeError:
-                logger.warning("Redis cache payload invalid, ignoring")
-        else:
-            cached = _actuator_cache.get(cache_key)
-            if cached:
-                expires_at, payload = cached
-                if time.time() < expires_at:
-                    logger.info("Actuator cache hit (memory) %s", url)
-                    return payload
-                _actuator_cache.pop(cache_key, None)
+class ConfigmapSearchIndex:
+    """Inverted index over a set of configmaps: token -> (configmap, key, path) postings.
+
+    Built once per distinct set of configmap resourceVersions. Each distinct
+    token is tested once per query no matter how many keys contain it, and
+    query results are memoized per pattern batch, so repeating a search costs
+    a dictionary lookup. Match precedence per key mirrors find_configmap_matches:
+    structured entries first, then the whole raw value, then raw fragments.
+    """
+
+    STRUCTURED = 0
+    FULL_VALUE = 1
+    FRAGMENT = 2
+    MAX_CACHED_QUERIES = 32
+
+    def __init__(self, fingerprint, configmaps):
+        self.fingerprint = fingerprint
+        self.slots = []
+        self.tokens = {}
+        self.values = {}
+        self.unknown_files = []
+        self.queries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        for configmap in configmaps:
+            self.add_configmap(configmap)
+
+    def add_configmap(self, configmap: dict):
+        name = configmap.get("metadata", {}).get("name") or ""
+        data = configmap.get("data", {}) or {}
+        if not isinstance(data, dict):
+            return
+        for key, value in data.items():
+            value_text = stringify_property_value(value)
+            if not isinstance(value_text, str):
+                continue
+            slot = len(self.slots)
+            self.slots.append((name, key))
+            kind_label, entries = flatten_config_value(key, value_text.strip())
+            for kind, token, path in entries:
+                if token:
+                    token = token if isinstance(token, str) else str(token)
+                    self.tokens.setdefault(token, []).append((slot, self.STRUCTURED, f"{kind_label}-{kind}", path))
+            if kind_label is None and isinstance(key, str) and "." in key:
+                ext = key.rsplit(".", 1)[-1].lower()
+                if ext and ext not in CONFIG_FORMAT_BY_EXTENSION:
+                    self.unknown_files.append({"configMap": name, "key": key, "extension": ext})
+            if value_text:
+                self.values.setdefault(value_text, []).append(slot)
+            for candidate in extract_config_candidates(value_text):
+                self.tokens.setdefault(candidate, []).append((slot, self.FRAGMENT, "value-fragment", None))
+
+    def stats(self):
+        return {"keys": len(self.slots), "tokens": len(self.tokens), "values": len(self.values)}
+
+    def search(self, matcher: ConfigPatternMatcher):
+        query_key = (tuple(matcher.patterns), tuple(regex.flags for regex in matcher.regexes))
+        with self.lock:
+            cached = self.queries.get(query_key)
+            if cached is not None:
+                self.queries.move_to_end(query_key)
+                return cached
+        matches = self.run_query(matcher)
+        with self.lock:
+            self.queries[query_key] = matches
+            while len(self.queries) > self.MAX_CACHED_QUERIES:
+                self.queries.popitem(last=False)
+        return matches
+
+    def run_query(self, matcher: ConfigPatternMatcher):
+        per_slot = {}
+        for token, postings in self.tokens.items():
+            hits = matcher.match_token(token, matcher.indexes)
+            if not hits:
+                continue
+            for slot, stage, match_on, path in postings:
+                stages = per_slot.setdefault(slot, ([], [], []))
+                for index, matched_value in hits:
+                    stages[stage].append((index, matched_value, match_on, path))
+        for value_text, slots in self.values.items():
+            for index in matcher.search(value_text, matcher.indexes):
+                for slot in slots:
+                    per_slot.setdefault(slot, ([], [], []))[self.FULL_VALUE].append((index, value_text, "value", None))
+
+        matches = []
+        for slot in sorted(per_slot):
+            name, key = self.slots[slot]
+            resolved = set()
+            for stage_hits in per_slot[slot]:
+                stage_resolved = set()
+                for index, matched_value, match_on, path in stage_hits:
+                    if index in resolved:
+                        continue
+                    match = {
+                        "configMap": name,
+                        "key": key,
+                        "value": matched_value,
+                        "matchOn": match_on,
+                        "pattern": matcher.patterns[index],
+                    }
+                    if path is not None:
+                        match["path"] = path
+                    matches.append(match)
+                    stage_resolved.add(index)
+                resolved |= stage_resolved
+        return matches
+
+
+_configmap_indexes = collections.OrderedDict()
+_configmap_indexes_lock = threading.Lock()
+
+
+def configmap_set_fingerprint(configmaps):
+    parts = []
+    for configmap in configmaps:
+        metadata = configmap.get("metadata", {}) or {}
+        version = metadata.get("resourceVersion") or ParsedConfigCache.digest(
+            metadata.get("name"),
+            json.dumps(configmap.get("data") or {}, sort_keys=True),
+        )
+        parts.append((metadata.get("name") or "", version))
+    return tuple(sorted(parts))
+
+
+def get_configmap_index(namespace: str, configmaps):
+    """Returns (index, reused) for this exact set of configmaps, building it if needed."""
+    fingerprint = configmap_set_fingerprint(configmaps)
+    with _configmap_indexes_lock:
+        index = _configmap_indexes.get(namespace)
+        if index is not None and index.fingerprint == fingerprint:
+            _configmap_indexes.move_to_end(namespace)
+            return index, True
+    index = ConfigmapSearchIndex(fingerprint, configmaps)
+    with _configmap_indexes_lock:
+        _configmap_indexes[namespace] = index
+        _configmap_indexes.move_to_end(namespace)
+        while len(_configmap_indexes) > CONFIGMAP_INDEX_MAX_NAMESPACES:
+            _configmap_indexes.popitem(last=False)
+    return index, False
+
+
+async def search_configmaps(namespace: str, configmaps, matcher: ConfigPatternMatcher, use_index: bool):
+    """Matches and unknown files for a namespace's configmaps, via the index or a direct scan."""
+    if use_index:
+        return await asyncio.to_thread(search_configmap_index, namespace, configmaps, matcher)
+    matches, unknown_files = await match_configmaps(configmaps, matcher)
+    return matches, unknown_files, {"used": False}
+
+
+def search_configmap_index(namespace: str, configmaps, matcher: ConfigPatternMatcher):
+    index, reused = get_configmap_index(namespace, configmaps)
+    info = {"used": True, "reused": reused, **index.stats()}
+    return index.search(matcher), list(index.unknown_files), info
+
+
+def find_all_configmap_matches(configmaps, matcher: ConfigPatternMatcher):
+    matches = []
+    unknown_files = []
+    for configmap in configmaps:
+        configmap_matches, configmap_unknown = find_configmap_matches(configmap, matcher)
+        matches.extend(configmap_matches)
+        unknown_files.extend(configmap_unknown)
+    return matches, unknown_files
+
+
+class ConfigMatchProcess(multiprocessing.context.SpawnProcess):
+    """Match-pool child, named before it imports this module so the import can tell."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = f"{CONFIG_MATCH_PROCESS_NAME}-{self.name.rsplit('-', 1)[-1]}"
+
+
+class ConfigMatchContext(multiprocessing.context.SpawnContext):
+    Process = ConfigMatchProcess
+
+
+def get_config_match_pool():
+    """Per-worker process pool for parsing and matching configmap values, started on first use.
+
+    Children are spawned rather than forked: uvicorn workers run informer,
+    indexer and executor threads whose locks a fork would copy mid-use. They
+    run without PROMETHEUS_MULTIPROC_DIR (see CONFIG_MATCH_PROCESS_NAME), so
+    nothing they record reaches /metrics.
+    """
+    global _config_match_pool
+    if CONFIG_MATCH_PROCESSES <= 0:
+        return None
+    if _config_match_pool is None:
+        with _config_match_pool_lock:
+            if _config_match_pool is None:
+                _config_match_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=CONFIG_MATCH_PROCESSES,
+                    mp_context=ConfigMatchContext(),
+                )
+    return _config_match_pool
+
 
+def release_idle_config_match_pool():
+    global _config_match_pool_timer
+    _config_match_pool_timer = None
+    pool = _config_match_pool
+    if pool is not None and _config_match_pool_scans == 0:
+        logger.debug("Stopping idle configmap match pool")
+        discard_config_match_pool(pool)
+
+
+def discard_config_match_pool(pool):
+    global _config_match_pool
+    with _config_match_pool_lock:
+        if _config_match_pool is pool:
+            _config_match_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def configmap_key_items(configmaps):
+    """(configmap name, key, value) for every key, in report order; plain strings pickle cheaply."""
+    items = []
+    for configmap in configmaps:
+        if not isinstance(configmap, dict):
+            continue
+        data = configmap.get("data", {}) or {}
+        if not isinstance(data, dict):
+            continue
+        name = configmap.get("metadata", {}).get("name") or ""
+        items.extend((name, key, value) for key, value in data.items())
+    return items
+
+
+def chunk_configmap_items(items, chunk_bytes: int):
+    """Groups consecutive (key, value) items into chunks of about chunk_bytes; a larger value gets its own."""
+    chunks = []
+    chunk = []
+    size = 0
+    for item in items:
+        item_size = len(item[1]) if isinstance(item[1], str) else 0
+        if chunk and size + item_size > chunk_bytes:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+_pool_matchers = {}
+
+
+def match_configmap_chunk(patterns, flags: int, items):
+    """Runs in a match-pool process: one (matches, unknown files) pair per (key, value) item.
+
+    Results carry an empty configMap name; the caller fills in every configmap
+    that holds the same key and value.
+    """
+    matcher = _pool_matchers.get((tuple(patterns), flags))
+    if matcher is None:
+        if len(_pool_matchers) >= 32:
+            _pool_matchers.clear()
+        matcher = _pool_matchers[(tuple(patterns), flags)] = ConfigPatternMatcher(patterns, flags=flags)
+    return [find_configmap_key_matches("", key, value, matcher) for key, value in items]
+
+
+async def match_configmaps(configmaps, matcher: ConfigPatternMatcher):
+    """find_all_configmap_matches off the event loop.
+
+    Scans of CONFIG_MATCH_POOL_MIN_BYTES or more are split by key into chunks
+    of about CONFIG_MATCH_CHUNK_BYTES and spread over the match pool, so one
+    large scan uses several cores and leaves this worker's GIL to other
+    requests. A key and value shared by several configmaps (the same bundle
+    mounted across workloads) is sent and matched once. Smaller scans, or all of them with the pool disabled, run in a
+    thread, where the in-process parse cache also applies. The pool's
+    processes exit after CONFIG_MATCH_POOL_IDLE_SECONDS without a scan.
+    """
+    global _config_match_pool_scans, _config_match_pool_timer
+    items = configmap_key_items(configmaps)
+    total_bytes = sum(len(value) for _, _, value in items if isinstance(value, str))
+    pool = get_config_match_pool() if total_bytes >= CONFIG_MATCH_POOL_MIN_BYTES else None
+    if pool is None:
+        return await asyncio.to_thread(find_all_configmap_matches, configmaps, matcher)
+    unique_items = list(dict.fromkeys(
+        (key, value) for _, key, value in items if isinstance(value, str)
+    ))
+    chunks = chunk_configmap_items(unique_items, CONFIG_MATCH_CHUNK_BYTES)
+    loop = asyncio.get_running_loop()
+    if _config_match_pool_timer is not None:
+        _config_match_pool_timer.cancel()
+        _config_match_pool_timer = None
+    _config_match_pool_scans += 1
     try:
-        request = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(request, timeout=10) as response:
-            status_code = response.getcode()
-            payload = response.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode("utf-8") if exc.fp else ""
-        logger.error("Actuator HTTP error %s: %s", exc.code, detail)
-        raise_structured_error(
-            502,
-            "actuator_non_200",
-            f"Actuator returned HTTP {exc.code}",
-            {"status": exc.code, "body": detail},
+        with trace_span("configmap-match-pool", keys=len(items), chunks=len(chunks), bytes=total_bytes):
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, match_configmap_chunk, matcher.patterns, matcher.flags, chunk)
+                for chunk in chunks
+            ))
+    except concurrent.futures.process.BrokenProcessPool:
+        logger.warning("Configmap match pool failed; restarting it and matching in a thread")
+        discard_config_match_pool(pool)
+        return await asyncio.to_thread(find_all_configmap_matches, configmaps, matcher)
+    finally:
+        _config_match_pool_scans -= 1
+        if _config_match_pool_scans == 0 and _config_match_pool_timer is None and CONFIG_MATCH_POOL_IDLE_SECONDS > 0:
+            _config_match_pool_timer = loop.call_later(CONFIG_MATCH_POOL_IDLE_SECONDS, release_idle_config_match_pool)
+    by_item = dict(zip(unique_items, itertools.chain.from_iterable(results)))
+    matches = []
+    unknown_files = []
+    for name, key, value in items:
+        if not isinstance(value, str):
+            key_matches, key_unknown = find_configmap_key_matches(name, key, value, matcher)
+        else:
+            key_matches, key_unknown = by_item[(key, value)]
+            key_matches = [{**match, "configMap": name} for match in key_matches]
+            key_unknown = [{**item, "configMap": name} for item in key_unknown]
+        matches.extend(key_matches)
+        unknown_files.extend(key_unknown)
+    return matches, unknown_files
+
+
+@app.on_event("shutdown")
+async def stop_config_match_pool():
+    global _config_match_pool_timer
+    if _config_match_pool_timer is not None:
+        _config_match_pool_timer.cancel()
+        _config_match_pool_timer = None
+    pool = _config_match_pool
+    if pool is not None:
+        discard_config_match_pool(pool)
+
+
+def read_actuator_cache(cache_key: str, url: str):
+    if CACHE_TTL_SECONDS <= 0:
+        return None
+    with trace_span("cache-read", cache="actuator") as span:
+        cached = load_actuator_cache(cache_key, url)
+        if span is not None:
+            span["attributes"]["hit"] = cached is not None
+        return cached
+
+
+def load_actuator_cache(cache_key: str, url: str):
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        try:
+            cached_payload = redis_client.get(cache_key)
+            record_cache_lookup("actuator", "redis", bool(cached_payload))
+            if cached_payload:
+                logger.info("Actuator cache hit (redis) %s", url)
+                return json.loads(cached_payload.decode("utf-8"))
+        except redis.RedisError as exc:
+            logger.warning("Redis cache read failed: %s", str(exc))
+        except json.JSONDecodeError:
+            logger.warning("Redis cache payload invalid, ignoring")
+    elif get_local_cache() is not None:
+        try:
+            cached_payload = get_local_cache().get(cache_key)
+            record_cache_lookup("actuator", "local", bool(cached_payload))
+            if cached_payload:
+                logger.info("Actuator cache hit (local) %s", url)
+                return json.loads(cached_payload)
+        except sqlite3.Error as exc:
+            logger.warning("Local cache read failed: %s", str(exc))
+        except json.JSONDecodeError:
+            logger.warning("Local cache payload invalid, ignoring")
+    return None
+
+
+def write_actuator_cache(cache_key: str, payload: str):
+    if CACHE_TTL_SECONDS <= 0:
+        return
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        try:
+            with trace_span("cache-write", cache="actuator", tier="redis", bytes=len(payload)):
+                redis_client.setex(cache_key, CACHE_TTL_SECONDS, payload.encode("utf-8"))
+        except redis.RedisError as exc:
+            logger.warning("Redis cache write failed: %s", str(exc))
+    elif get_local_cache() is not None:
+        try:
+            with trace_span("cache-write", cache="actuator", tier="local", bytes=len(payload)):
+                get_local_cache().set(cache_key, payload, CACHE_TTL_SECONDS)
+        except sqlite3.Error as exc:
+            logger.warning("Local cache write failed: %s", str(exc))
+
+
+def get_actuator_client():
+    """Returns the worker's pooled async HTTP client for actuator probes.
+
+    The client is bound to the running event loop, so a new one is created if
+    the loop changes (only happens outside uvicorn, e.g. in test clients).
+    """
+    global _actuator_client
+    loop = asyncio.get_running_loop()
+    if _actuator_client is None or _actuator_client[0] is not loop:
+        http2 = ACTUATOR_HTTP2 and importlib.util.find_spec("h2") is not None
+        client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                ACTUATOR_READ_TIMEOUT_SECONDS,
+                connect=ACTUATOR_CONNECT_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_connections=ACTUATOR_MAX_CONNECTIONS,
+                max_keepalive_connections=ACTUATOR_MAX_CONNECTIONS,
+                keepalive_expiry=30,
+            ),
+            headers={"Accept": "application/json"},
         )
-    except urllib.error.URLError as exc:
-        logger.error("Actuator unreachable: %s", exc.reason)
-        raise_structured_error(502, "actuator_unreachable", f"Actuator endpoint not reachable: {exc.reason}")
+        _actuator_client = (loop, client, {})
+    return _actuator_client[1], _actuator_client[2]
+
+
+async def close_actuator_client():
+    global _actuator_client
+    if _actuator_client is not None:
+        await _actuator_client[1].aclose()
+        _actuator_client = None
+
+
+async def request_actuator_env(url: str, cache_key: str):
+    client, host_limits = get_actuator_client()
+    host = urllib.parse.urlsplit(url).netloc
+    # [semaphore, requests using it]; the entry goes once its last request is done,
+    # so hosts from pods that come and go don't pile up for the worker's lifetime.
+    host_limit = host_limits.get(host)
+    if host_limit is None:
+        host_limit = host_limits[host] = [asyncio.Semaphore(ACTUATOR_MAX_CONNECTIONS_PER_HOST), 0]
+    host_limit[1] += 1
+    try:
+        async with host_limit[0]:
+            started = time.monotonic()
+            with trace_span("actuator-http", host=host):
+                response = await client.get(url)
+    except httpx.TimeoutException as exc:
+        ACTUATOR_FETCH_SECONDS.labels("actuator_timeout").observe(time.monotonic() - started)
+        logger.error("Actuator timeout %s: %s", url, type(exc).__name__)
+        raise_structured_error(502, "actuator_timeout", f"Actuator endpoint timed out: {type(exc).__name__}")
+    except httpx.HTTPError as exc:
+        ACTUATOR_FETCH_SECONDS.labels("actuator_unreachable").observe(time.monotonic() - started)
+        logger.error("Actuator unreachable: %s", str(exc))
+        raise_structured_error(502, "actuator_unreachable", f"Actuator endpoint not reachable: {str(exc)}")
+    finally:
+        host_limit[1] -= 1
+        if not host_limit[1] and host_limits.get(host) is host_limit:
+            del host_limits[host]
 
-    if status_code != 200:
-        logger.error("Actuator non-200 %s", status_code)
+    payload = response.text
+    ACTUATOR_FETCH_SECONDS.labels("ok" if response.status_code == 200 else "actuator_non_200").observe(
+        time.monotonic() - started
+    )
+    if response.status_code != 200:
+        logger.error("Actuator HTTP error %s: %s", response.status_code, payload)
         raise_structured_error(
             502,
             "actuator_non_200",
-            f"Actuator returned HTTP {status_code}",
-            {"status": status_code, "body": payload},
+            f"Actuator returned HTTP {response.status_code}",
+            {"status": response.status_code, "body": payload},
         )
 
     try:
@@ -1178,19 +3477,36 @@ def fetch_actuator_env(url: str):
     except json.JSONDecodeError as exc:
         logger.error("Actuator JSON parse error: %s", str(exc))
         raise_structured_error(502, "actuator_invalid_json", f"Actuator returned invalid JSON: {str(exc)}")
-    if CACHE_TTL_SECONDS > 0:
-        cache_key = f"actuator-env:{url}"
-        redis_client = get_redis_client()
-        if redis_client is not None:
-            try:
-                redis_client.setex(cache_key, CACHE_TTL_SECONDS, payload.encode("utf-8"))
-            except redis.RedisError as exc:
-                logger.warning("Redis cache write failed: %s", str(exc))
-        else:
-            _actuator_cache[cache_key] = (time.time() + CACHE_TTL_SECONDS, parsed)
+    await asyncio.to_thread(write_actuator_cache, cache_key, payload)
     return parsed
 
 
+async def fetch_actuator_env_coalesced(url: str, cache_key: str):
+    # Another caller may have filled the cache while we queued for the flight.
+    cached = await asyncio.to_thread(read_actuator_cache, cache_key, url)
+    if cached is not None:
+        return cached
+    redis_client = get_redis_client() if CACHE_TTL_SECONDS > 0 else None
+    if redis_client is None:
+        return await request_actuator_env(url, cache_key)
+    return await redis_single_flight(
+        redis_client,
+        cache_key,
+        lambda: request_actuator_env(url, cache_key),
+        lambda: asyncio.to_thread(read_actuator_cache, cache_key, url),
+    )
+
+
+async def fetch_actuator_env(url: str):
+    logger.info("Fetching actuator env %s", url)
+    cache_key = f"actuator-env:{url}"
+    with trace_span("actuator", url=url):
+        cached = await asyncio.to_thread(read_actuator_cache, cache_key, url)
+        if cached is not None:
+            return cached
+        return await _async_single_flight.do(cache_key, lambda: fetch_actuator_env_coalesced(url, cache_key))
+
+
 def normalize_workload(item, kind_label):
     return {
         "name": item.get("metadata", {}).get("name"),
@@ -1278,9 +3594,17 @@ def build_effective_entries(property_sources):
 
 
 def list_workloads(namespace: str):
+    with trace_span("list-workloads", namespace=namespace) as span:
+        workloads = load_workloads(namespace)
+        if span is not None:
+            span["attributes"]["workloads"] = len(workloads)
+        return workloads
+
+
+def load_workloads(namespace: str):
     workloads = []
     try:
-        data = run_oc(["get", "deployments", "-n", namespace, "-o", "json"], expect_json=True)
+        data = kube_list("deployments", namespace)
         for item in data.get("items", []) or []:
             entry = normalize_workload(item, "deployment")
             entry["resource"] = item
@@ -1293,7 +3617,7 @@ def list_workloads(namespace: str):
             raise
 
     try:
-        data = run_oc(["get", "deploymentconfigs", "-n", namespace, "-o", "json"], expect_json=True)
+        data = kube_list("deploymentconfigs", namespace)
         for item in data.get("items", []) or []:
             entry = normalize_workload(item, "deploymentconfig")
             entry["resource"] = item
@@ -1311,16 +3635,270 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    await close_actuator_client()
+
+
+@app.on_event("shutdown")
+async def release_metrics_files():
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+@app.get("/metrics")
+def get_metrics():
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+_trace_export_queue = None
+_trace_export_task = None
+_loop_lag_task = None
+
+
+def trace_record(trace: RequestTrace, status_code: int, end_ns: int):
+    with trace._lock:
+        spans = list(trace.spans)
+        dropped = trace.dropped
+    return {
+        "traceId": trace.trace_id,
+        "spanId": trace.span_id,
+        "name": trace.name,
+        "status": status_code,
+        "startNs": trace.start_ns,
+        "endNs": end_ns,
+        "spans": spans,
+        "droppedSpans": dropped,
+    }
+
+
+def otlp_attributes(attributes: dict):
+    converted = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            converted.append({"key": key, "value": {"boolValue": value}})
+        elif isinstance(value, int):
+            converted.append({"key": key, "value": {"intValue": str(value)}})
+        elif isinstance(value, float):
+            converted.append({"key": key, "value": {"doubleValue": value}})
+        else:
+            converted.append({"key": key, "value": {"stringValue": str(value)}})
+    return converted
+
+
+def otlp_payload(records):
+    """OTLP/HTTP JSON body (ExportTraceServiceRequest) for a batch of trace records."""
+    spans = []
+    for record in records:
+        spans.append({
+            "traceId": record["traceId"],
+            "spanId": record["spanId"],
+            "name": record["name"],
+            "kind": 2,
+            "startTimeUnixNano": str(record["startNs"]),
+            "endTimeUnixNano": str(record["endNs"]),
+            "attributes": otlp_attributes({
+                "http.response.status_code": record["status"],
+                "dashboard.dropped_spans": record["droppedSpans"],
+            }),
+            "status": {"code": 2} if record["status"] >= 500 else {},
+        })
+        for span in record["spans"]:
+            spans.append({
+                "traceId": record["traceId"],
+                "spanId": span["spanId"],
+                "parentSpanId": span["parentSpanId"],
+                "name": span["name"],
+                "kind": 1,
+                "startTimeUnixNano": str(span["startNs"]),
+                "endTimeUnixNano": str(span["startNs"] + int(span["durationMs"] * 1e6)),
+                "attributes": otlp_attributes(span["attributes"]),
+                "status": {"code": 2, "message": span["error"]} if "error" in span else {},
+            })
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": otlp_attributes({"service.name": TRACE_SERVICE_NAME})},
+            "scopeSpans": [{"scope": {"name": "openshift-dashboard"}, "spans": spans}],
+        }],
+    }
+
+
+def write_trace_file(records):
+    data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records).encode("utf-8")
+    # One O_APPEND write per batch keeps lines from different workers from interleaving.
+    fd = os.open(TRACE_FILE_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+async def run_trace_exporter(queue: asyncio.Queue):
+    client = httpx.AsyncClient(timeout=5.0) if TRACE_EXPORT == "otlp" else None
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < 128 and not queue.empty():
+                batch.append(queue.get_nowait())
+            stopping = None in batch
+            records = [record for record in batch if record is not None]
+            if records:
+                try:
+                    if TRACE_EXPORT == "file":
+                        await asyncio.to_thread(write_trace_file, records)
+                    else:
+                        response = await client.post(TRACE_OTLP_ENDPOINT, json=otlp_payload(records))
+                        if response.status_code >= 400:
+                            logger.warning("OTLP export returned HTTP %s", response.status_code)
+                except (OSError, httpx.HTTPError) as exc:
+                    logger.warning("Trace export failed: %s", str(exc))
+            if stopping:
+                return
+    finally:
+        if client is not None:
+            await client.aclose()
+
+
+def export_trace(trace: RequestTrace, status_code: int):
+    if _trace_export_queue is None:
+        return
+    if TRACE_SAMPLE_RATE < 1 and random.random() >= TRACE_SAMPLE_RATE:
+        return
+    try:
+        _trace_export_queue.put_nowait(trace_record(trace, status_code, time.time_ns()))
+    except asyncio.QueueFull:
+        logger.debug("Trace export queue full, dropping %s", trace.trace_id)
+
+
+async def monitor_loop_lag(threshold_ms: int):
+    """Samples how late a short sleep wakes up; a late wakeup means something held the loop."""
+    loop = asyncio.get_running_loop()
+    interval = min(0.5, max(0.01, threshold_ms / 1000))
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - started - interval)
+        EVENT_LOOP_LAG_SECONDS.observe(lag)
+        if lag * 1000 > threshold_ms:
+            logger.warning("Event loop blocked for %.0fms (threshold %sms)", lag * 1000, threshold_ms)
+
+
+@app.on_event("startup")
+async def start_loop_lag_monitor():
+    global _loop_lag_task
+    if LOOP_LAG_MONITOR_MS and _loop_lag_task is None:
+        # Debug mode makes asyncio log each callback or task step that runs longer than
+        # slow_callback_duration ("Executing <Task ...> took 0.250 seconds"), naming the
+        # culprit; the sampler catches blocks that debug mode does not attribute.
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = LOOP_LAG_MONITOR_MS / 1000
+        _loop_lag_task = asyncio.create_task(monitor_loop_lag(LOOP_LAG_MONITOR_MS))
+
+
+@app.on_event("shutdown")
+async def stop_loop_lag_monitor():
+    global _loop_lag_task
+    if _loop_lag_task is not None:
+        _loop_lag_task.cancel()
+        _loop_lag_task = None
+
+
+@app.on_event("startup")
+async def start_trace_exporter():
+    global _trace_export_queue, _trace_export_task
+    if TRACE_EXPORT:
+        _trace_export_queue = asyncio.Queue(maxsize=1024)
+        _trace_export_task = asyncio.create_task(run_trace_exporter(_trace_export_queue))
+
+
+@app.on_event("shutdown")
+async def stop_trace_exporter():
+    global _trace_export_queue, _trace_export_task
+    if _trace_export_task is None:
+        return
+    queue, task = _trace_export_queue, _trace_export_task
+    _trace_export_queue = _trace_export_task = None
+    try:
+        queue.put_nowait(None)
+        await asyncio.wait_for(task, timeout=5)
+    except (asyncio.QueueFull, asyncio.TimeoutError):
+        task.cancel()
+
+
+async def attach_timing_breakdown(response, trace: RequestTrace):
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {key: value for key, value in response.headers.items() if key.lower() != "content-length"}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return Response(content=body, status_code=response.status_code, headers=headers)
+    breakdown = trace.breakdown()
+    if isinstance(payload, dict):
+        payload["debugTiming"] = breakdown
+    else:
+        payload = {"data": payload, "debugTiming": breakdown}
+    return Response(content=json.dumps(payload), status_code=response.status_code, headers=headers)
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Records spans for the request, reports them in Server-Timing and optionally in the body.
+
+    Headers go out before a streamed body is produced, so for streaming
+    endpoints Server-Timing covers the work done up to the first byte; the
+    exported trace covers the whole response.
+    """
+    trace = RequestTrace(f"{request.method} {request.url.path}")
+    token = _current_trace.set(trace)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_trace.reset(token)
+    route = request.scope.get("route")
+    if route is not None:
+        trace.name = f"{request.method} {route.path}"
+    debug_timing = request.query_params.get("debugTiming", "").lower() in ("1", "true", "yes")
+    if debug_timing and response.headers.get("content-type", "").startswith("application/json"):
+        response = await attach_timing_breakdown(response, trace)
+    response.headers["Server-Timing"] = trace.server_timing()
+    response.headers["Timing-Allow-Origin"] = "*"
+    if _trace_export_queue is not None and not hasattr(response, "body_iterator"):
+        export_trace(trace, response.status_code)
+    elif _trace_export_queue is not None:
+        body_iterator = response.body_iterator
+        status_code = response.status_code
+
+        async def export_after_body():
+            try:
+                async for chunk in body_iterator:
+                    yield chunk
+            finally:
+                export_trace(trace, status_code)
+
+        response.body_iterator = export_after_body()
+    return response
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    local_cache = get_local_cache()
+    return {
+        "redis": bool(REDIS_HOST),
+        "local": await asyncio.to_thread(local_cache.stats) if local_cache is not None else None,
+        "configParse": _parsed_config_cache.stats() if _parsed_config_cache is not None else None,
+    }
+
+
 @app.get("/api/namespaces")
 async def get_namespaces():
     try:
-        data = run_oc(["get", "projects", "-o", "json"], expect_json=True)
-        namespaces = []
-        for item in data.get("items", []):
-            name = item.get("metadata", {}).get("name")
-            if name:
-                namespaces.append({"name": name})
-        return namespaces
+        return [{"name": name} for name in await list_namespace_names()]
     except HTTPException:
         raise
     except Exception as exc:
@@ -1330,7 +3908,7 @@ async def get_namespaces():
 @app.get("/api/{namespace}/deployments")
 async def get_deployments(namespace: str):
     try:
-        data = run_oc(["get", "deployments", "-n", namespace, "-o", "json"], expect_json=True)
+        data = await kube_list_async("deployments", namespace)
         return [normalize_workload(item, "deployment") for item in data.get("items", [])]
     except HTTPException as exc:
         detail = getattr(exc, "detail", "")
@@ -1346,7 +3924,7 @@ async def get_deployments(namespace: str):
 @app.get("/api/{namespace}/deploymentconfigs")
 async def get_deploymentconfigs(namespace: str):
     try:
-        data = run_oc(["get", "deploymentconfigs", "-n", namespace, "-o", "json"], expect_json=True)
+        data = await kube_list_async("deploymentconfigs", namespace)
         return [normalize_workload(item, "deploymentconfig") for item in data.get("items", [])]
     except HTTPException as exc:
         detail = getattr(exc, "detail", "")
@@ -1370,15 +3948,17 @@ class ApplySpringConfigAgentRequest(BaseModel):
     includeLogs: Optional[bool] = False
 
 
+class SpringConfigAgentSweepRequest(BaseModel):
+    workloadNames: Optional[List[str]] = None
+    includeLogs: Optional[bool] = False
+
+
 @app.patch("/api/deployments/{namespace}/{name}/scale")
 async def scale_deployment(namespace: str, name: str, request: ScaleRequest):
     try:
         if request.replicas < 0:
             raise HTTPException(status_code=400, detail="Replicas must be >= 0")
-        run_oc(
-            ["scale", f"deployment/{name}", "-n", namespace, f"--replicas={request.replicas}"],
-            expect_json=False,
-        )
+        await kube_scale("deployment", name, namespace, request.replicas)
         return {"success": True, "message": f"Scaled deployment {name} to {request.replicas} replicas"}
     except HTTPException:
         raise
@@ -1391,10 +3971,7 @@ async def scale_deploymentconfig(namespace: str, name: str, request: ScaleReques
     try:
         if request.replicas < 0:
             raise HTTPException(status_code=400, detail="Replicas must be >= 0")
-        run_oc(
-            ["scale", f"deploymentconfig/{name}", "-n", namespace, f"--replicas={request.replicas}"],
-            expect_json=False,
-        )
+        await kube_scale("deploymentconfig", name, namespace, request.replicas)
         return {"success": True, "message": f"Scaled deploymentconfig {name} to {request.replicas} replicas"}
     except HTTPException:
         raise
@@ -1408,11 +3985,48 @@ async def get_spring_config_report(
     pattern: str,
     caseInsensitive: bool = False,
     searchIn: str = "value",
+    source: str = "auto",
 ):
-    return await build_config_report(namespace, pattern, caseInsensitive, searchIn)
+    index, indexed_at = await select_report_source([namespace], source)
+    if index is None:
+        report = await build_config_report(namespace, pattern, caseInsensitive, searchIn)
+    else:
+        started = time.monotonic()
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+        report = await build_indexed_report(index, namespace, pattern, caseInsensitive, regex, search_in)
+        observe_report("single", "index", started, report["totalWorkloads"])
+    return {**report, **report_freshness(indexed_at)}
+
+
+def actuator_env_url(service_name: str, namespace: str, port):
+    return ACTUATOR_URL_TEMPLATE.format(service=service_name, namespace=namespace, port=port)
+
+
+def resolve_workload_actuator(namespace: str, workload: dict, services_map: dict):
+    """Returns (service_name, actuator_url, skip_message) for a report workload.
+
+    skip_message is set, and the other two are None, when the workload has no
+    matching service or no usable port.
+    """
+    workload_name = workload.get("name")
+    workload_resource = get_workload_resource(workload)
+    service = get_service_by_name(namespace, workload_name, services_map)
+    if not service:
+        logger.warning("Config report skip=%s reason=service_not_found", workload_name)
+        return None, None, "No matching service found"
+
+    port = resolve_probe_port(workload_resource)
+    if port is None:
+        port = resolve_service_port(service)
+    if port is None:
+        logger.warning("Config report skip=%s reason=service_port_missing", workload_name)
+        return None, None, "Matching service has no port"
+
+    service_name = service.get("metadata", {}).get("name") or workload_name
+    return service_name, actuator_env_url(service_name, namespace, port), None
 
 
-def process_report_workload(namespace: str, workload: dict, regex, search_in: str, services_map: dict):
+async def process_report_workload(namespace: str, workload: dict, regex, search_in: str, services_map: dict):
     workload_name = workload.get("name")
     workload_kind = workload.get("kind")
     if not workload_name:
@@ -1420,32 +4034,16 @@ def process_report_workload(namespace: str, workload: dict, regex, search_in: st
     logger.info("Config report workload=%s kind=%s", workload_name, workload_kind)
 
     try:
-        workload_resource = get_workload_resource(workload)
-        service = get_service_by_name(namespace, workload_name, services_map)
-        if not service:
-            logger.warning("Config report skip=%s reason=service_not_found", workload_name)
-            return None, {
-                "workloadName": workload_name,
-                "workloadKind": workload_kind,
-                "message": "No matching service found",
-            }
-
-        port = resolve_probe_port(workload_resource)
-        if port is None:
-            port = resolve_service_port(service)
-        if port is None:
-            logger.warning("Config report skip=%s reason=service_port_missing", workload_name)
+        service_name, actuator_url, skip_message = resolve_workload_actuator(namespace, workload, services_map)
+        if skip_message:
             return None, {
                 "workloadName": workload_name,
                 "workloadKind": workload_kind,
-                "message": "Matching service has no port",
+                "message": skip_message,
             }
 
-        service_name = service.get("metadata", {}).get("name") or workload_name
-        service_host = f"{service_name}.{namespace}.svc.cluster.local"
-        actuator_url = f"http://{service_host}:{port}/actuator/env"
         logger.info("Config report actuator=%s", actuator_url)
-        actuator_payload = fetch_actuator_env(actuator_url)
+        actuator_payload = await fetch_actuator_env(actuator_url)
 
         property_sources, _ = extract_env_details(actuator_payload)
         effective_entries = build_effective_entries(property_sources)
@@ -1457,8 +4055,12 @@ def process_report_workload(namespace: str, workload: dict, regex, search_in: st
         )
 
         matched_keys = []
-        for key, entry in effective_entries.items():
-            value_text = stringify_property_value(entry.get("value"))
+        keys = list(effective_entries)
+        value_texts = [stringify_property_value(effective_entries[key].get("value")) for key in keys]
+        for position in regex.candidates(value_texts):
+            key = keys[position]
+            entry = effective_entries[key]
+            value_text = value_texts[position]
             matches_value = regex.search(value_text) is not None
 
             if search_in == "value" and not matches_value:
@@ -1468,7 +4070,7 @@ def process_report_workload(namespace: str, workload: dict, regex, search_in: st
                 "key": key,
                 "source": entry.get("source"),
                 "matchOn": "value",
-                "value": stringify_property_value(entry.get("value")),
+                "value": value_text,
             })
 
         logger.info(
@@ -1493,11 +4095,14 @@ def process_report_workload(namespace: str, workload: dict, regex, search_in: st
             workload_name,
             detail if isinstance(detail, str) else "HTTPException",
         )
-        return None, {
+        error_item = {
             "workloadName": workload_name,
             "workloadKind": workload_kind,
             "message": detail if isinstance(detail, str) else "Failed to fetch actuator env",
         }
+        if isinstance(detail, dict) and detail.get("error"):
+            error_item["code"] = detail["error"]
+        return None, error_item
     except Exception as exc:
         logger.exception("Config report workload=%s unexpected_error", workload_name)
         return None, {
@@ -1507,7 +4112,252 @@ def process_report_workload(namespace: str, workload: dict, regex, search_in: st
         }
 
 
+REPORT_PREFILTER_MIN_LITERAL = 2
+_REGEX_REPEAT_OPS = tuple(
+    op for op in (
+        getattr(_regex_parser, "MAX_REPEAT", None),
+        getattr(_regex_parser, "MIN_REPEAT", None),
+        getattr(_regex_parser, "POSSESSIVE_REPEAT", None),
+    ) if op is not None
+)
+
+
+def _required_literal_sets(items):
+    """Requirements of a parsed regex sequence: each is a tuple of strings, one of which every match contains."""
+    requirements = []
+    run = []
+
+    def flush():
+        if run:
+            requirements.append(("".join(run),))
+            run.clear()
+
+    for op, arg in items:
+        if op is _regex_parser.LITERAL:
+            run.append(chr(arg))
+            continue
+        flush()
+        if op is _regex_parser.SUBPATTERN:
+            _, add_flags, del_flags, inner = arg
+            if not add_flags and not del_flags:
+                requirements.extend(_required_literal_sets(inner))
+        elif op in _REGEX_REPEAT_OPS:
+            minimum, _, inner = arg
+            if minimum >= 1:
+                requirements.extend(_required_literal_sets(inner))
+        elif op is getattr(_regex_parser, "ATOMIC_GROUP", None):
+            requirements.extend(_required_literal_sets(arg))
+        elif op is _regex_parser.BRANCH:
+            alternatives = []
+            for branch in arg[1]:
+                best = _best_literal_set(_required_literal_sets(branch))
+                if best is None:
+                    alternatives = None
+                    break
+                alternatives.extend(best)
+            if alternatives:
+                requirements.append(tuple(dict.fromkeys(alternatives)))
+    flush()
+    return requirements
+
+
+def _best_literal_set(requirements):
+    usable = [item for item in requirements if min(len(literal) for literal in item) >= REPORT_PREFILTER_MIN_LITERAL]
+    if not usable:
+        return None
+    return max(usable, key=lambda item: (min(len(literal) for literal in item), -len(item)))
+
+
+def required_literals(regex):
+    """Literal substrings of which every match of `regex` contains at least one, or None."""
+    try:
+        parsed = _regex_parser.parse(regex.pattern, regex.flags)
+    except Exception:
+        return None
+    return _best_literal_set(_required_literal_sets(parsed))
+
+
+class PrefilteredRegex:
+    """A compiled report pattern that can skip values lacking its required literals.
+
+    `candidates` joins a batch of values into one string and locates the
+    required literals with str.find, so values that cannot match are rejected
+    at memchr speed without a per-value Python call or regex setup; the regex
+    then runs only on the values containing a hit. Results are identical to
+    running the bare regex on every value: case-insensitive patterns are only
+    prefiltered with ASCII literals against ASCII text, where lower() folds
+    case exactly as the regex does. `search` is the plain regex search.
+    """
+
+    def __init__(self, regex):
+        self.regex = regex
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+        self.ignore_case = bool(regex.flags & re.IGNORECASE)
+        literals = required_literals(regex)
+        if literals and self.ignore_case:
+            literals = tuple(literal.lower() for literal in literals) if all(
+                literal.isascii() for literal in literals
+            ) else None
+        self.literals = literals
+
+    def sql_literal(self):
+        """The single literal usable as an exact SQL substring filter, if any."""
+        if self.literals and len(self.literals) == 1 and not self.ignore_case:
+            return self.literals[0]
+        return None
+
+    def search(self, text):
+        return self.regex.search(text)
+
+    def candidates(self, texts):
+        """Indexes into `texts` (a list of str) of the values the regex could match, in order."""
+        literals = self.literals
+        if literals is None or len(texts) < 2:
+            return range(len(texts))
+        blob = "\n".join(texts)
+        if self.ignore_case:
+            if not blob.isascii():
+                return range(len(texts))
+            blob = blob.lower()
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        found = set()
+        for literal in literals:
+            position = blob.find(literal)
+            while position != -1:
+                index = bisect.bisect_right(starts, position) - 1
+                found.add(index)
+                # Resume at the next value: one hit is enough to make this one a candidate.
+                next_start = starts[index + 1] if index + 1 < len(starts) else len(blob)
+                position = blob.find(literal, next_start)
+        return sorted(found)
+
+
+def compile_report_regex(pattern: str, case_insensitive: bool, search_in: str):
+    if not pattern:
+        raise HTTPException(status_code=400, detail="pattern query parameter is required")
+    search_in = (search_in or "value").lower()
+    if search_in != "value":
+        raise HTTPException(status_code=400, detail="searchIn must be: value")
+    try:
+        flags = re.IGNORECASE if case_insensitive else 0
+        regex = re.compile(pattern, flags=flags)
+    except re.error as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid regex pattern: {str(exc)}")
+    return PrefilteredRegex(regex), search_in
+
+
+async def load_report_workloads(namespace: str):
+    workloads = await asyncio.to_thread(list_workloads, namespace)
+    services_map = await asyncio.to_thread(get_services_map, namespace)
+    workloads.sort(key=lambda item: item.get("name") or "")
+    return workloads, services_map
+
+
+REPORT_OVERLOAD_ERRORS = ("actuator_timeout",)
+
+
+class AdaptiveLimiter:
+    """Concurrency limit for report fan-out that tracks what the cluster sustains.
+
+    AIMD on observed actuator latency: each fast completion adds 1/limit (about
+    +1 per window of `limit` completions), while a timeout, or a latency above
+    twice the running baseline (and above CONFIG_REPORT_LATENCY_FLOOR_SECONDS),
+    shrinks the limit multiplicatively, at most once per baseline latency so a
+    burst of slow responses counts as one signal. The limit stays within
+    [CONFIG_REPORT_CONCURRENCY_MIN, CONFIG_REPORT_CONCURRENCY_MAX]; with
+    CONFIG_REPORT_ADAPTIVE=false it behaves like a plain semaphore.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, adaptive: bool = True):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.initial = min(max(initial, self.minimum), self.maximum)
+        self.limit = float(self.initial)
+        self.adaptive = adaptive
+        self.inflight = 0
+        self.baseline = None
+        self.decreased_at = 0.0
+        self.condition = asyncio.Condition()
+
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    def describe(self):
+        return {
+            "adaptive": self.adaptive,
+            "initial": self.initial,
+            "min": self.minimum,
+            "max": self.maximum,
+            "limit": self.current_limit(),
+        }
+
+    async def acquire(self):
+        REPORT_WAITING.inc()
+        try:
+            async with self.condition:
+                await self.condition.wait_for(lambda: self.inflight < int(self.limit))
+                self.inflight += 1
+        finally:
+            REPORT_WAITING.dec()
+        REPORT_INFLIGHT.inc()
+
+    async def release(self, latency: float, overloaded: bool):
+        REPORT_INFLIGHT.dec()
+        async with self.condition:
+            self.inflight -= 1
+            if self.adaptive:
+                self.observe(latency, overloaded)
+            self.condition.notify_all()
+
+    def observe(self, latency: float, overloaded: bool):
+        now = time.monotonic()
+        if self.baseline is None or latency < self.baseline:
+            self.baseline = latency
+        else:
+            # Let the baseline drift up slowly so one lucky sample does not pin it.
+            self.baseline += (latency - self.baseline) * 0.01
+        cooldown = max(self.baseline, 0.1)
+        slow = latency > max(self.baseline * 2, CONFIG_REPORT_LATENCY_FLOOR_SECONDS)
+        if overloaded or slow:
+            if now - self.decreased_at >= cooldown:
+                factor = 0.7 if overloaded else 0.9
+                self.limit = max(float(self.minimum), self.limit * factor)
+                self.decreased_at = now
+            return
+        self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+
+
+def report_initial_concurrency(loaded) -> int:
+    return CONFIG_REPORT_CONCURRENCY if len(loaded) <= 1 else CONFIG_REPORT_GLOBAL_CONCURRENCY
+
+
+def new_report_limiter(initial: int):
+    return AdaptiveLimiter(
+        initial,
+        CONFIG_REPORT_CONCURRENCY_MIN,
+        max(CONFIG_REPORT_CONCURRENCY_MAX, initial),
+        CONFIG_REPORT_ADAPTIVE,
+    )
+
+
+def summarize_report_results(results):
+    matched = []
+    errors = []
+    for matched_item, error_item in results:
+        if matched_item:
+            matched.append(matched_item)
+        if error_item:
+            errors.append(error_item)
+    return matched, errors
+
+
 async def build_config_report(namespace: str, pattern: str, case_insensitive: bool, search_in: str):
+    started = time.monotonic()
     try:
         logger.info(
             "Config report request namespace=%s pattern=%s caseInsensitive=%s searchIn=%s",
@@ -1516,55 +4366,35 @@ async def build_config_report(namespace: str, pattern: str, case_insensitive: bo
             case_insensitive,
             search_in,
         )
-        if not pattern:
-            raise HTTPException(status_code=400, detail="pattern query parameter is required")
-        search_in = (search_in or "value").lower()
-        if search_in != "value":
-            raise HTTPException(status_code=400, detail="searchIn must be: value")
-        try:
-            flags = re.IGNORECASE if case_insensitive else 0
-            regex = re.compile(pattern, flags=flags)
-        except re.error as exc:
-            raise HTTPException(status_code=400, detail=f"Invalid regex pattern: {str(exc)}")
+        regex, search_in = compile_report_regex(pattern, case_insensitive, search_in)
 
-        workloads = await asyncio.to_thread(list_workloads, namespace)
-        services_map = await asyncio.to_thread(get_services_map, namespace)
-        workloads.sort(key=lambda item: item.get("name") or "")
+        workloads, services_map = await load_report_workloads(namespace)
         logger.info("Config report workloads=%s", len(workloads))
 
-        matched = []
-        errors = []
-        sem = asyncio.Semaphore(CONFIG_REPORT_CONCURRENCY)
+        limiter = new_report_limiter(CONFIG_REPORT_CONCURRENCY)
+        results = []
+        async for _, result in iter_report_results(
+            [(namespace, workloads, services_map, None)], regex, search_in, limiter
+        ):
+            results.append(result)
+        matched, errors = summarize_report_results(results)
 
-        async def run_workload(workload: dict):
-            async with sem:
-                return await asyncio.to_thread(
-                    process_report_workload,
-                    namespace,
-                    workload,
-                    regex,
-                    search_in,
-                    services_map,
-                )
-
-        tasks = [run_workload(workload) for workload in workloads if workload.get("name")]
-        results = await asyncio.gather(*tasks)
-
-        for matched_item, error_item in results:
-            if matched_item:
-                matched.append(matched_item)
-            if error_item:
-                errors.append(error_item)
-
-        logger.info("Config report done matched=%s errors=%s", len(matched), len(errors))
+        logger.info(
+            "Config report done matched=%s errors=%s concurrencyLimit=%s",
+            len(matched),
+            len(errors),
+            limiter.current_limit(),
+        )
+        observe_report("single", "live", started, len(workloads), limiter)
         return {
             "namespace": namespace,
             "pattern": pattern,
             "caseInsensitive": case_insensitive,
             "searchIn": search_in,
             "totalWorkloads": len(workloads),
-            "matched": matched,
-            "errors": errors,
+            "matched": sort_report_items(matched),
+            "errors": sort_report_items(errors),
+            "concurrency": limiter.describe(),
         }
     except HTTPException:
         raise
@@ -1572,27 +4402,946 @@ async def build_config_report(namespace: str, pattern: str, case_insensitive: bo
         raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
 
 
-@app.get("/api/config/{namespace}/{workloadName}/report")
-async def get_spring_config_report_for_workload(
+async def list_namespace_names():
+    data = await kube_list_async("projects")
+    names = []
+    for item in data.get("items", []):
+        name = item.get("metadata", {}).get("name")
+        if name:
+            names.append(name)
+    return names
+
+
+async def resolve_report_namespaces(namespaces: str):
+    requested = [item.strip() for item in (namespaces or "").split(",") if item.strip()]
+    if not requested:
+        raise HTTPException(status_code=400, detail="namespaces query parameter is required")
+    if requested == ["all"]:
+        return "all", sorted(await list_namespace_names())
+    return "list", list(dict.fromkeys(requested))
+
+
+def namespace_report_error(namespace: str, exc: Exception):
+    detail = getattr(exc, "detail", None)
+    message = detail if isinstance(detail, str) else str(exc) or "Failed to list workloads"
+    return {"workloadName": namespace, "workloadKind": "namespace", "message": message}
+
+
+async def load_report_namespaces(namespaces):
+    sem = asyncio.Semaphore(CONFIG_REPORT_GLOBAL_CONCURRENCY)
+
+    async def load_namespace(namespace: str):
+        async with sem:
+            try:
+                workloads, services_map = await load_report_workloads(namespace)
+                return namespace, workloads, services_map, None
+            except Exception as exc:
+                logger.warning("Multi-namespace report namespace=%s load_error=%s", namespace, str(exc))
+                return namespace, [], {}, namespace_report_error(namespace, exc)
+
+    return await asyncio.gather(*[load_namespace(namespace) for namespace in namespaces])
+
+
+async def iter_report_results(loaded, regex, search_in: str, limiter=None):
+    """Yields (namespace, (matched, error)) for each workload as it completes.
+
+    Workloads are scheduled round-robin across namespaces under `limiter`
+    (an AdaptiveLimiter; defaults to CONFIG_REPORT_CONCURRENCY for a single
+    namespace and CONFIG_REPORT_GLOBAL_CONCURRENCY otherwise). When
+    more than one namespace is scanned, each task also holds a per-namespace
+    slot (CONFIG_REPORT_CONCURRENCY) first, so one large namespace cannot
+    starve the others. Pending work is cancelled if the consumer stops early.
+    """
+    if limiter is None:
+        limiter = new_report_limiter(report_initial_concurrency(loaded))
+    namespace_sems = {}
+    if len(loaded) > 1:
+        namespace_sems = {namespace: asyncio.Semaphore(CONFIG_REPORT_CONCURRENCY) for namespace, *_ in loaded}
+
+    async def run_limited(namespace: str, workload: dict, services_map: dict):
+        await limiter.acquire()
+        started = time.monotonic()
+        overloaded = False
+        try:
+            result = await process_report_workload(
+                namespace,
+                workload,
+                regex,
+                search_in,
+                services_map,
+            )
+            error_item = result[1]
+            overloaded = bool(error_item) and error_item.get("code") in REPORT_OVERLOAD_ERRORS
+            return namespace, result
+        finally:
+            await limiter.release(time.monotonic() - started, overloaded)
+
+    async def run_workload(namespace: str, workload: dict, services_map: dict):
+        namespace_sem = namespace_sems.get(namespace)
+        if namespace_sem is None:
+            return await run_limited(namespace, workload, services_map)
+        async with namespace_sem:
+            return await run_limited(namespace, workload, services_map)
+
+    queues = [
+        [(namespace, workload, services_map) for workload in workloads if workload.get("name")]
+        for namespace, workloads, services_map, _ in loaded
+    ]
+    tasks = []
+    for batch in itertools.zip_longest(*queues):
+        tasks.extend(asyncio.ensure_future(run_workload(*item)) for item in batch if item)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def sort_report_items(items):
+    items.sort(key=lambda item: item.get("workloadName") or "")
+    return items
+
+
+async def build_multi_namespace_report(namespaces, pattern: str, case_insensitive: bool, search_in: str):
+    """Runs the config report across namespaces under one workload budget.
+
+    Workload and service lists are loaded once per namespace and shared by all
+    of that namespace's workloads; scheduling is done by iter_report_results.
+    """
+    started = time.monotonic()
+    regex, search_in = compile_report_regex(pattern, case_insensitive, search_in)
+    logger.info(
+        "Multi-namespace config report namespaces=%s pattern=%s caseInsensitive=%s",
+        len(namespaces),
+        pattern,
+        case_insensitive,
+    )
+    loaded = await load_report_namespaces(namespaces)
+
+    limiter = new_report_limiter(report_initial_concurrency(loaded))
+    results_by_namespace = {namespace: [] for namespace in namespaces}
+    async for namespace, result in iter_report_results(loaded, regex, search_in, limiter):
+        results_by_namespace[namespace].append(result)
+
+    reports = []
+    total_workloads = 0
+    for namespace, workloads, _, load_error in sorted(loaded, key=lambda item: item[0]):
+        matched, errors = summarize_report_results(results_by_namespace[namespace])
+        if load_error:
+            errors.append(load_error)
+        total_workloads += len(workloads)
+        reports.append({
+            "namespace": namespace,
+            "data": {
+                "namespace": namespace,
+                "pattern": pattern,
+                "caseInsensitive": case_insensitive,
+                "searchIn": search_in,
+                "totalWorkloads": len(workloads),
+                "matched": sort_report_items(matched),
+                "errors": sort_report_items(errors),
+            },
+        })
+    logger.info(
+        "Multi-namespace config report done namespaces=%s workloads=%s concurrencyLimit=%s",
+        len(namespaces),
+        total_workloads,
+        limiter.current_limit(),
+    )
+    observe_report("multi", "live", started, total_workloads, limiter)
+    return {
+        "namespaces": [report["namespace"] for report in reports],
+        "pattern": pattern,
+        "caseInsensitive": case_insensitive,
+        "searchIn": search_in,
+        "totalWorkloads": total_workloads,
+        "reports": reports,
+        "concurrency": limiter.describe(),
+    }
+
+
+class SpringPropertyIndex:
+    """On-disk index of effective Spring properties per workload.
+
+    One SQLite file per pod, shared by every worker. Namespaces are tracked
+    once someone runs a report against them (or are listed in
+    SPRING_INDEX_NAMESPACES); one worker, holding a lease row, refreshes
+    tracked namespaces every SPRING_INDEX_INTERVAL_SECONDS and re-fetches only
+    workloads whose pod template changed, that failed last time, or whose
+    entry is older than SPRING_INDEX_MAX_AGE_SECONDS.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+        conn = self.connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS namespaces ("
+            "namespace TEXT PRIMARY KEY, queried_at REAL NOT NULL, refreshed_at REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS workloads ("
+            "namespace TEXT NOT NULL, name TEXT NOT NULL, kind TEXT NOT NULL, service_name TEXT, "
+            "template_hash TEXT NOT NULL, indexed_at REAL NOT NULL, error_code TEXT, error_message TEXT, "
+            "PRIMARY KEY (namespace, name, kind))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS properties ("
+            "namespace TEXT NOT NULL, workload_name TEXT NOT NULL, workload_kind TEXT NOT NULL, "
+            "key TEXT NOT NULL, source TEXT, value TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS properties_workload "
+            "ON properties (namespace, workload_name, workload_kind)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def try_lease(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        conn = self.connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                (name, owner, now + ttl_seconds),
+            )
+            return True
+        finally:
+            conn.execute("COMMIT")
+
+    def track(self, namespaces):
+        now = time.time()
+        self.connection().executemany(
+            "INSERT INTO namespaces (namespace, queried_at) VALUES (?, ?) "
+            "ON CONFLICT(namespace) DO UPDATE SET queried_at = excluded.queried_at",
+            [(namespace, now) for namespace in namespaces],
+        )
+
+    def due_namespaces(self):
+        now = time.time()
+        rows = self.connection().execute(
+            "SELECT namespace FROM namespaces WHERE queried_at >= ? "
+            "AND (refreshed_at IS NULL OR refreshed_at <= ?) ORDER BY refreshed_at IS NOT NULL, refreshed_at",
+            (now - SPRING_INDEX_IDLE_SECONDS, now - SPRING_INDEX_INTERVAL_SECONDS),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def indexed_at(self, namespaces):
+        """Returns when each namespace's oldest indexed workload was fetched (None if never refreshed).
+
+        Unchanged workloads are only re-fetched every SPRING_INDEX_MAX_AGE_SECONDS,
+        so the namespace's refreshed_at overstates how fresh its values are.
+        """
+        conn = self.connection()
+        result = {}
+        for namespace in namespaces:
+            row = conn.execute(
+                "SELECT n.refreshed_at, MIN(w.indexed_at) FROM namespaces n "
+                "LEFT JOIN workloads w ON w.namespace = n.namespace WHERE n.namespace = ? GROUP BY n.namespace",
+                (namespace,),
+            ).fetchone()
+            if not row or row[0] is None:
+                result[namespace] = None
+            else:
+                result[namespace] = row[1] if row[1] is not None else row[0]
+        return result
+
+    def workload_states(self, namespace: str):
+        rows = self.connection().execute(
+            "SELECT name, kind, template_hash, indexed_at, error_code FROM workloads WHERE namespace = ?",
+            (namespace,),
+        ).fetchall()
+        return {(row[0], row[1]): (row[2], row[3], row[4]) for row in rows}
+
+    def store_namespace(self, namespace: str, results, present):
+        """Writes refreshed workloads and drops ones that no longer exist, in one transaction."""
+        conn = self.connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for result in results:
+                workload_key = (namespace, result["name"], result["kind"])
+                conn.execute(
+                    "DELETE FROM properties WHERE namespace = ? AND workload_name = ? AND workload_kind = ?",
+                    workload_key,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO workloads (namespace, name, kind, service_name, template_hash, "
+                    "indexed_at, error_code, error_message) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    workload_key + (
+                        result.get("serviceName"),
+                        result["templateHash"],
+                        now,
+                        result.get("errorCode"),
+                        result.get("errorMessage"),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO properties (namespace, workload_name, workload_kind, key, source, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [workload_key + entry for entry in result.get("entries") or ()],
+                )
+            present = set(present)
+            for name, kind in self.workload_states(namespace):
+                if (name, kind) not in present:
+                    conn.execute(
+                        "DELETE FROM properties WHERE namespace = ? AND workload_name = ? AND workload_kind = ?",
+                        (namespace, name, kind),
+                    )
+                    conn.execute(
+                        "DELETE FROM workloads WHERE namespace = ? AND name = ? AND kind = ?",
+                        (namespace, name, kind),
+                    )
+            conn.execute(
+                "INSERT INTO namespaces (namespace, queried_at, refreshed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(namespace) DO UPDATE SET refreshed_at = excluded.refreshed_at",
+                (namespace, now, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def search(self, namespace: str, regex):
+        """Returns (total_workloads, matched, errors) shaped like a live report."""
+        conn = self.connection()
+        workloads = conn.execute(
+            "SELECT name, kind, service_name, error_code, error_message FROM workloads WHERE namespace = ?",
+            (namespace,),
+        ).fetchall()
+        matched_by_workload = {}
+        query = "SELECT workload_name, workload_kind, key, source, value FROM properties WHERE namespace = ?"
+        params = (namespace,)
+        sql_literal = regex.sql_literal() if isinstance(regex, PrefilteredRegex) else None
+        if sql_literal:
+            # instr() is a byte-exact substring test, so it only narrows what the regex sees.
+            query += " AND instr(value, ?) > 0"
+            params += (sql_literal,)
+        rows = conn.execute(query, params).fetchall()
+        positions = range(len(rows))
+        if isinstance(regex, PrefilteredRegex):
+            positions = regex.candidates([row[4] for row in rows])
+        for position in positions:
+            workload_name, workload_kind, key, source, value = rows[position]
+            if regex.search(value) is None:
+                continue
+            matched_by_workload.setdefault((workload_name, workload_kind), []).append({
+                "key": key,
+                "source": source,
+                "matchOn": "value",
+                "value": value,
+            })
+        matched = []
+        errors = []
+        for name, kind, service_name, error_code, error_message in workloads:
+            if error_message:
+                error_item = {"workloadName": name, "workloadKind": kind, "message": error_message}
+                if error_code:
+                    error_item["code"] = error_code
+                errors.append(error_item)
+                continue
+            matches = matched_by_workload.get((name, kind))
+            if matches:
+                matches.sort(key=lambda item: item["key"])
+                matched.append({
+                    "workloadName": name,
+                    "workloadKind": kind,
+                    "serviceName": service_name,
+                    "matches": matches,
+                })
+        return len(workloads), matched, errors
+
+    def stats(self):
+        conn = self.connection()
+        namespaces = conn.execute(
+            "SELECT n.namespace, n.queried_at, n.refreshed_at, COUNT(w.name) FROM namespaces n "
+            "LEFT JOIN workloads w ON w.namespace = n.namespace GROUP BY n.namespace ORDER BY n.namespace"
+        ).fetchall()
+        lease = conn.execute("SELECT owner, expires_at FROM leases WHERE name = 'spring-indexer'").fetchone()
+        return {
+            "path": self.path,
+            "properties": conn.execute("SELECT COUNT(*) FROM properties").fetchone()[0],
+            "indexer": {"owner": lease[0], "expiresAt": lease[1]} if lease else None,
+            "namespaces": [
+                {"namespace": row[0], "queriedAt": row[1], "refreshedAt": row[2], "workloads": row[3]}
+                for row in namespaces
+            ],
+        }
+
+
+def get_spring_index():
+    global _spring_index
+    if not SPRING_INDEX_ENABLED:
+        return None
+    if _spring_index is None:
+        with _spring_index_lock:
+            if _spring_index is None:
+                try:
+                    _spring_index = SpringPropertyIndex(SPRING_INDEX_PATH)
+                except sqlite3.Error as exc:
+                    logger.warning("Spring property index unavailable at %s: %s", SPRING_INDEX_PATH, str(exc))
+                    return None
+    return _spring_index
+
+
+def workload_template_hash(workload_resource) -> str:
+    template = (workload_resource or {}).get("spec", {}).get("template", {}) or {}
+    return hashlib.blake2b(json.dumps(template, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def index_workload_properties(namespace: str, workload: dict, services_map: dict, template_hash: str):
+    result = {"name": workload.get("name"), "kind": workload.get("kind"), "templateHash": template_hash}
+    try:
+        service_name, actuator_url, skip_message = resolve_workload_actuator(namespace, workload, services_map)
+        if skip_message:
+            result["errorMessage"] = skip_message
+            return result
+        result["serviceName"] = service_name
+        property_sources, _ = extract_env_details(await fetch_actuator_env(actuator_url))
+        result["entries"] = [
+            (key, entry.get("source"), stringify_property_value(entry.get("value")))
+            for key, entry in build_effective_entries(property_sources).items()
+        ]
+    except HTTPException as exc:
+        detail = getattr(exc, "detail", "")
+        result["errorMessage"] = detail if isinstance(detail, str) else "Failed to fetch actuator env"
+        if isinstance(detail, dict) and detail.get("error"):
+            result["errorCode"] = detail["error"]
+    except Exception as exc:
+        logger.exception("Spring index workload=%s unexpected_error", result["name"])
+        result["errorMessage"] = str(exc)
+    return result
+
+
+async def refresh_spring_index_namespace(index: SpringPropertyIndex, namespace: str, force: bool = False):
+    started = time.monotonic()
+    workloads, services_map = await load_report_workloads(namespace)
+    states = await asyncio.to_thread(index.workload_states, namespace)
+    now = time.time()
+    present = []
+    due = []
+    for workload in workloads:
+        if not workload.get("name"):
+            continue
+        template_hash = workload_template_hash(get_workload_resource(workload))
+        present.append((workload.get("name"), workload.get("kind")))
+        state = states.get(present[-1])
+        if (
+            force
+            or state is None
+            or state[0] != template_hash
+            or state[2] is not None
+            or now - state[1] >= SPRING_INDEX_MAX_AGE_SECONDS
+        ):
+            due.append((workload, template_hash))
+
+    limiter = new_report_limiter(CONFIG_REPORT_CONCURRENCY)
+
+    async def run_one(workload: dict, template_hash: str):
+        await limiter.acquire()
+        started_at = time.monotonic()
+        result = None
+        try:
+            result = await index_workload_properties(namespace, workload, services_map, template_hash)
+            return result
+        finally:
+            overloaded = bool(result) and result.get("errorCode") in REPORT_OVERLOAD_ERRORS
+            await limiter.release(time.monotonic() - started_at, overloaded)
+
+    results = await asyncio.gather(*(run_one(workload, template_hash) for workload, template_hash in due))
+    await asyncio.to_thread(index.store_namespace, namespace, results, present)
+    summary = {
+        "namespace": namespace,
+        "workloads": len(present),
+        "refreshed": len(results),
+        "errors": len([result for result in results if result.get("errorMessage")]),
+        "durationMs": int((time.monotonic() - started) * 1000),
+    }
+    logger.info(
+        "Spring index refresh namespace=%s workloads=%s refreshed=%s errors=%s durationMs=%s",
+        namespace,
+        summary["workloads"],
+        summary["refreshed"],
+        summary["errors"],
+        summary["durationMs"],
+    )
+    return summary
+
+
+async def run_spring_indexer(index: SpringPropertyIndex):
+    owner = f"{os.getpid()}"
+    lease_ttl = max(60, SPRING_INDEX_POLL_SECONDS * 4)
+    while True:
+        try:
+            if await asyncio.to_thread(index.try_lease, "spring-indexer", owner, lease_ttl):
+                if SPRING_INDEX_NAMESPACES:
+                    await asyncio.to_thread(index.track, SPRING_INDEX_NAMESPACES)
+                for namespace in await asyncio.to_thread(index.due_namespaces):
+                    if not await asyncio.to_thread(index.try_lease, "spring-indexer", owner, lease_ttl):
+                        break
+                    try:
+                        await refresh_spring_index_namespace(index, namespace)
+                    except Exception as exc:
+                        logger.warning("Spring index refresh namespace=%s failed: %s", namespace, str(exc))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Spring indexer cycle failed")
+        await asyncio.sleep(SPRING_INDEX_POLL_SECONDS)
+
+
+@app.on_event("startup")
+async def start_spring_indexer():
+    global _spring_index_task
+    index = get_spring_index()
+    if index is not None and _spring_index_task is None:
+        _spring_index_task = asyncio.create_task(run_spring_indexer(index))
+
+
+@app.on_event("shutdown")
+async def stop_spring_indexer():
+    global _spring_index_task
+    if _spring_index_task is not None:
+        _spring_index_task.cancel()
+        _spring_index_task = None
+
+
+async def select_report_source(namespaces, source: str):
+    """Returns (index, indexed_at) when the report should be served from the index, else (None, None).
+
+    `auto` uses the index only when every indexed workload was fetched within
+    SPRING_INDEX_STALE_SECONDS; `index` uses whatever is there; `live` never
+    does. Namespaces seen here are tracked so the indexer picks them up.
+    """
+    source = (source or "auto").lower()
+    if source not in ("auto", "index", "live"):
+        raise HTTPException(status_code=400, detail="source must be one of: auto, index, live")
+    index = get_spring_index()
+    if index is None:
+        if source == "index":
+            raise HTTPException(status_code=400, detail="Spring property index is disabled")
+        return None, None
+    await asyncio.to_thread(index.track, namespaces)
+    if source == "live":
+        return None, None
+    indexed_at = await asyncio.to_thread(index.indexed_at, namespaces)
+    if source == "index":
+        missing = [namespace for namespace in namespaces if indexed_at.get(namespace) is None]
+        if missing:
+            raise HTTPException(status_code=409, detail=f"Not indexed yet: {', '.join(missing)}")
+        return index, indexed_at
+    cutoff = time.time() - SPRING_INDEX_STALE_SECONDS
+    if all((indexed_at.get(namespace) or 0) >= cutoff for namespace in namespaces):
+        return index, indexed_at
+    return None, None
+
+
+def report_freshness(indexed_at):
+    if not indexed_at:
+        return {"dataSource": "live"}
+    oldest = min(indexed_at.values())
+    return {
+        "dataSource": "index",
+        "indexedAt": int(oldest),
+        "indexAgeSeconds": int(max(0.0, time.time() - oldest)),
+    }
+
+
+async def build_indexed_report(
+    index: SpringPropertyIndex,
+    namespace: str,
+    pattern: str,
+    case_insensitive: bool,
+    regex,
+    search_in: str,
+):
+    total, matched, errors = await asyncio.to_thread(index.search, namespace, regex)
+    return {
+        "namespace": namespace,
+        "pattern": pattern,
+        "caseInsensitive": case_insensitive,
+        "searchIn": search_in,
+        "totalWorkloads": total,
+        "matched": sort_report_items(matched),
+        "errors": sort_report_items(errors),
+    }
+
+
+async def build_indexed_multi_namespace_report(index, namespaces, pattern: str, case_insensitive: bool, search_in: str):
+    regex, search_in = compile_report_regex(pattern, case_insensitive, search_in)
+    reports = []
+    for namespace in sorted(namespaces):
+        data = await build_indexed_report(index, namespace, pattern, case_insensitive, regex, search_in)
+        reports.append({"namespace": namespace, "data": data})
+    return {
+        "namespaces": [report["namespace"] for report in reports],
+        "pattern": pattern,
+        "caseInsensitive": case_insensitive,
+        "searchIn": search_in,
+        "totalWorkloads": sum(report["data"]["totalWorkloads"] for report in reports),
+        "reports": reports,
+    }
+
+
+@app.get("/api/config/index/status")
+async def get_spring_index_status():
+    index = get_spring_index()
+    if index is None:
+        return {"enabled": False}
+    return {"enabled": True, **await asyncio.to_thread(index.stats)}
+
+
+@app.post("/api/config/index/refresh")
+async def refresh_spring_index(namespace: str, force: bool = False):
+    index = get_spring_index()
+    if index is None:
+        raise HTTPException(status_code=400, detail="Spring property index is disabled")
+    try:
+        await asyncio.to_thread(index.track, [namespace])
+        return await refresh_spring_index_namespace(index, namespace, force=force)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to refresh index: {str(exc)}")
+
+
+@app.get("/api/config/report")
+async def get_multi_namespace_config_report(
+    namespaces: str,
+    pattern: str,
+    caseInsensitive: bool = False,
+    searchIn: str = "value",
+    source: str = "auto",
+):
+    try:
+        scope, namespace_list = await resolve_report_namespaces(namespaces)
+        index, indexed_at = await select_report_source(namespace_list, source)
+        if index is None:
+            report = await build_multi_namespace_report(namespace_list, pattern, caseInsensitive, searchIn)
+        else:
+            started = time.monotonic()
+            report = await build_indexed_multi_namespace_report(
+                index, namespace_list, pattern, caseInsensitive, searchIn
+            )
+            observe_report("multi", "index", started, report["totalWorkloads"])
+        report["scope"] = scope
+        report.update(report_freshness(indexed_at))
+        return report
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
+
+
+REPORT_STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def encode_report_frame(frame: dict, stream_format: str) -> str:
+    payload = json.dumps(frame)
+    if stream_format == "sse":
+        return f"event: {frame['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+async def stream_config_report(loaded, regex, search_in: str, header: dict, stream_format: str):
+    """Emits report frames: one `start`, one `workload` per finished workload, one `summary`.
+
+    Nothing is accumulated besides counters, so memory stays flat regardless of
+    how many workloads are scanned.
+    """
+    started = time.monotonic()
+    namespace_totals = {
+        namespace: len([item for item in workloads if item.get("name")]) for namespace, workloads, _, _ in loaded
+    }
+    total = sum(namespace_totals.values())
+    completed = 0
+    matched_count = 0
+    error_count = 0
+    yield encode_report_frame(
+        {"type": "start", **header, "totalWorkloads": total, "namespaceTotals": namespace_totals},
+        stream_format,
+    )
+    for namespace, _, _, load_error in loaded:
+        if load_error:
+            error_count += 1
+            yield encode_report_frame({
+                "type": "workload",
+                "namespace": namespace,
+                "matched": None,
+                "error": load_error,
+                "completed": completed,
+                "total": total,
+            }, stream_format)
+    limiter = new_report_limiter(report_initial_concurrency(loaded))
+    async for namespace, (matched_item, error_item) in iter_report_results(loaded, regex, search_in, limiter):
+        completed += 1
+        matched_count += 1 if matched_item else 0
+        error_count += 1 if error_item else 0
+        yield encode_report_frame({
+            "type": "workload",
+            "namespace": namespace,
+            "matched": matched_item,
+            "error": error_item,
+            "completed": completed,
+            "total": total,
+        }, stream_format)
+    observe_report("stream", "live", started, total, limiter)
+    yield encode_report_frame({
+        "type": "summary",
+        "totalWorkloads": total,
+        "completed": completed,
+        "matchedCount": matched_count,
+        "errorCount": error_count,
+        "durationMs": int((time.monotonic() - started) * 1000),
+        "concurrency": limiter.describe(),
+    }, stream_format)
+
+
+async def stream_indexed_config_report(index, namespaces, regex, header: dict, stream_format: str):
+    """Index-backed counterpart of stream_config_report, emitting the same frames.
+
+    Only matched and failed workloads get a `workload` frame; `completed` jumps
+    over a namespace's non-matching workloads on its last frame so progress
+    still ends at `total`.
+    """
+    started = time.monotonic()
+    results = []
+    for namespace in sorted(namespaces):
+        namespace_total, matched, errors = await asyncio.to_thread(index.search, namespace, regex)
+        results.append((namespace, namespace_total, sort_report_items(matched), sort_report_items(errors)))
+    namespace_totals = {namespace: namespace_total for namespace, namespace_total, _, _ in results}
+    total = sum(namespace_totals.values())
+    completed = 0
+    matched_count = 0
+    error_count = 0
+    yield encode_report_frame(
+        {"type": "start", **header, "totalWorkloads": total, "namespaceTotals": namespace_totals},
+        stream_format,
+    )
+    for namespace, namespace_total, matched, errors in results:
+        items = [(item, None) for item in matched] + [(None, item) for item in errors]
+        namespace_start = completed
+        for position, (matched_item, error_item) in enumerate(items, 1):
+            completed = namespace_start + (position if position < len(items) else namespace_total)
+            matched_count += 1 if matched_item else 0
+            error_count += 1 if error_item else 0
+            yield encode_report_frame({
+                "type": "workload",
+                "namespace": namespace,
+                "matched": matched_item,
+                "error": error_item,
+                "completed": completed,
+                "total": total,
+            }, stream_format)
+        completed = namespace_start + namespace_total
+    observe_report("stream", "index", started, total)
+    yield encode_report_frame({
+        "type": "summary",
+        "totalWorkloads": total,
+        "completed": completed,
+        "matchedCount": matched_count,
+        "errorCount": error_count,
+        "durationMs": int((time.monotonic() - started) * 1000),
+    }, stream_format)
+
+
+def report_stream_response(frames, stream_format: str):
+    return StreamingResponse(
+        frames,
+        media_type=REPORT_STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def resolve_stream_format(stream_format: str) -> str:
+    stream_format = (stream_format or "ndjson").lower()
+    if stream_format not in REPORT_STREAM_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be one of: ndjson, sse")
+    return stream_format
+
+
+@app.get("/api/config/report/stream")
+async def stream_multi_namespace_config_report(
+    namespaces: str,
+    pattern: str,
+    caseInsensitive: bool = False,
+    searchIn: str = "value",
+    streamFormat: str = Query("ndjson", alias="format"),
+    source: str = "auto",
+):
+    try:
+        stream_format = resolve_stream_format(streamFormat)
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+        scope, namespace_list = await resolve_report_namespaces(namespaces)
+        index, indexed_at = await select_report_source(namespace_list, source)
+        loaded = await load_report_namespaces(namespace_list) if index is None else None
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
+    header = {
+        "scope": scope,
+        "namespaces": sorted(namespace_list),
+        "pattern": pattern,
+        "caseInsensitive": caseInsensitive,
+        "searchIn": search_in,
+        **report_freshness(indexed_at),
+    }
+    if index is not None:
+        frames = stream_indexed_config_report(index, namespace_list, regex, header, stream_format)
+    else:
+        frames = stream_config_report(loaded, regex, search_in, header, stream_format)
+    return report_stream_response(frames, stream_format)
+
+
+@app.get("/api/config/{namespace}/report/stream")
+async def stream_spring_config_report(
     namespace: str,
-    workloadName: str,
     pattern: str,
     caseInsensitive: bool = False,
     searchIn: str = "value",
+    streamFormat: str = Query("ndjson", alias="format"),
+    source: str = "auto",
+):
+    try:
+        stream_format = resolve_stream_format(streamFormat)
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+        index, indexed_at = await select_report_source([namespace], source)
+        if index is None:
+            workloads, services_map = await load_report_workloads(namespace)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
+    header = {
+        "namespace": namespace,
+        "pattern": pattern,
+        "caseInsensitive": caseInsensitive,
+        "searchIn": search_in,
+        **report_freshness(indexed_at),
+    }
+    if index is not None:
+        frames = stream_indexed_config_report(index, [namespace], regex, header, stream_format)
+    else:
+        frames = stream_config_report(
+            [(namespace, workloads, services_map, None)], regex, search_in, header, stream_format
+        )
+    return report_stream_response(frames, stream_format)
+
+
+@app.get("/api/config/{namespace}/configmaps/report")
+async def get_configmap_report_for_namespace(
+    namespace: str,
+    pattern: List[str] = Query(...),
+    caseInsensitive: bool = False,
+    useIndex: bool = True,
 ):
     try:
-        if not pattern:
+        patterns = [item for item in pattern if item]
+        if not patterns:
             raise HTTPException(status_code=400, detail="pattern query parameter is required")
-        search_in = (searchIn or "value").lower()
-        if search_in != "value":
-            raise HTTPException(status_code=400, detail="searchIn must be: value")
+        if len(patterns) > CONFIGMAP_REPORT_MAX_PATTERNS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {CONFIGMAP_REPORT_MAX_PATTERNS} patterns are allowed per request",
+            )
         try:
             flags = re.IGNORECASE if caseInsensitive else 0
-            regex = re.compile(pattern, flags=flags)
+            matcher = ConfigPatternMatcher(patterns, flags=flags)
         except re.error as exc:
             raise HTTPException(status_code=400, detail=f"Invalid regex pattern: {str(exc)}")
 
-        workload_kind, workload = get_workload(namespace, workloadName)
+        workloads = await asyncio.to_thread(list_workloads, namespace)
+        workloads.sort(key=lambda item: item.get("name") or "")
+        consumers = {}
+        workload_configmaps = {}
+        for workload in workloads:
+            workload_ref = {"workloadName": workload.get("name"), "workloadKind": workload.get("kind")}
+            names = sorted(extract_configmap_names_from_workload(get_workload_resource(workload)))
+            workload_configmaps[(workload_ref["workloadName"], workload_ref["workloadKind"])] = names
+            for name in names:
+                consumers.setdefault(name, []).append(workload_ref)
+
+        configmap_names = sorted(consumers)
+        fetched = await fetch_configmaps(namespace, configmap_names, prefer_list=True)
+        configmaps = [fetched[name] for name in configmap_names if fetched.get(name) is not None]
+        missing = [
+            {"configMap": name, "workloads": consumers[name]}
+            for name in configmap_names
+            if fetched.get(name) is None
+        ]
+
+        matches, unknown_files, index_info = await search_configmaps(
+            namespace,
+            configmaps,
+            matcher,
+            useIndex and CONFIGMAP_INDEX_ENABLED,
+        )
+        matches = [{**match, "workloads": consumers.get(match["configMap"], [])} for match in matches]
+
+        matched_configmaps = collections.Counter(match["configMap"] for match in matches)
+        workload_summaries = []
+        for (workload_name, workload_kind), names in workload_configmaps.items():
+            match_count = sum(matched_configmaps.get(name, 0) for name in names)
+            if match_count:
+                workload_summaries.append({
+                    "workloadName": workload_name,
+                    "workloadKind": workload_kind,
+                    "configMaps": [name for name in names if matched_configmaps.get(name)],
+                    "matchCount": match_count,
+                })
+
+        return {
+            "namespace": namespace,
+            "pattern": patterns[0],
+            "patterns": patterns,
+            "caseInsensitive": caseInsensitive,
+            "totalWorkloads": len(workloads),
+            "configMaps": configmap_names,
+            "missingConfigMaps": missing,
+            "unknownFiles": unknown_files,
+            "matches": matches,
+            "workloads": workload_summaries,
+            "index": index_info,
+        }
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to check configmaps: {str(exc)}")
+
+
+@app.get("/api/config/{namespace}/{workloadName}/report")
+async def get_spring_config_report_for_workload(
+    namespace: str,
+    workloadName: str,
+    pattern: str,
+    caseInsensitive: bool = False,
+    searchIn: str = "value",
+):
+    try:
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+
+        workload_kind, workload = await get_workload(namespace, workloadName)
         if not workload:
             raise_structured_error(
                 404,
@@ -1601,8 +5350,7 @@ async def get_spring_config_report_for_workload(
             )
 
         services_map = await asyncio.to_thread(get_services_map, namespace)
-        matched_item, error_item = await asyncio.to_thread(
-            process_report_workload,
+        matched_item, error_item = await process_report_workload(
             namespace,
             {"name": workloadName, "kind": workload_kind, "resource": workload},
             regex,
@@ -1629,23 +5377,29 @@ async def get_spring_config_report_for_workload(
 async def get_configmap_report_for_workload(
     namespace: str,
     workloadName: str,
-    pattern: str,
+    pattern: List[str] = Query(...),
     caseInsensitive: bool = False,
     workloadKind: Optional[str] = None,
 ):
     try:
-        if not pattern:
+        patterns = [item for item in pattern if item]
+        if not patterns:
             raise HTTPException(status_code=400, detail="pattern query parameter is required")
+        if len(patterns) > CONFIGMAP_REPORT_MAX_PATTERNS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {CONFIGMAP_REPORT_MAX_PATTERNS} patterns are allowed per request",
+            )
         try:
             flags = re.IGNORECASE if caseInsensitive else 0
-            regex = re.compile(pattern, flags=flags)
+            matcher = ConfigPatternMatcher(patterns, flags=flags)
         except re.error as exc:
             raise HTTPException(status_code=400, detail=f"Invalid regex pattern: {str(exc)}")
 
         workload_kind = normalize_workload_kind(workloadKind)
         workload = None
         if workload_kind is None:
-            workload_kind, workload = get_workload(namespace, workloadName)
+            workload_kind, workload = await get_workload(namespace, workloadName)
             if not workload:
                 raise_structured_error(
                     404,
@@ -1653,7 +5407,7 @@ async def get_configmap_report_for_workload(
                     f"Workload '{workloadName}' not found in namespace '{namespace}'",
                 )
         if workload is None:
-            _, workload = get_workload(namespace, workloadName)
+            _, workload = await get_workload(namespace, workloadName)
             if not workload:
                 raise_structured_error(
                     404,
@@ -1673,25 +5427,19 @@ async def get_configmap_report_for_workload(
             extract_configmap_names_from_workload,
             workload_resource,
         )
-        matches = []
-        missing = []
-        unknown_files = []
-
-        for name in configmap_names:
-            configmap = await asyncio.to_thread(fetch_configmap, namespace, name)
-            if configmap is None:
-                missing.append(name)
-                continue
-            configmap_matches, configmap_unknown = find_configmap_matches(configmap, regex)
-            matches.extend(configmap_matches)
-            if configmap_unknown:
-                unknown_files.extend(configmap_unknown)
+        fetched = await fetch_configmaps(namespace, configmap_names)
+        missing = [name for name in configmap_names if fetched.get(name) is None]
+        matches, unknown_files = await match_configmaps(
+            [fetched[name] for name in configmap_names if fetched.get(name) is not None],
+            matcher,
+        )
 
         return {
             "namespace": namespace,
             "workloadName": workloadName,
             "workloadKind": workload_kind,
-            "pattern": pattern,
+            "pattern": patterns[0],
+            "patterns": patterns,
             "caseInsensitive": caseInsensitive,
             "configMaps": configmap_names,
             "missingConfigMaps": missing,
@@ -1714,7 +5462,7 @@ async def get_workload_rollout_status(
         workload_kind = normalize_workload_kind(workloadKind)
         workload = None
         if workload_kind is None:
-            workload_kind, workload = get_workload(namespace, workloadName)
+            workload_kind, workload = await get_workload(namespace, workloadName)
             if not workload:
                 raise_structured_error(
                     404,
@@ -1722,7 +5470,7 @@ async def get_workload_rollout_status(
                     f"Workload '{workloadName}' not found in namespace '{namespace}'",
                 )
         if workload is None:
-            _, workload = get_workload(namespace, workloadName)
+            _, workload = await get_workload(namespace, workloadName)
             if not workload:
                 raise_structured_error(
                     404,
@@ -1761,33 +5509,39 @@ async def get_workload_rollout_status(
         raise HTTPException(status_code=500, detail=f"Failed to check rollout status: {str(exc)}")
 
 
-@app.get("/api/config/{namespace}/report.csv")
-async def get_spring_config_report_csv(
-    namespace: str,
-    pattern: str,
-    caseInsensitive: bool = False,
-    searchIn: str = "value",
-):
-    report = await build_config_report(namespace, pattern, caseInsensitive, searchIn)
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "workloadName",
-        "workloadKind",
-        "key",
-        "value",
-        "source",
-        "matchOn",
-        "justified",
-        "migrationRequired",
-        "comment",
-    ])
-
-    for workload in report.get("matched", []):
-        for match in workload.get("matches", []):
-            writer.writerow([
-                workload.get("workloadName"),
-                workload.get("workloadKind"),
+REPORT_CSV_HEADER = [
+    "workloadName",
+    "workloadKind",
+    "key",
+    "value",
+    "source",
+    "matchOn",
+    "justified",
+    "migrationRequired",
+    "comment",
+]
+
+
+async def iter_csv_chunks(matched_items, include_namespace: bool, compress: bool):
+    """Yields CSV chunks for (namespace, matched_item) pairs, optionally gzip-compressed on the fly."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def take_chunk():
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow((["namespace"] if include_namespace else []) + REPORT_CSV_HEADER)
+    yield take_chunk()
+    async for namespace, matched_item in matched_items:
+        for match in matched_item.get("matches", []):
+            writer.writerow(([namespace] if include_namespace else []) + [
+                matched_item.get("workloadName"),
+                matched_item.get("workloadKind"),
                 match.get("key"),
                 match.get("value"),
                 match.get("source"),
@@ -1796,29 +5550,132 @@ async def get_spring_config_report_csv(
                 "",
                 "",
             ])
-
-    filename = f"spring-config-report-{namespace}.csv"
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        chunk = take_chunk()
+        if chunk:
+            yield chunk
+    if compressor:
+        yield compressor.flush()
+
+
+async def iter_report_csv(loaded, regex, search_in: str, include_namespace: bool, compress: bool):
+    """Yields CSV chunks as workloads finish."""
+
+    async def matched_items():
+        started = time.monotonic()
+        limiter = new_report_limiter(report_initial_concurrency(loaded))
+        for namespace, _, _, load_error in loaded:
+            if load_error:
+                logger.warning("Config report CSV namespace=%s skipped: %s", namespace, load_error.get("message"))
+        async for namespace, (matched_item, _) in iter_report_results(loaded, regex, search_in, limiter):
+            if matched_item:
+                yield namespace, matched_item
+        observe_report("csv", "live", started, sum(len(workloads) for _, workloads, _, _ in loaded), limiter)
+
+    async for chunk in iter_csv_chunks(matched_items(), include_namespace, compress):
+        yield chunk
+
+
+async def iter_indexed_report_csv(index, namespaces, regex, include_namespace: bool, compress: bool):
+    """Yields the same CSV as iter_report_csv from the Spring property index."""
+
+    async def matched_items():
+        started = time.monotonic()
+        total = 0
+        for namespace in sorted(namespaces):
+            namespace_total, matched, _ = await asyncio.to_thread(index.search, namespace, regex)
+            total += namespace_total
+            for matched_item in sort_report_items(matched):
+                yield namespace, matched_item
+        observe_report("csv", "index", started, total)
+
+    async for chunk in iter_csv_chunks(matched_items(), include_namespace, compress):
+        yield chunk
+
+
+def report_csv_response(chunks, filename: str, compress: bool, indexed_at=None):
+    headers = {"Content-Disposition": f'attachment; filename="{filename}{".gz" if compress else ""}"'}
+    freshness = report_freshness(indexed_at)
+    headers["X-Report-Data-Source"] = freshness["dataSource"]
+    if "indexAgeSeconds" in freshness:
+        headers["X-Report-Index-Age-Seconds"] = str(freshness["indexAgeSeconds"])
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if compress else "text/csv",
+        headers=headers,
     )
 
 
-@app.get("/api/config/{namespace}/{workloadName}")
-async def get_spring_config(namespace: str, workloadName: str):
+@app.get("/api/config/report.csv")
+async def get_multi_namespace_config_report_csv(
+    namespaces: str,
+    pattern: str,
+    caseInsensitive: bool = False,
+    searchIn: str = "value",
+    gzip: bool = False,
+    source: str = "auto",
+):
     try:
-        logger.info("GET /api/config/%s/%s", namespace, workloadName)
-        workload_kind, workload = get_workload(namespace, workloadName)
-        if not workload:
-            raise_structured_error(
-                404,
-                "workload_not_found",
-                f"Workload '{workloadName}' not found in namespace '{namespace}'",
-            )
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+        scope, namespace_list = await resolve_report_namespaces(namespaces)
+        index, indexed_at = await select_report_source(namespace_list, source)
+        loaded = await load_report_namespaces(namespace_list) if index is None else None
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
+    filename = "spring-config-report-all.csv" if scope == "all" else "spring-config-report-multi.csv"
+    if index is not None:
+        chunks = iter_indexed_report_csv(index, namespace_list, regex, include_namespace=True, compress=gzip)
+    else:
+        chunks = iter_report_csv(loaded, regex, search_in, include_namespace=True, compress=gzip)
+    return report_csv_response(chunks, filename, gzip, indexed_at)
 
-        fallback_labels = (
-            workload.get("spec", {}).get("template", {}).get("metadata", {}).get("labels", {})
+
+@app.get("/api/config/{namespace}/report.csv")
+async def get_spring_config_report_csv(
+    namespace: str,
+    pattern: str,
+    caseInsensitive: bool = False,
+    searchIn: str = "value",
+    gzip: bool = False,
+    source: str = "auto",
+):
+    try:
+        regex, search_in = compile_report_regex(pattern, caseInsensitive, searchIn)
+        index, indexed_at = await select_report_source([namespace], source)
+        if index is None:
+            workloads, services_map = await load_report_workloads(namespace)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to build config report: {str(exc)}")
+    if index is not None:
+        chunks = iter_indexed_report_csv(index, [namespace], regex, include_namespace=False, compress=gzip)
+    else:
+        chunks = iter_report_csv(
+            [(namespace, workloads, services_map, None)],
+            regex,
+            search_in,
+            include_namespace=False,
+            compress=gzip,
+        )
+    return report_csv_response(chunks, f"spring-config-report-{namespace}.csv", gzip, indexed_at)
+
+
+@app.get("/api/config/{namespace}/{workloadName}")
+async def get_spring_config(namespace: str, workloadName: str):
+    try:
+        logger.info("GET /api/config/%s/%s", namespace, workloadName)
+        workload_kind, workload = await get_workload(namespace, workloadName)
+        if not workload:
+            raise_structured_error(
+                404,
+                "workload_not_found",
+                f"Workload '{workloadName}' not found in namespace '{namespace}'",
+            )
+
+        fallback_labels = (
+            workload.get("spec", {}).get("template", {}).get("metadata", {}).get("labels", {})
         )
         label_selector = get_workload_selector(workload, fallback_labels)
         if not label_selector:
@@ -1829,7 +5686,7 @@ async def get_spring_config(namespace: str, workloadName: str):
             )
         logger.info("Using label selector %s", label_selector)
 
-        service = get_service_by_name(namespace, workloadName)
+        service = await asyncio.to_thread(get_service_by_name, namespace, workloadName)
         if not service:
             raise_structured_error(
                 404,
@@ -1848,9 +5705,9 @@ async def get_spring_config(namespace: str, workloadName: str):
             raise_structured_error(500, "service_port_missing", "Matching service has no port")
         logger.info("Using service %s on port %s", service_name, port)
 
-        service_host = f"{service_name}.{namespace}.svc.cluster.local"
-        actuator_url = f"http://{service_host}:{port}/actuator/env"
-        actuator_payload = fetch_actuator_env(actuator_url)
+        actuator_url = actuator_env_url(service_name, namespace, port)
+        actuator_payload = await fetch_actuator_env(actuator_url)
+        service_host = urllib.parse.urlsplit(actuator_url).hostname
 
         return {
             "namespace": namespace,
@@ -1874,7 +5731,7 @@ async def expose_actuator_env(namespace: str, workloadName: str, request: Option
     try:
         workload_kind = normalize_workload_kind(request.workloadKind if request else None)
         if workload_kind is None:
-            workload_kind, workload = get_workload(namespace, workloadName)
+            workload_kind, workload = await get_workload(namespace, workloadName)
             if not workload:
                 raise_structured_error(
                     404,
@@ -1887,9 +5744,9 @@ async def expose_actuator_env(namespace: str, workloadName: str, request: Option
             "MANAGEMENT_ENDPOINTS_WEB_EXPOSURE_INCLUDE=env,health",
         ]
         logger.info("Exposing actuator env for %s/%s in %s", workload_kind, workloadName, namespace)
-        run_oc(["set", "env", f"{workload_kind}/{workloadName}", "-n", namespace] + env_vars)
+        await kube_set_env(workload_kind, workloadName, namespace, env_vars)
         if workload_kind == "deploymentconfig":
-            run_oc(["rollout", "latest", f"{workload_kind}/{workloadName}", "-n", namespace])
+            await kube_rollout_latest(workloadName, namespace)
 
         return {
             "success": True,
@@ -1901,59 +5758,47 @@ async def expose_actuator_env(namespace: str, workloadName: str, request: Option
         raise HTTPException(status_code=500, detail=f"Failed to expose actuator env: {str(exc)}")
 
 
-@app.post("/api/config/{namespace}/{workloadName}/apply-spring-config-agent")
-async def apply_spring_config_agent(
-    namespace: str,
-    workloadName: str,
-    request: Optional[ApplySpringConfigAgentRequest] = None,
-):
-    logger.debug(
-        "Spring config agent env enabled=%s jarPath=%s outputDir=%s",
-        SPRING_CONFIG_AGENT_ENABLED,
-        SPRING_CONFIG_AGENT_JAR_PATH,
-        SPRING_CONFIG_AGENT_OUTPUT_DIR,
-    )
-    logger.debug(
-        "Spring config agent request payload workloadKind=%s",
-        request.workloadKind if request else None,
-    )
-    cache_key = f"spring-config-agent:{namespace}:{workloadName}"
-    if CACHE_TTL_SECONDS > 0:
-        try:
-            redis_client = get_redis_client()
-            cached_payload = None
-            cache_source = None
-            if redis_client is not None:
-                cached_payload = redis_client.get(cache_key)
-                cache_source = "redis" if cached_payload else None
-                if cached_payload:
-                    cached_payload = cached_payload.decode("utf-8")
-            else:
-                cached = _actuator_cache.get(cache_key)
-                if cached:
-                    expires_at, payload = cached
-                    if time.time() < expires_at:
-                        cached_payload = payload
-                        cache_source = "memory"
-                    else:
-                        _actuator_cache.pop(cache_key, None)
-            if cached_payload:
-                try:
-                    parsed_payload = json.loads(cached_payload)
-                except json.JSONDecodeError:
-                    parsed_payload = cached_payload
-                logger.info("Spring config agent cache hit (%s) %s", cache_source, cache_key)
-                return {
-                    "success": True,
-                    "message": "Spring config agent cache hit.",
-                    "namespace": namespace,
-                    "workloadName": workloadName,
-                    "workloadKind": normalize_workload_kind(request.workloadKind if request else None),
-                    "cacheKey": cache_key,
-                    "payload": parsed_payload,
-                }
-        except Exception as exc:
-            logger.warning("Spring config agent cache read failed: %s", str(exc))
+def read_agent_cache(cache_key: str):
+    """Returns (payload text, tier) for a cached agent result, or (None, None)."""
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        cached_payload = redis_client.get(cache_key)
+        record_cache_lookup("spring-config-agent", "redis", bool(cached_payload))
+        if cached_payload:
+            return cached_payload.decode("utf-8"), "redis"
+        return None, None
+    if get_local_cache() is not None:
+        cached_payload = get_local_cache().get(cache_key)
+        record_cache_lookup("spring-config-agent", "local", bool(cached_payload))
+        if cached_payload:
+            return cached_payload, "local"
+    return None, None
+
+
+def write_agent_cache(cache_key: str, output_payload):
+    cache_payload = output_payload
+    if not isinstance(cache_payload, str):
+        cache_payload = json.dumps(cache_payload)
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        redis_client.setex(cache_key, CACHE_TTL_SECONDS, cache_payload.encode("utf-8"))
+        logger.debug("Spring config agent cache write (redis) %s", cache_key)
+    elif get_local_cache() is not None:
+        get_local_cache().set(cache_key, cache_payload, CACHE_TTL_SECONDS)
+        logger.debug("Spring config agent cache write (local) %s", cache_key)
+
+
+def load_agent_output(output_file: str):
+    try:
+        with open(output_file, "r") as f:
+            return json.load(f)
+    except Exception as exc:
+        logger.warning("Failed to parse agent output as JSON: %s", str(exc))
+        with open(output_file, "r") as f:
+            return f.read()
+
+
+def require_spring_config_agent():
     if not SPRING_CONFIG_AGENT_ENABLED:
         logger.warning(
             "Spring config agent disabled; set SPRING_CONFIG_AGENT_ENABLED=true and mount jar at %s",
@@ -1971,13 +5816,6 @@ async def apply_spring_config_agent(
                 "outputDir": SPRING_CONFIG_AGENT_OUTPUT_DIR,
             },
         )
-    logger.info(
-        "Apply spring config agent requested namespace=%s workload=%s kind=%s",
-        namespace,
-        workloadName,
-        request.workloadKind if request else None,
-    )
-    include_logs = bool(request.includeLogs) if request else False
     if not os.path.exists(SPRING_CONFIG_AGENT_JAR_PATH):
         logger.error("Spring config agent jar missing at %s", SPRING_CONFIG_AGENT_JAR_PATH)
         raise_structured_error(
@@ -1986,31 +5824,52 @@ async def apply_spring_config_agent(
             f"Spring config agent jar not found at {SPRING_CONFIG_AGENT_JAR_PATH}",
             {"agentJarPath": SPRING_CONFIG_AGENT_JAR_PATH},
         )
-    else:
-        try:
-            size = os.path.getsize(SPRING_CONFIG_AGENT_JAR_PATH)
-            logger.debug("Spring config agent jar sizeBytes=%s", size)
-        except OSError as exc:
-            logger.warning("Spring config agent jar stat failed: %s", str(exc))
-    workload_kind = normalize_workload_kind(request.workloadKind if request else None)
-    workload = None
-    if workload_kind is None:
-        workload_kind, workload = get_workload(namespace, workloadName)
-        if not workload:
-            raise_structured_error(
-                404,
-                "workload_not_found",
-                f"Workload '{workloadName}' not found in namespace '{namespace}'",
-            )
-    if workload is None:
-        _, workload = get_workload(namespace, workloadName)
-        if not workload:
-            raise_structured_error(
-                404,
-                "workload_not_found",
-                f"Workload '{workloadName}' not found in namespace '{namespace}'",
-            )
+    try:
+        size = os.path.getsize(SPRING_CONFIG_AGENT_JAR_PATH)
+        logger.debug("Spring config agent jar sizeBytes=%s", size)
+    except OSError as exc:
+        logger.warning("Spring config agent jar stat failed: %s", str(exc))
+
+
+async def read_cached_agent_response(namespace: str, workload_name: str, workload_kind: Optional[str]):
+    if CACHE_TTL_SECONDS <= 0:
+        return None
+    cache_key = f"spring-config-agent:{namespace}:{workload_name}"
+    try:
+        cached_payload, cache_source = await asyncio.to_thread(read_agent_cache, cache_key)
+    except Exception as exc:
+        logger.warning("Spring config agent cache read failed: %s", str(exc))
+        return None
+    if not cached_payload:
+        return None
+    try:
+        parsed_payload = json.loads(cached_payload)
+    except json.JSONDecodeError:
+        parsed_payload = cached_payload
+    logger.info("Spring config agent cache hit (%s) %s", cache_source, cache_key)
+    return {
+        "success": True,
+        "message": "Spring config agent cache hit.",
+        "namespace": namespace,
+        "workloadName": workload_name,
+        "workloadKind": normalize_workload_kind(workload_kind),
+        "cacheKey": cache_key,
+        "payload": parsed_payload,
+    }
 
+
+async def resolve_agent_target(namespace: str, workload_name: str, workload_kind: Optional[str]):
+    """Returns (workload kind, workload, image of its first container) for an agent run."""
+    workload_kind = normalize_workload_kind(workload_kind)
+    found_kind, workload = await get_workload(namespace, workload_name)
+    if not workload:
+        raise_structured_error(
+            404,
+            "workload_not_found",
+            f"Workload '{workload_name}' not found in namespace '{namespace}'",
+        )
+    if workload_kind is None:
+        workload_kind = found_kind
     template = workload.get("spec", {}).get("template", {}) or {}
     containers = template.get("spec", {}).get("containers", []) or []
     target_image = containers[0].get("image") if containers else ""
@@ -2018,117 +5877,173 @@ async def apply_spring_config_agent(
         raise_structured_error(
             500,
             "workload_image_missing",
-            f"Failed to determine image for workload '{workloadName}'",
+            f"Failed to determine image for workload '{workload_name}'",
         )
+    return workload_kind, workload, target_image
 
-    timestamp = int(time.time())
-    base_name = f"{workloadName}-spring-config-debug"
-    if len(base_name) > 50:
-        base_name = base_name[:50].rstrip("-")
-    debug_pod_name = f"{base_name}-{timestamp}"
 
-    logger.info(
-        "Creating debug pod %s from %s/%s using image %s",
-        debug_pod_name,
-        workload_kind,
-        workloadName,
-        target_image,
-    )
+DEBUG_AGENT_JAR_PATH = "/tmp/spring-config-agent.jar"
 
-    debug_pod_created = False
-    try:
-        debug_manifest = build_debug_pod_manifest(
+
+class AgentPod:
+    """A ready debug pod holding the agent jar: leased from the pool, or created for one caller."""
+
+    def __init__(self, namespace: str, pod_name: str, lease: Optional[DebugPodLease] = None):
+        self.namespace = namespace
+        self.pod_name = pod_name
+        self.lease = lease
+        self.reused = bool(lease and lease.reused)
+        self.jar_sha256 = ""
+
+
+async def acquire_agent_pod(namespace: str, workload_kind: str, workload_name: str, workload: dict, image: str):
+    pod_pool = get_debug_pod_pool()
+    if pod_pool is not None:
+        lease = await pod_pool.lease(namespace, workload_kind, workload_name, workload, image)
+        agent_pod = AgentPod(namespace, lease.pod_name, lease)
+    else:
+        timestamp = int(time.time())
+        base_name = f"{workload_name}-spring-config-debug"
+        if len(base_name) > 50:
+            base_name = base_name[:50].rstrip("-")
+        debug_pod_name = f"{base_name}-{timestamp}"
+
+        logger.info(
+            "Creating debug pod %s from %s/%s using image %s",
+            debug_pod_name,
+            workload_kind,
+            workload_name,
+            image,
+        )
+        debug_manifest = await build_debug_pod_manifest(
             namespace,
             workload_kind,
-            workloadName,
+            workload_name,
             debug_pod_name,
-            target_image,
+            image,
         )
-        apply_debug_pod(debug_manifest)
+        await apply_debug_pod(debug_manifest)
+        agent_pod = AgentPod(namespace, debug_pod_name)
+        try:
+            await wait_for_pod_running(namespace, debug_pod_name, timeout_seconds=90)
+        except BaseException:
+            await delete_debug_pod(namespace, debug_pod_name)
+            raise
 
-        wait_for_pod_running(namespace, debug_pod_name, timeout_seconds=90)
-        debug_pod_created = True
+    try:
+        if pod_pool is not None:
+            agent_pod.jar_sha256 = await asyncio.to_thread(pod_pool.agent_jar_sha256)
+        if agent_pod.lease is not None and agent_pod.lease.jar_sha256 == agent_pod.jar_sha256:
+            logger.debug("Agent jar already in debug pod %s (sha256 %s)", agent_pod.pod_name, agent_pod.jar_sha256)
+        else:
+            logger.debug("Copying agent jar to debug pod %s", agent_pod.pod_name)
+            await run_oc_async(["cp", SPRING_CONFIG_AGENT_JAR_PATH, f"{namespace}/{agent_pod.pod_name}:{DEBUG_AGENT_JAR_PATH}"])
+    except BaseException:
+        await release_agent_pod(agent_pod, False)
+        raise
+    return agent_pod
 
-        debug_jar_path = "/tmp/spring-config-agent.jar"
-        debug_output_path = "/tmp/spring-config.json"
-        logger.debug("Copying agent jar to debug pod %s", debug_pod_name)
-        run_oc(["cp", SPRING_CONFIG_AGENT_JAR_PATH, f"{namespace}/{debug_pod_name}:{debug_jar_path}"])
 
-        logger.info("Executing spring config agent in debug pod %s", debug_pod_name)
-        exec_args = [
-            "exec",
-            "-n",
-            namespace,
-            debug_pod_name,
-            "--",
-            "java",
-            "-jar",
-            debug_jar_path,
-            f"output={debug_output_path}",
-        ]
-        if include_logs:
-            exec_args.append("logLevel=DEBUG")
-        agent_stdout = ""
-        agent_stderr = ""
-        if include_logs:
-            exec_result = run_oc_capture(exec_args, timeout_seconds=60)
-            agent_stdout = truncate_log((exec_result.stdout or "").strip())
-            agent_stderr = truncate_log((exec_result.stderr or "").strip())
-            if exec_result.returncode != 0:
-                logger.error(
-                    "Spring config agent exec failed (code=%s) stdout=%s stderr=%s",
-                    exec_result.returncode,
-                    agent_stdout,
-                    agent_stderr,
-                )
-                raise_structured_error(
-                    500,
-                    "agent_exec_failed",
-                    "Spring config agent failed to execute.",
-                    {
-                        "exitCode": exec_result.returncode,
-                        "stdout": agent_stdout,
-                        "stderr": agent_stderr,
-                    },
-                )
-        else:
-            run_oc(exec_args)
+async def release_agent_pod(agent_pod: AgentPod, reusable: bool):
+    """Returns a leased pod to the pool (reusable only after clean runs) or deletes a one-off pod."""
+    if agent_pod.lease is not None:
+        await get_debug_pod_pool().release(agent_pod.lease, reusable, agent_pod.jar_sha256)
+    else:
+        await delete_debug_pod(agent_pod.namespace, agent_pod.pod_name)
+
+
+def agent_env_override_script(env_overrides: dict) -> str:
+    """sh script that execs its arguments with `env_overrides` set; see exec_spring_config_agent."""
+    assignments = " ".join(shlex.quote(f"{name}={value}") for name, value in env_overrides.items())
+    return f'exec env {assignments} "$@"\n'
+
+
+async def exec_spring_config_agent(agent_pod: AgentPod, workload_name: str, include_logs: bool, env_overrides=None):
+    """Runs the agent once in `agent_pod` and copies its output back.
+
+    Returns (output file, payload, agent stdout, agent stderr). `env_overrides`
+    (see agent_sweep_env_overrides) are set for this run only. They can hold
+    credentials, so they reach the pod as an `sh -s` script on the exec's stdin
+    rather than as arguments, which would land in the exec request URL, the API
+    server audit log and the oc log lines here.
+    """
+    namespace, debug_pod_name = agent_pod.namespace, agent_pod.pod_name
+    # A pod serves many runs; a per-run output file can never hand back another run's result.
+    debug_output_path = f"/tmp/spring-config-{os.urandom(4).hex()}.json"
+    logger.info("Executing spring config agent for %s in debug pod %s", workload_name, debug_pod_name)
+    command = ["java", "-jar", DEBUG_AGENT_JAR_PATH, f"output={debug_output_path}"]
+    if include_logs:
+        command.append("logLevel=DEBUG")
+    env_script = agent_env_override_script(env_overrides) if env_overrides else None
+    if env_script:
+        command = ["sh", "-s", "--", *command]
+    exec_args = ["exec", "-n", namespace, debug_pod_name, *(["-i"] if env_script else []), "--", *command]
+    agent_stdout = ""
+    agent_stderr = ""
+    if include_logs:
+        exec_result = await run_oc_capture_async(exec_args, input_data=env_script, timeout_seconds=60)
+        agent_stdout = truncate_log((exec_result.stdout or "").strip())
+        agent_stderr = truncate_log((exec_result.stderr or "").strip())
+        if exec_result.returncode != 0:
+            logger.error(
+                "Spring config agent exec failed (code=%s) stdout=%s stderr=%s",
+                exec_result.returncode,
+                agent_stdout,
+                agent_stderr,
+            )
+            raise_structured_error(
+                500,
+                "agent_exec_failed",
+                "Spring config agent failed to execute.",
+                {
+                    "exitCode": exec_result.returncode,
+                    "stdout": agent_stdout,
+                    "stderr": agent_stderr,
+                },
+            )
+    else:
+        await run_oc_async(exec_args, input_data=env_script)
 
-        os.makedirs(SPRING_CONFIG_AGENT_OUTPUT_DIR, exist_ok=True)
-        safe_workload = re.sub(r"[^a-zA-Z0-9_.-]+", "_", workloadName)
-        output_file = os.path.join(
-            SPRING_CONFIG_AGENT_OUTPUT_DIR,
-            f"{namespace}-{safe_workload}-spring-config.json",
-        )
-        logger.debug("Copying agent output to %s", output_file)
-        run_oc(["cp", f"{namespace}/{debug_pod_name}:{debug_output_path}", output_file])
+    os.makedirs(SPRING_CONFIG_AGENT_OUTPUT_DIR, exist_ok=True)
+    safe_workload = re.sub(r"[^a-zA-Z0-9_.-]+", "_", workload_name)
+    output_file = os.path.join(
+        SPRING_CONFIG_AGENT_OUTPUT_DIR,
+        f"{namespace}-{safe_workload}-spring-config.json",
+    )
+    logger.debug("Copying agent output to %s", output_file)
+    await run_oc_async(["cp", f"{namespace}/{debug_pod_name}:{debug_output_path}", output_file])
+    output_payload = await asyncio.to_thread(load_agent_output, output_file)
+    return output_file, output_payload, agent_stdout, agent_stderr
+
+
+async def cache_agent_output(cache_key: str, output_payload):
+    if CACHE_TTL_SECONDS > 0:
         try:
-            with open(output_file, "r") as f:
-                output_payload = json.load(f)
+            await asyncio.to_thread(write_agent_cache, cache_key, output_payload)
         except Exception as exc:
-            logger.warning("Failed to parse agent output as JSON: %s", str(exc))
-            with open(output_file, "r") as f:
-                output_payload = f.read()
-        if CACHE_TTL_SECONDS > 0:
-            try:
-                cache_payload = output_payload
-                if not isinstance(cache_payload, str):
-                    cache_payload = json.dumps(cache_payload)
-                redis_client = get_redis_client()
-                if redis_client is not None:
-                    redis_client.setex(cache_key, CACHE_TTL_SECONDS, cache_payload.encode("utf-8"))
-                    logger.debug("Spring config agent cache write (redis) %s", cache_key)
-                else:
-                    _actuator_cache[cache_key] = (time.time() + CACHE_TTL_SECONDS, cache_payload)
-                    logger.debug("Spring config agent cache write (memory) %s", cache_key)
-            except Exception as exc:
-                logger.warning("Spring config agent cache write failed: %s", str(exc))
+            logger.warning("Spring config agent cache write failed: %s", str(exc))
+
+
+async def run_spring_config_agent(namespace: str, workloadName: str, workload_kind: Optional[str], include_logs: bool):
+    """Runs the agent against one workload in a debug pod and returns the API response."""
+    cached_response = await read_cached_agent_response(namespace, workloadName, workload_kind)
+    if cached_response is not None:
+        return cached_response
+    cache_key = f"spring-config-agent:{namespace}:{workloadName}"
+    workload_kind, workload, target_image = await resolve_agent_target(namespace, workloadName, workload_kind)
+
+    agent_pod = await acquire_agent_pod(namespace, workload_kind, workloadName, workload, target_image)
+    run_succeeded = False
+    try:
+        output_file, output_payload, agent_stdout, agent_stderr = await exec_spring_config_agent(
+            agent_pod,
+            workloadName,
+            include_logs,
+        )
+        await cache_agent_output(cache_key, output_payload)
+        run_succeeded = True
     finally:
-        if debug_pod_created:
-            run_oc_allow_timeout(
-                ["delete", "pod", debug_pod_name, "-n", namespace, "--ignore-not-found=true"],
-                timeout_seconds=10,
-            )
+        await release_agent_pod(agent_pod, run_succeeded)
 
     return {
         "success": True,
@@ -2136,7 +6051,8 @@ async def apply_spring_config_agent(
         "namespace": namespace,
         "workloadName": workloadName,
         "workloadKind": workload_kind,
-        "debugPod": debug_pod_name,
+        "debugPod": agent_pod.pod_name,
+        "debugPodReused": agent_pod.reused,
         "outputFile": output_file,
         "cacheKey": cache_key,
         "payload": output_payload,
@@ -2144,6 +6060,953 @@ async def apply_spring_config_agent(
     }
 
 
+AGENT_JOB_ACTIVE_STATUSES = ("queued", "running")
+AGENT_JOB_POLL_SECONDS = 2.0
+AGENT_JOB_HEARTBEAT_SECONDS = 5
+# A running job whose runner has not heartbeated for this long is handed to another runner.
+AGENT_JOB_STALE_SECONDS = 30
+AGENT_JOB_MAX_ATTEMPTS = 2
+
+
+def new_agent_job(namespace: str, workload_name: str, workload_kind: Optional[str], image: str, include_logs: bool):
+    return {
+        "jobId": os.urandom(12).hex(),
+        "status": "queued",
+        "namespace": namespace,
+        "workloadName": workload_name,
+        "workloadKind": workload_kind,
+        "image": image,
+        "includeLogs": include_logs,
+        "dedupeKey": f"{namespace}/{workload_name}@{image}",
+        "submittedAt": time.time(),
+        "startedAt": None,
+        "finishedAt": None,
+        "heartbeatAt": None,
+        "owner": None,
+        "attempts": 0,
+        "cancelRequested": False,
+        "error": None,
+        "result": None,
+    }
+
+
+def new_agent_sweep_slot(namespace: str, group, include_logs: bool):
+    """Job record that holds a concurrency slot for one sweep group's debug pod.
+
+    It is never queued: the sweep claims it straight into a free slot (see
+    plan_agent_job_claim), heartbeats it while the pod is in use and finishes it
+    after, so sweeps and queued jobs share the same limits.
+    """
+    pod_workload = group[0]
+    job = new_agent_job(namespace, pod_workload["name"], pod_workload.get("kind"), pod_workload["image"], include_logs)
+    job.update(sweep=True, sweepWorkloads=[workload["name"] for workload in group], dedupeKey=f"sweep/{job['jobId']}")
+    return job
+
+
+def agent_job_owner():
+    return f"{os.uname().nodename}:{os.getpid()}"
+
+
+def finish_agent_job_record(job, status: str, now: float, result=None, error=None):
+    job.update(status=status, finishedAt=now, owner=None, result=result, error=error)
+
+
+def plan_agent_job_claim(queued, running, owner: str, now: float, reserve=None):
+    """Picks the next queued job that fits the concurrency limits and settles stale running jobs.
+
+    `queued` is in submit order and `running` holds every job with a slot. Returns
+    (claimed job or None, every job that changed), for the store to persist in the
+    same transaction. A stale job is requeued until it has used its attempts.
+
+    With `reserve` (a sweep slot, see new_agent_sweep_slot) no queued job is
+    claimed; the reserve record takes a slot itself, but only one that the
+    queued jobs, in order, would leave free. A stale sweep slot is never requeued.
+    """
+    changed = {}
+    active = []
+    for job in running:
+        if now - (job.get("heartbeatAt") or 0) <= AGENT_JOB_STALE_SECONDS:
+            active.append(job)
+            continue
+        if job.get("cancelRequested"):
+            finish_agent_job_record(job, "cancelled", now)
+        elif job.get("sweep") or job.get("attempts", 0) >= AGENT_JOB_MAX_ATTEMPTS:
+            logger.warning("Agent job %s lost its runner %s; giving up", job["jobId"], job.get("owner"))
+            finish_agent_job_record(
+                job,
+                "failed",
+                now,
+                error={
+                    "status": 500,
+                    "detail": {"error": "agent_job_lost", "message": "The backend running this job stopped responding."},
+                },
+            )
+        else:
+            logger.warning("Agent job %s lost its runner %s; requeueing", job["jobId"], job.get("owner"))
+            job.update(status="queued", owner=None, heartbeatAt=None)
+            queued = [job] + list(queued)
+        changed[job["jobId"]] = job
+
+    free_slots = AGENT_JOB_CONCURRENCY - len(active)
+    per_namespace = collections.Counter(job["namespace"] for job in active)
+
+    def fits(job):
+        return free_slots > 0 and per_namespace[job["namespace"]] < AGENT_JOB_NAMESPACE_CONCURRENCY
+
+    claimed = None
+    if reserve is None:
+        claimed = next((job for job in queued if fits(job)), None)
+    else:
+        for job in queued:
+            if fits(job):
+                free_slots -= 1
+                per_namespace[job["namespace"]] += 1
+        if fits(reserve):
+            claimed = reserve
+    if claimed is not None:
+        claimed.update(status="running", owner=owner, startedAt=now, heartbeatAt=now, attempts=claimed.get("attempts", 0) + 1)
+        changed[claimed["jobId"]] = claimed
+    return claimed, list(changed.values())
+
+
+class AgentJobLocalStore:
+    """Agent job state shared by the uvicorn workers on this pod, used when Redis is not configured.
+
+    Same SQLite-on-/dev/shm approach as LocalSharedCache. Every mutation runs in a
+    BEGIN IMMEDIATE transaction, which serializes submit dedupe and slot claims
+    across workers.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+        conn = self.connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, dedupe_key TEXT NOT NULL, status TEXT NOT NULL, "
+            "submitted_at REAL NOT NULL, expires_at REAL, record TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, submitted_at)")
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=OFF")
+            self.local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def load(self, conn, job_id: str):
+        row = conn.execute(
+            "SELECT record FROM jobs WHERE id = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (job_id, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, conn, job):
+        expires_at = job["finishedAt"] + AGENT_JOB_TTL_SECONDS if job["finishedAt"] else None
+        conn.execute(
+            "INSERT OR REPLACE INTO jobs (id, dedupe_key, status, submitted_at, expires_at, record) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (job["jobId"], job["dedupeKey"], job["status"], job["submittedAt"], expires_at, json.dumps(job)),
+        )
+
+    def get(self, job_id: str):
+        return self.load(self.connection(), job_id)
+
+    def submit(self, job):
+        """Returns (job, deduplicated); the job is None when the queue is full."""
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT record FROM jobs WHERE dedupe_key = ? AND status IN ('queued', 'running')",
+                (job["dedupeKey"],),
+            ).fetchone()
+            if row:
+                return json.loads(row[0]), True
+            queued = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            if queued >= AGENT_JOB_MAX_QUEUED:
+                return None, False
+            self.save(conn, job)
+            return job, False
+
+    def claim(self, owner: str, reserve=None):
+        with self.transaction() as conn:
+            now = time.time()
+            conn.execute("DELETE FROM jobs WHERE expires_at <= ?", (now,))
+            queued = [
+                json.loads(row[0])
+                for row in conn.execute("SELECT record FROM jobs WHERE status = 'queued' ORDER BY submitted_at")
+            ]
+            running = [json.loads(row[0]) for row in conn.execute("SELECT record FROM jobs WHERE status = 'running'")]
+            claimed, changed = plan_agent_job_claim(queued, running, owner, now, reserve)
+            for job in changed:
+                self.save(conn, job)
+            return claimed
+
+    def heartbeat(self, job_id: str, owner: str):
+        """Returns True when the runner should stop: the job was cancelled or taken over."""
+        with self.transaction() as conn:
+            job = self.load(conn, job_id)
+            if job is None or job["status"] != "running" or job["owner"] != owner:
+                return True
+            job["heartbeatAt"] = time.time()
+            self.save(conn, job)
+            return job["cancelRequested"]
+
+    def finish(self, job_id: str, owner: str, status: str, result=None, error=None):
+        with self.transaction() as conn:
+            job = self.load(conn, job_id)
+            if job is None or job["status"] != "running" or job["owner"] != owner:
+                logger.warning("Agent job %s was taken over; dropping this runner's %s outcome", job_id, status)
+                return
+            finish_agent_job_record(job, status, time.time(), result, error)
+            self.save(conn, job)
+
+    def cancel(self, job_id: str):
+        """Returns (job, cancelled now); a running job only gets a request its runner acts on."""
+        with self.transaction() as conn:
+            job = self.load(conn, job_id)
+            if job is None or job["status"] not in AGENT_JOB_ACTIVE_STATUSES:
+                return job, False
+            if job["status"] == "queued":
+                finish_agent_job_record(job, "cancelled", time.time())
+            else:
+                job["cancelRequested"] = True
+            self.save(conn, job)
+            return job, job["status"] == "cancelled"
+
+
+class AgentJobRedisStore:
+    """Agent job state in Redis, so any worker on any replica can serve status and run jobs.
+
+    Records are JSON under agent-job:<id>, queued ids are a list in submit order,
+    running ids a set, and agent-job-dedupe:<namespace>/<workload>@<image> points
+    at the active job. Mutations run under a short redis-py lock, which keeps
+    dedupe and slot accounting consistent across replicas. Finished records expire
+    after AGENT_JOB_TTL_SECONDS.
+    """
+
+    QUEUE_KEY = "agent-jobs:queue"
+    RUNNING_KEY = "agent-jobs:running"
+    LOCK_KEY = "agent-jobs:lock"
+
+    def __init__(self, client):
+        self.client = client
+
+    def transaction(self):
+        return self.client.lock(self.LOCK_KEY, timeout=10, blocking_timeout=5)
+
+    def load_many(self, job_ids):
+        if not job_ids:
+            return []
+        values = self.client.mget([f"agent-job:{job_id}" for job_id in job_ids])
+        return [json.loads(value) for value in values if value]
+
+    def save(self, pipe, job):
+        job_id = job["jobId"]
+        payload = json.dumps(job)
+        status = job["status"]
+        if status == "running":
+            pipe.set(f"agent-job:{job_id}", payload)
+            pipe.lrem(self.QUEUE_KEY, 0, job_id)
+            pipe.sadd(self.RUNNING_KEY, job_id)
+        elif status == "queued":
+            # Only requeued jobs come through here; they go back to the head of the queue.
+            pipe.set(f"agent-job:{job_id}", payload)
+            pipe.srem(self.RUNNING_KEY, job_id)
+            pipe.lrem(self.QUEUE_KEY, 0, job_id)
+            pipe.lpush(self.QUEUE_KEY, job_id)
+        else:
+            pipe.setex(f"agent-job:{job_id}", AGENT_JOB_TTL_SECONDS, payload)
+            pipe.lrem(self.QUEUE_KEY, 0, job_id)
+            pipe.srem(self.RUNNING_KEY, job_id)
+            dedupe_key = f"agent-job-dedupe:{job['dedupeKey']}"
+            if self.client.get(dedupe_key) == job_id.encode("utf-8"):
+                pipe.delete(dedupe_key)
+
+    def get(self, job_id: str):
+        value = self.client.get(f"agent-job:{job_id}")
+        return json.loads(value) if value else None
+
+    def submit(self, job):
+        with self.transaction():
+            dedupe_key = f"agent-job-dedupe:{job['dedupeKey']}"
+            active_id = self.client.get(dedupe_key)
+            if active_id:
+                active = self.get(active_id.decode("utf-8"))
+                if active and active["status"] in AGENT_JOB_ACTIVE_STATUSES:
+                    return active, True
+            if self.client.llen(self.QUEUE_KEY) >= AGENT_JOB_MAX_QUEUED:
+                return None, False
+            pipe = self.client.pipeline()
+            pipe.set(f"agent-job:{job['jobId']}", json.dumps(job))
+            pipe.rpush(self.QUEUE_KEY, job["jobId"])
+            pipe.set(dedupe_key, job["jobId"])
+            pipe.execute()
+            return job, False
+
+    def claim(self, owner: str, reserve=None):
+        with self.transaction():
+            queued_ids = [job_id.decode("utf-8") for job_id in self.client.lrange(self.QUEUE_KEY, 0, -1)]
+            running_ids = [job_id.decode("utf-8") for job_id in self.client.smembers(self.RUNNING_KEY)]
+            queued = self.load_many(queued_ids)
+            running = self.load_many(running_ids)
+            pipe = self.client.pipeline()
+            # Ids whose record is gone (flushed or evicted) would otherwise hold a slot forever.
+            for job_id in set(queued_ids) - {job["jobId"] for job in queued}:
+                pipe.lrem(self.QUEUE_KEY, 0, job_id)
+            for job_id in set(running_ids) - {job["jobId"] for job in running}:
+                pipe.srem(self.RUNNING_KEY, job_id)
+            claimed, changed = plan_agent_job_claim(queued, running, owner, time.time(), reserve)
+            for job in changed:
+                self.save(pipe, job)
+            pipe.execute()
+            return claimed
+
+    def heartbeat(self, job_id: str, owner: str):
+        with self.transaction():
+            job = self.get(job_id)
+            if job is None or job["status"] != "running" or job["owner"] != owner:
+                return True
+            job["heartbeatAt"] = time.time()
+            self.client.set(f"agent-job:{job_id}", json.dumps(job))
+            return job["cancelRequested"]
+
+    def finish(self, job_id: str, owner: str, status: str, result=None, error=None):
+        with self.transaction():
+            job = self.get(job_id)
+            if job is None or job["status"] != "running" or job["owner"] != owner:
+                logger.warning("Agent job %s was taken over; dropping this runner's %s outcome", job_id, status)
+                return
+            finish_agent_job_record(job, status, time.time(), result, error)
+            pipe = self.client.pipeline()
+            self.save(pipe, job)
+            pipe.execute()
+
+    def cancel(self, job_id: str):
+        with self.transaction():
+            job = self.get(job_id)
+            if job is None or job["status"] not in AGENT_JOB_ACTIVE_STATUSES:
+                return job, False
+            pipe = self.client.pipeline()
+            if job["status"] == "queued":
+                finish_agent_job_record(job, "cancelled", time.time())
+                self.save(pipe, job)
+            else:
+                job["cancelRequested"] = True
+                pipe.set(f"agent-job:{job_id}", json.dumps(job))
+            pipe.execute()
+            return job, job["status"] == "cancelled"
+
+
+class AgentJobRunner:
+    """Claims agent jobs from the shared store and runs them in this worker.
+
+    Every worker polls the store, and is woken early when it takes a submit
+    itself. The store's claim enforces AGENT_JOB_CONCURRENCY and
+    AGENT_JOB_NAMESPACE_CONCURRENCY, so the limits hold across workers and
+    replicas. Running jobs heartbeat, which is also how a cancel reaches them.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.owner = agent_job_owner()
+        self.wakeup = asyncio.Event()
+        self.tasks = {}
+        self.dispatch_task = None
+
+    def start(self):
+        if self.dispatch_task is None or self.dispatch_task.done():
+            self.dispatch_task = asyncio.create_task(self.dispatch())
+
+    async def stop(self):
+        tasks = [task for task in (self.dispatch_task, *self.tasks.values()) if task is not None]
+        self.dispatch_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def notify(self):
+        self.wakeup.set()
+
+    async def dispatch(self):
+        while True:
+            self.wakeup.clear()
+            try:
+                while True:
+                    job = await asyncio.to_thread(self.store.claim, self.owner)
+                    if job is None:
+                        break
+                    AGENT_JOB_QUEUE_SECONDS.observe(max(0.0, job["startedAt"] - job["submittedAt"]))
+                    logger.info(
+                        "Running agent job %s for %s/%s (attempt %s)",
+                        job["jobId"],
+                        job["namespace"],
+                        job["workloadName"],
+                        job["attempts"],
+                    )
+                    self.tasks[job["jobId"]] = asyncio.create_task(self.execute(job))
+            except Exception as exc:
+                logger.warning("Agent job claim failed: %s", str(exc))
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), AGENT_JOB_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def execute(self, job):
+        job_id = job["jobId"]
+        run = asyncio.create_task(
+            run_spring_config_agent(job["namespace"], job["workloadName"], job["workloadKind"], job["includeLogs"])
+        )
+        status, result, error = "succeeded", None, None
+        cancel_sent = False
+        try:
+            while not run.done():
+                await asyncio.wait({run}, timeout=AGENT_JOB_HEARTBEAT_SECONDS)
+                if run.done():
+                    break
+                try:
+                    stop = await asyncio.to_thread(self.store.heartbeat, job_id, self.owner)
+                except Exception as exc:
+                    logger.warning("Agent job %s heartbeat failed: %s", job_id, str(exc))
+                    continue
+                if stop and not cancel_sent:
+                    logger.info("Cancelling agent job %s", job_id)
+                    cancel_sent = True
+                    run.cancel()
+        except asyncio.CancelledError:
+            # Worker shutdown: stop the run, whose finally releases or deletes its debug
+            # pod, and leave the job to go stale so another runner picks it up.
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+            raise
+        finally:
+            self.tasks.pop(job_id, None)
+        try:
+            result = run.result()
+        except asyncio.CancelledError:
+            status = "cancelled"
+        except HTTPException as exc:
+            status, error = "failed", {"status": exc.status_code, "detail": exc.detail}
+        except Exception as exc:
+            logger.error("Agent job %s failed: %s", job_id, str(exc))
+            status, error = "failed", {"status": 500, "detail": f"Spring config agent failed: {str(exc)}"}
+        AGENT_JOBS_TOTAL.labels(status).inc()
+        try:
+            await asyncio.to_thread(self.store.finish, job_id, self.owner, status, result, error)
+        except Exception as exc:
+            logger.warning("Agent job %s outcome not recorded: %s", job_id, str(exc))
+        self.notify()
+
+
+_agent_job_store = None
+_agent_job_store_lock = threading.Lock()
+_agent_job_runner = None
+
+
+def get_agent_job_store():
+    global _agent_job_store
+    if _agent_job_store is None:
+        with _agent_job_store_lock:
+            if _agent_job_store is None:
+                redis_client = get_redis_client()
+                if redis_client is not None:
+                    _agent_job_store = AgentJobRedisStore(redis_client)
+                else:
+                    _agent_job_store = AgentJobLocalStore(AGENT_JOB_DB_PATH)
+    return _agent_job_store
+
+
+async def call_agent_job_store(method: str, *args):
+    try:
+        store = await asyncio.to_thread(get_agent_job_store)
+        return await asyncio.to_thread(getattr(store, method), *args)
+    except (redis.RedisError, sqlite3.Error) as exc:
+        logger.error("Agent job store %s failed: %s", method, str(exc))
+        raise_structured_error(503, "agent_job_store_unavailable", f"Agent job store unavailable: {str(exc)}")
+
+
+@app.on_event("startup")
+async def start_agent_job_runner():
+    global _agent_job_runner
+    if SPRING_CONFIG_AGENT_ENABLED and _agent_job_runner is None:
+        try:
+            store = await asyncio.to_thread(get_agent_job_store)
+        except sqlite3.Error as exc:
+            logger.error("Agent job store unavailable at %s; not running agent jobs: %s", AGENT_JOB_DB_PATH, str(exc))
+            return
+        _agent_job_runner = AgentJobRunner(store)
+        _agent_job_runner.start()
+
+
+@app.on_event("shutdown")
+async def stop_agent_job_runner():
+    global _agent_job_runner
+    if _agent_job_runner is not None:
+        runner, _agent_job_runner = _agent_job_runner, None
+        await runner.stop()
+
+
+async def submit_agent_job(namespace: str, workload_name: str, request: Optional[ApplySpringConfigAgentRequest]):
+    """Queues an agent run, or joins the active job for the same namespace, workload and image."""
+    require_spring_config_agent()
+    workload_kind, _, target_image = await resolve_agent_target(
+        namespace,
+        workload_name,
+        request.workloadKind if request else None,
+    )
+    include_logs = bool(request.includeLogs) if request else False
+    job, deduplicated = await call_agent_job_store(
+        "submit",
+        new_agent_job(namespace, workload_name, workload_kind, target_image, include_logs),
+    )
+    if job is None:
+        raise_structured_error(
+            429,
+            "agent_job_queue_full",
+            f"Too many queued spring config agent jobs (limit {AGENT_JOB_MAX_QUEUED}); try again later.",
+        )
+    AGENT_JOBS_TOTAL.labels("deduplicated" if deduplicated else "submitted").inc()
+    if deduplicated:
+        logger.info("Joined %s agent job %s for %s/%s", job["status"], job["jobId"], namespace, workload_name)
+    elif _agent_job_runner is not None:
+        _agent_job_runner.notify()
+    return job, deduplicated
+
+
+async def load_agent_job(job_id: str):
+    job = await call_agent_job_store("get", job_id)
+    if job is None:
+        raise_structured_error(404, "agent_job_not_found", f"Agent job '{job_id}' not found or expired")
+    return job
+
+
+def agent_job_status(job):
+    return {key: value for key, value in job.items() if key not in ("result", "dedupeKey")}
+
+
+def agent_job_result(job):
+    if job["status"] == "succeeded":
+        return {**(job["result"] or {}), "jobId": job["jobId"]}
+    if job["status"] == "failed":
+        error = job.get("error") or {}
+        raise HTTPException(status_code=error.get("status", 500), detail=error.get("detail"))
+    if job["status"] == "cancelled":
+        raise_structured_error(409, "agent_job_cancelled", f"Agent job '{job['jobId']}' was cancelled")
+    raise_structured_error(
+        409,
+        "agent_job_pending",
+        f"Agent job '{job['jobId']}' is still {job['status']}",
+        {"jobId": job["jobId"], "status": job["status"]},
+    )
+
+
+@app.post("/api/config/{namespace}/{workloadName}/apply-spring-config-agent")
+async def apply_spring_config_agent(
+    namespace: str,
+    workloadName: str,
+    http_request: Request,
+    response: Response,
+    request: Optional[ApplySpringConfigAgentRequest] = None,
+):
+    logger.debug(
+        "Spring config agent env enabled=%s jarPath=%s outputDir=%s",
+        SPRING_CONFIG_AGENT_ENABLED,
+        SPRING_CONFIG_AGENT_JAR_PATH,
+        SPRING_CONFIG_AGENT_OUTPUT_DIR,
+    )
+    logger.debug(
+        "Spring config agent request payload workloadKind=%s",
+        request.workloadKind if request else None,
+    )
+    cached_response = await read_cached_agent_response(namespace, workloadName, request.workloadKind if request else None)
+    if cached_response is not None:
+        return cached_response
+    logger.info(
+        "Apply spring config agent requested namespace=%s workload=%s kind=%s",
+        namespace,
+        workloadName,
+        request.workloadKind if request else None,
+    )
+    # Runs through the job queue so concurrent clicks share one run and the debug pod limits hold.
+    # Waits at most AGENT_JOB_WAIT_SECONDS; after that the caller gets 202 and polls the job instead.
+    job, _ = await submit_agent_job(namespace, workloadName, request)
+    deadline = time.monotonic() + AGENT_JOB_WAIT_SECONDS
+    while job["status"] in AGENT_JOB_ACTIVE_STATUSES:
+        if time.monotonic() >= deadline or await http_request.is_disconnected():
+            logger.info(
+                "Stopped waiting for %s agent job %s for %s/%s",
+                job["status"],
+                job["jobId"],
+                namespace,
+                workloadName,
+            )
+            response.status_code = 202
+            return agent_job_status(job)
+        await asyncio.sleep(0.5)
+        job = await load_agent_job(job["jobId"])
+    return agent_job_result(job)
+
+
+@app.post("/api/config/{namespace}/{workloadName}/spring-config-agent/jobs", status_code=202)
+async def submit_spring_config_agent_job(
+    namespace: str,
+    workloadName: str,
+    request: Optional[ApplySpringConfigAgentRequest] = None,
+):
+    job, deduplicated = await submit_agent_job(namespace, workloadName, request)
+    return {**agent_job_status(job), "deduplicated": deduplicated}
+
+
+@app.get("/api/agent-jobs/{job_id}")
+async def get_agent_job(job_id: str):
+    return agent_job_status(await load_agent_job(job_id))
+
+
+@app.get("/api/agent-jobs/{job_id}/result")
+async def get_agent_job_result(job_id: str):
+    return agent_job_result(await load_agent_job(job_id))
+
+
+@app.post("/api/agent-jobs/{job_id}/cancel")
+async def cancel_agent_job(job_id: str):
+    job, cancelled = await call_agent_job_store("cancel", job_id)
+    if job is None:
+        raise_structured_error(404, "agent_job_not_found", f"Agent job '{job_id}' not found or expired")
+    if cancelled:
+        AGENT_JOBS_TOTAL.labels("cancelled").inc()
+    return agent_job_status(job)
+
+
+def agent_sweep_group_key(image: str, workload_resource: dict):
+    """Returns (sweep group key, plain env values of the main container).
+
+    Workloads with the same key can share one debug pod: their templates differ
+    at most in the values of the main container's plain `value:` env vars, and
+    the agent is run with each workload's values swapped in (see
+    agent_sweep_env_overrides). Env names, `valueFrom` entries, volumes, sidecars
+    and the rest of the template must match. Template labels and annotations are
+    ignored unless the downward API could expose them, and env that uses
+    `$(VAR)` references is compared as-is.
+    """
+    template = json.loads(json.dumps((workload_resource or {}).get("spec", {}).get("template", {}) or {}))
+    template_text = json.dumps(template)
+    if "downwardAPI" not in template_text and "fieldRef" not in template_text:
+        template.pop("metadata", None)
+    containers = template.get("spec", {}).get("containers") or []
+    plain_env = {}
+    if containers:
+        env = containers[0].get("env") or []
+        if not any("$(" in str(item.get("value", "")) for item in env):
+            for item in env:
+                if "valueFrom" not in item:
+                    plain_env[item.get("name")] = str(item.get("value", ""))
+                    item["value"] = ""
+    key = hashlib.blake2b(
+        f"{image}\0{json.dumps(template, sort_keys=True)}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return key, plain_env
+
+
+def agent_sweep_env_overrides(pod_env: dict, workload_env: dict):
+    """The plain env values where a workload differs from the pod's own workload."""
+    return {name: value for name, value in workload_env.items() if pod_env.get(name) != value}
+
+
+def agent_sweep_error(exc: Exception):
+    if isinstance(exc, HTTPException):
+        return {"status": exc.status_code, "detail": exc.detail}
+    return {"status": 500, "detail": f"Spring config agent failed: {str(exc)}"}
+
+
+async def acquire_agent_sweep_slot(namespace: str, group, include_logs: bool):
+    """Claims a job slot for a sweep group, polling until queued jobs leave one free.
+
+    Gives up after AGENT_JOB_WAIT_SECONDS and returns None.
+    """
+    slot = new_agent_sweep_slot(namespace, group, include_logs)
+    owner = agent_job_owner()
+    deadline = time.monotonic() + AGENT_JOB_WAIT_SECONDS
+    while True:
+        claimed = await call_agent_job_store("claim", owner, slot)
+        if claimed is not None:
+            return claimed
+        if time.monotonic() >= deadline:
+            return None
+        await asyncio.sleep(min(AGENT_JOB_POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+
+
+async def run_agent_sweep_group(namespace: str, group, include_logs: bool, pod_slots, frames):
+    """Runs the agent for one sweep group on a single debug pod, putting a frame per workload on `frames`.
+
+    The pod runs under a job slot from the shared store (acquire_agent_sweep_slot),
+    heartbeated like a job and finished when the group is done; if no slot frees
+    up within AGENT_JOB_WAIT_SECONDS the group's workloads are reported as
+    errors, and if the store takes the slot back, the group's remaining runs
+    are cancelled. The first
+    workload's template builds the pod. Up to AGENT_SWEEP_POD_PARALLELISM agent
+    runs share it at once; a pooled pod's lease is renewed before each run. The
+    pod goes back to the pool only if every run on it succeeded.
+    """
+    pod_workload = group[0]
+    reported = set()
+
+    async def report(frame):
+        reported.add(frame["workload"]["name"])
+        await frames.put(frame)
+
+    async with pod_slots:
+        try:
+            slot = await acquire_agent_sweep_slot(namespace, group, include_logs)
+        except Exception as exc:
+            logger.warning("Agent sweep slot for %s/%s failed: %s", namespace, pod_workload["name"], str(exc))
+            for workload in group:
+                await report({"workload": workload, "error": agent_sweep_error(exc)})
+            return
+        if slot is None:
+            logger.warning("Agent sweep slot for %s/%s timed out", namespace, pod_workload["name"])
+            for workload in group:
+                await report({"workload": workload, "error": {"status": 503, "detail": {
+                    "error": "agent_sweep_slot_timeout",
+                    "message": f"No agent job slot freed up within {AGENT_JOB_WAIT_SECONDS}s.",
+                }}})
+            return
+        store = get_agent_job_store()
+        work = asyncio.ensure_future(run_agent_sweep_pod(namespace, group, include_logs, report))
+        slot_lost = False
+        try:
+            while not work.done():
+                await asyncio.wait({work}, timeout=AGENT_JOB_HEARTBEAT_SECONDS)
+                if work.done():
+                    break
+                try:
+                    slot_lost = await asyncio.to_thread(store.heartbeat, slot["jobId"], slot["owner"])
+                except Exception as exc:
+                    logger.warning("Agent sweep slot %s heartbeat failed: %s", slot["jobId"], str(exc))
+                    continue
+                if slot_lost:
+                    logger.warning("Agent sweep slot %s was taken back; stopping its runs", slot["jobId"])
+                    work.cancel()
+        finally:
+            if not work.done():
+                work.cancel()
+            outcome = (await asyncio.gather(work, return_exceptions=True))[0]
+            if isinstance(outcome, BaseException):
+                status = "cancelled" if isinstance(outcome, asyncio.CancelledError) else "failed"
+            else:
+                status = "succeeded" if outcome else "failed"
+            try:
+                await asyncio.to_thread(store.finish, slot["jobId"], slot["owner"], status)
+            except Exception as exc:
+                logger.warning("Agent sweep slot %s not released: %s", slot["jobId"], str(exc))
+        if slot_lost:
+            for workload in group:
+                if workload["name"] not in reported:
+                    await report({"workload": workload, "error": {"status": 409, "detail": {
+                        "error": "agent_sweep_slot_lost",
+                        "message": "The sweep lost its agent job slot before this workload ran.",
+                    }}})
+
+
+async def run_agent_sweep_pod(namespace: str, group, include_logs: bool, report):
+    """The debug pod part of run_agent_sweep_group; returns True if every run succeeded."""
+    pod_workload = group[0]
+    try:
+        agent_pod = await acquire_agent_pod(
+            namespace,
+            pod_workload["kind"],
+            pod_workload["name"],
+            pod_workload["resource"],
+            pod_workload["image"],
+        )
+    except Exception as exc:
+        logger.warning("Agent sweep debug pod for %s/%s failed: %s", namespace, pod_workload["name"], str(exc))
+        for workload in group:
+            await report({"workload": workload, "error": agent_sweep_error(exc)})
+        return False
+
+    pod_pool = get_debug_pod_pool()
+    exec_slots = asyncio.Semaphore(AGENT_SWEEP_POD_PARALLELISM)
+    all_succeeded = True
+
+    async def run_workload(workload):
+        nonlocal all_succeeded
+        frame = {"workload": workload, "agentPod": agent_pod}
+        async with exec_slots:
+            try:
+                if agent_pod.lease is not None:
+                    try:
+                        await pod_pool.renew(agent_pod.lease)
+                    except HTTPException as exc:
+                        logger.warning("Debug pod %s lease renewal failed: %s", agent_pod.pod_name, exc.detail)
+                output_file, output_payload, agent_stdout, agent_stderr = await exec_spring_config_agent(
+                    agent_pod,
+                    workload["name"],
+                    include_logs,
+                    agent_sweep_env_overrides(pod_workload["env"], workload["env"]),
+                )
+                cache_key = f"spring-config-agent:{namespace}:{workload['name']}"
+                await cache_agent_output(cache_key, output_payload)
+                frame["result"] = {
+                    "outputFile": output_file,
+                    "cacheKey": cache_key,
+                    "payload": output_payload,
+                    "agentLogs": {"stdout": agent_stdout, "stderr": agent_stderr} if include_logs else None,
+                }
+            except Exception as exc:
+                all_succeeded = False
+                frame["error"] = agent_sweep_error(exc)
+        await report(frame)
+
+    try:
+        await asyncio.gather(*(run_workload(workload) for workload in group))
+    finally:
+        await release_agent_pod(agent_pod, all_succeeded)
+    return all_succeeded
+
+
+async def stream_agent_sweep(namespace: str, workloads, include_logs: bool, stream_format: str):
+    """Emits sweep frames: one `start`, one `workload` per finished workload, one `summary`.
+
+    Workloads with a cached agent result are answered from the cache. The rest
+    are grouped by agent_sweep_group_key, one debug pod per group. Each pod takes
+    a slot from the agent job store, so sweeps count against AGENT_JOB_CONCURRENCY
+    and AGENT_JOB_NAMESPACE_CONCURRENCY together with queued jobs, and at most
+    AGENT_JOB_NAMESPACE_CONCURRENCY groups of one sweep wait for a slot at once.
+    Pending groups are cancelled, and their pods and slots released, if the
+    consumer stops early.
+    """
+    started = time.monotonic()
+    total = len(workloads)
+    ready_frames = []
+    groups = {}
+    for workload in workloads:
+        cached_response = await read_cached_agent_response(namespace, workload["name"], workload.get("kind"))
+        if cached_response is not None:
+            ready_frames.append({"workload": workload, "cached": True, "result": {
+                "cacheKey": cached_response["cacheKey"],
+                "payload": cached_response["payload"],
+            }})
+            continue
+        resource = get_workload_resource(workload) or {}
+        containers = resource.get("spec", {}).get("template", {}).get("spec", {}).get("containers", []) or []
+        image = containers[0].get("image") if containers else ""
+        if not image:
+            ready_frames.append({"workload": workload, "error": {"status": 500, "detail": {
+                "error": "workload_image_missing",
+                "message": f"Failed to determine image for workload '{workload['name']}'",
+            }}})
+            continue
+        key, env = agent_sweep_group_key(image, resource)
+        groups.setdefault(key, []).append({**workload, "resource": resource, "image": image, "env": env})
+
+    yield encode_report_frame({
+        "type": "start",
+        "namespace": namespace,
+        "totalWorkloads": total,
+        "cachedCount": sum(1 for frame in ready_frames if frame.get("cached")),
+        "debugPods": len(groups),
+        "groups": [
+            {"image": group[0]["image"], "workloads": [workload["name"] for workload in group]}
+            for group in groups.values()
+        ],
+    }, stream_format)
+
+    frames = asyncio.Queue()
+    for frame in ready_frames:
+        frames.put_nowait(frame)
+    pod_slots = asyncio.Semaphore(AGENT_JOB_NAMESPACE_CONCURRENCY)
+
+    async def run_groups():
+        try:
+            outcomes = await asyncio.gather(
+                *(run_agent_sweep_group(namespace, group, include_logs, pod_slots, frames) for group in groups.values()),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    logger.error("Agent sweep group in %s failed: %s", namespace, str(outcome))
+        finally:
+            frames.put_nowait(None)
+
+    runner = asyncio.ensure_future(run_groups())
+    completed = 0
+    error_count = 0
+    try:
+        while True:
+            frame = await frames.get()
+            if frame is None:
+                break
+            completed += 1
+            error_count += 1 if frame.get("error") else 0
+            workload = frame["workload"]
+            agent_pod = frame.get("agentPod")
+            yield encode_report_frame({
+                "type": "workload",
+                "namespace": namespace,
+                "workloadName": workload["name"],
+                "workloadKind": workload.get("kind"),
+                "image": workload.get("image"),
+                "cached": frame.get("cached", False),
+                "debugPod": agent_pod.pod_name if agent_pod else None,
+                "debugPodReused": agent_pod.reused if agent_pod else False,
+                "result": frame.get("result"),
+                "error": frame.get("error"),
+                "completed": completed,
+                "total": total,
+            }, stream_format)
+    finally:
+        if not runner.done():
+            runner.cancel()
+    yield encode_report_frame({
+        "type": "summary",
+        "totalWorkloads": total,
+        "completed": completed,
+        "succeededCount": completed - error_count,
+        "errorCount": error_count,
+        "debugPods": len(groups),
+        "durationMs": int((time.monotonic() - started) * 1000),
+    }, stream_format)
+
+
+@app.post("/api/config/{namespace}/spring-config-agent/sweep")
+async def sweep_spring_config_agent(
+    namespace: str,
+    request: Optional[SpringConfigAgentSweepRequest] = None,
+    streamFormat: str = Query("ndjson", alias="format"),
+):
+    try:
+        stream_format = resolve_stream_format(streamFormat)
+        require_spring_config_agent()
+        workloads = await asyncio.to_thread(list_workloads, namespace)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to start spring config agent sweep: {str(exc)}")
+    workloads = [workload for workload in workloads if workload.get("name")]
+    if request and request.workloadNames:
+        selected = set(request.workloadNames)
+        workloads = [workload for workload in workloads if workload["name"] in selected]
+    workloads.sort(key=lambda item: item["name"])
+    include_logs = bool(request.includeLogs) if request else False
+    logger.info("Spring config agent sweep namespace=%s workloads=%s", namespace, len(workloads))
+    return report_stream_response(stream_agent_sweep(namespace, workloads, include_logs, stream_format), stream_format)
+
+
 if __name__ == "__main__":
     import uvicorn
 